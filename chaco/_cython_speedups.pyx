@@ -9,7 +9,7 @@ cdef extern from *:
     void ifdef_win32 "#ifdef _WIN32"()
 
 cdef extern from "_isnan.h":
-    int isnan (float)
+    int isnan (float) nogil
 
 
 # Inline max and min functions used below
@@ -19,6 +19,21 @@ cdef inline float float_max(float a, float b):
 cdef inline float float_min(float a, float b): 
     return a if a <= b else b
 
+cdef _rgba_buffer(out, shape, int N, dtype):
+    '''Return an (N, 4) view of the output buffer *out*.
+
+    A new array is allocated if *out* is None. Otherwise *out* must be a
+    C-contiguous array of the given dtype and shape, so that results written
+    through the view land in the caller's buffer.
+    '''
+    if out is None:
+        return np.empty((N, 4), dtype)
+    if (out.shape != shape or out.dtype != dtype or
+            not out.flags.c_contiguous):
+        raise ValueError("out must be a C-contiguous %s array of shape %s"
+                         % (np.dtype(dtype).name, shape))
+    return out.reshape((N, 4))
+
 @cython.wraparound(False)
 @cython.boundscheck(False)
 @cython.cdivision(True)
@@ -30,11 +45,14 @@ def map_colors(
         np.ndarray[np.float32_t] red_lut not None,
         np.ndarray[np.float32_t] green_lut not None,
         np.ndarray[np.float32_t] blue_lut not None,
-        np.ndarray[np.float32_t] alpha_lut not None
+        np.ndarray[np.float32_t] alpha_lut not None,
+        out=None
         ):
     '''Map colors from color lookup tables to a data array.
 
-    This is used in ColorMapper.map_screen
+    This is used in ColorMapper.map_screen. The GIL is released while the
+    colors are looked up, so chunks of an array may be mapped concurrently
+    from several threads.
 
     Parameters
     ----------
@@ -54,18 +72,23 @@ def map_colors(
         The blue channel lookup table
     alpha_lut : ndarray of float32
         The alpha channel lookup table
+    out : ndarray of float32, optional
+        A C-contiguous array of shape data_array.shape + (4,) to store the
+        result in.
     
     Returns
     -------
     rgba: ndarray of float32
         The rgba values of data_array according to the lookup tables. The shape
-        of this array is equal to data_array.shape + (4,).
+        of this array is equal to data_array.shape + (4,). If *out* is given,
+        it is returned.
 
     '''
     shape = data_array.shape + (4,)
     cdef int i, idx, N = data_array.size
     cdef float norm_value, range_diff, red, green, blue, alpha
-    cdef np.ndarray[np.float32_t, ndim=2] rgba = np.empty((N,4), np.float32)
+    cdef np.ndarray[np.float32_t, ndim=2] rgba = _rgba_buffer(
+        out, shape, N, np.float32)
 
     range_diff = high - low
 
@@ -78,39 +101,41 @@ def map_colors(
         green = green_lut[idx]
         blue = blue_lut[idx]
         alpha = alpha_lut[idx]
-        for i in range(N):
-            rgba[i,0] = red
-            rgba[i,1] = green
-            rgba[i,2] = blue
-            rgba[i,3] = alpha
-        return rgba.reshape(shape)
+        with nogil:
+            for i in range(N):
+                rgba[i,0] = red
+                rgba[i,1] = green
+                rgba[i,2] = blue
+                rgba[i,3] = alpha
+        return rgba.reshape(shape) if out is None else out
 
     # Copy the data into a float32 array so we can use fast iteration. We use
     # part of the rgba array for this to save memory.
     cdef np.ndarray[np.float32_t] norm_data = rgba[:,0]
-    norm_data[:] = data_array.flat
+    norm_data[:] = np.ravel(data_array)
 
-    for i in range(N):
-        if isnan(norm_data[i]):
-            rgba[i,0] = 0
-            rgba[i,1] = 0
-            rgba[i,2] = 0
-            rgba[i,3] = 0
-        else:
-            norm_value = (norm_data[i] - low) / range_diff
-            if norm_value > 1:
-                idx = steps - 1
-            elif norm_value < 0:
-                idx = 0
+    with nogil:
+        for i in range(N):
+            if isnan(norm_data[i]):
+                rgba[i,0] = 0
+                rgba[i,1] = 0
+                rgba[i,2] = 0
+                rgba[i,3] = 0
             else:
-                idx = <int> ((steps - 1) * norm_value)
+                norm_value = (norm_data[i] - low) / range_diff
+                if norm_value > 1:
+                    idx = steps - 1
+                elif norm_value < 0:
+                    idx = 0
+                else:
+                    idx = <int> ((steps - 1) * norm_value)
 
-            rgba[i,0] = red_lut[idx]
-            rgba[i,1] = green_lut[idx]
-            rgba[i,2] = blue_lut[idx]
-            rgba[i,3] = alpha_lut[idx]
+                rgba[i,0] = red_lut[idx]
+                rgba[i,1] = green_lut[idx]
+                rgba[i,2] = blue_lut[idx]
+                rgba[i,3] = alpha_lut[idx]
 
-    return rgba.reshape(shape)
+    return rgba.reshape(shape) if out is None else out
 
 @cython.wraparound(False)
 @cython.boundscheck(False)
@@ -122,11 +147,16 @@ def map_colors_uint8(data_array not None,
                np.ndarray[np.uint8_t] red_lut not None,
                np.ndarray[np.uint8_t] green_lut not None,
                np.ndarray[np.uint8_t] blue_lut not None,
-               np.ndarray[np.uint8_t] alpha_lut not None
+               np.ndarray[np.uint8_t] alpha_lut not None,
+               out=None
                ):
     '''
     Map colors from color lookup tables to a data array.
 
+    This is used in ColorMapper.map_uint8. The GIL is released while the
+    colors are looked up, so chunks of an array may be mapped concurrently
+    from several threads.
+
     Parameters
     ----------
     data_array : ndarray
@@ -145,19 +175,24 @@ def map_colors_uint8(data_array not None,
         The blue channel lookup table
     alpha_lut : ndarray of uint8
         The alpha channel lookup table
+    out : ndarray of uint8, optional
+        A C-contiguous array of shape data_array.shape + (4,) to store the
+        result in.
 
     Returns
     -------
     rgba: ndarray of uint8
         The rgba values of data_array according to the lookup tables. The shape
-        of this array is equal to data_array.shape + (4,).
+        of this array is equal to data_array.shape + (4,). If *out* is given,
+        it is returned.
 
     '''
     shape = data_array.shape + (4,)
     cdef int i, idx, N = data_array.size
     cdef float norm_value, range_diff
     cdef char red, green, blue, alpha
-    cdef np.ndarray[np.uint8_t, ndim=2] rgba = np.empty((N, 4), np.uint8)
+    cdef np.ndarray[np.uint8_t, ndim=2] rgba = _rgba_buffer(
+        out, shape, N, np.uint8)
 
     range_diff = high - low
 
@@ -170,39 +205,41 @@ def map_colors_uint8(data_array not None,
         green = green_lut[idx]
         blue = blue_lut[idx]
         alpha = alpha_lut[idx]
-        for i in range(N):
-            rgba[i, 0] = red
-            rgba[i, 1] = green
-            rgba[i, 2] = blue
-            rgba[i, 3] = alpha
-        return rgba.reshape(shape)
+        with nogil:
+            for i in range(N):
+                rgba[i, 0] = red
+                rgba[i, 1] = green
+                rgba[i, 2] = blue
+                rgba[i, 3] = alpha
+        return rgba.reshape(shape) if out is None else out
 
     # Copy the data into a float32 array so we can use fast iteration.
     cdef np.ndarray[np.float32_t] norm_data = np.empty(N, np.float32)
-    norm_data[:] = data_array.flat
+    norm_data[:] = np.ravel(data_array)
 
-    for i in range(N):
-        if isnan(norm_data[i]):
-            rgba[i, 0] = 0
-            rgba[i, 1] = 0
-            rgba[i, 2] = 0
-            rgba[i, 3] = 0
-        else:
-            # range_diff has already been confirmed as non-zero
-            norm_value = (norm_data[i] - low) / range_diff
-            if norm_value > 1:
-                idx = steps - 1
-            elif norm_value < 0:
-                idx = 0
+    with nogil:
+        for i in range(N):
+            if isnan(norm_data[i]):
+                rgba[i, 0] = 0
+                rgba[i, 1] = 0
+                rgba[i, 2] = 0
+                rgba[i, 3] = 0
             else:
-                idx = <int> ((steps - 1) * norm_value)
-
-            rgba[i, 0] = red_lut[idx]
-            rgba[i, 1] = green_lut[idx]
-            rgba[i, 2] = blue_lut[idx]
-            rgba[i, 3] = alpha_lut[idx]
-
-    return rgba.reshape(shape)
+                # range_diff has already been confirmed as non-zero
+                norm_value = (norm_data[i] - low) / range_diff
+                if norm_value > 1:
+                    idx = steps - 1
+                elif norm_value < 0:
+                    idx = 0
+                else:
+                    idx = <int> ((steps - 1) * norm_value)
+
+                rgba[i, 0] = red_lut[idx]
+                rgba[i, 1] = green_lut[idx]
+                rgba[i, 2] = blue_lut[idx]
+                rgba[i, 3] = alpha_lut[idx]
+
+    return rgba.reshape(shape) if out is None else out
 
 
 @cython.wraparound(False)
@@ -141,7 +141,7 @@ def apply_selection_fade(mapped_image, mask, fade_alpha, fade_background):
 
 
 def map_colors(data_array, steps, low, high, red_lut, green_lut, blue_lut,
-        alpha_lut):
+        alpha_lut, out=None):
     '''Map colors from color lookup tables to a data array.
 
     This is used in ColorMapper.map_screen
@@ -164,12 +164,15 @@ def map_colors(data_array, steps, low, high, red_lut, green_lut, blue_lut,
         The blue channel lookup table
     alpha_lut : ndarray of float32
         The alpha channel lookup table
+    out : ndarray of float32, optional
+        An array of shape data_array.shape + (4,) to store the result in.
     
     Returns
     -------
     rgba: ndarray of float32
         The rgba values of data_array according to the lookup tables. The shape
-        of this array is equal to data_array.shape + (4,).
+        of this array is equal to data_array.shape + (4,). If *out* is given,
+        it is returned.
 
     '''
     range_diff = high - low
@@ -184,7 +187,10 @@ def map_colors(data_array, steps, low, high, red_lut, green_lut, blue_lut,
 
     nanmask = isnan(norm_data)
     norm_data = where(nanmask, 0, (norm_data * (steps-1)).astype(int))
-    rgba = zeros(norm_data.shape+(4,), float32)
+    if out is None:
+        rgba = zeros(norm_data.shape+(4,), float32)
+    else:
+        rgba = out
     rgba[...,0] = where(nanmask, 0, take(red_lut, norm_data))
     rgba[...,1] = where(nanmask, 0, take(green_lut, norm_data))
     rgba[...,2] = where(nanmask, 0, take(blue_lut, norm_data))
@@ -193,7 +199,7 @@ def map_colors(data_array, steps, low, high, red_lut, green_lut, blue_lut,
     return rgba
 
 def map_colors_uint8(data_array, steps, low, high, red_lut, green_lut, blue_lut,
-        alpha_lut):
+        alpha_lut, out=None):
     '''Map colors from color lookup tables to a data array.
 
     This is used in ColorMapper.map_screen
@@ -216,12 +222,15 @@ def map_colors_uint8(data_array, steps, low, high, red_lut, green_lut, blue_lut,
         The blue channel lookup table
     alpha_lut : ndarray of uint8
         The alpha channel lookup table
+    out : ndarray of uint8, optional
+        An array of shape data_array.shape + (4,) to store the result in.
     
     Returns
     -------
     rgba: ndarray of uint8
         The rgba values of data_array according to the lookup tables. The shape
-        of this array is equal to data_array.shape + (4,).
+        of this array is equal to data_array.shape + (4,). If *out* is given,
+        it is returned.
 
     '''
     range_diff = high - low
@@ -236,7 +245,10 @@ def map_colors_uint8(data_array, steps, low, high, red_lut, green_lut, blue_lut,
 
     nanmask = isnan(norm_data)
     norm_data = where(nanmask, 0, (norm_data * (steps-1)).astype('uint8'))
-    rgba = zeros(norm_data.shape+(4,), dtype='uint8')
+    if out is None:
+        rgba = zeros(norm_data.shape+(4,), dtype='uint8')
+    else:
+        rgba = out
     rgba[...,0] = where(nanmask, 0, take(red_lut, norm_data))
     rgba[...,1] = where(nanmask, 0, take(green_lut, norm_data))
     rgba[...,2] = where(nanmask, 0, take(blue_lut, norm_data))
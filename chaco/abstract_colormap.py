@@ -19,13 +19,14 @@ class AbstractColormap(HasTraits):
     # on this mapper for visual output should do a redraw or repaint.
     updated = Event
 
-    def map_screen(self, val):
+    def map_screen(self, val, out=None):
         """
-        map_screen(val) -> color
+        map_screen(val, out=None) -> color
 
         Maps an array of values to an array of colors.  If the input array is
         NxM, the returned array is NxMx3 or NxMx4, depending on the
-        **color_depth** setting.
+        **color_depth** setting.  If *out* is given, the colors are written
+        into it and it is returned.
         """
         raise NotImplementedError()
 
@@ -56,16 +57,21 @@ class AbstractColormap(HasTraits):
         """
         raise NotImplementedError()
 
-    def map_uint8(self, val):
+    def map_uint8(self, val, out=None):
         """
-        map_uint8(val) -> rgb24 or rgba32 color
+        map_uint8(val, out=None) -> rgb24 or rgba32 color
 
         Maps a single value to a single color.  Color is represented as either
         length-3 or length-4 array of rgb(a) uint8 values, depending on the
-        **color_depth** setting.
+        **color_depth** setting.  If *out* is given, the colors are written
+        into it and it is returned; callers use this to reuse an image buffer.
         """
         # default implementation (not efficient)
-        return (self.map_screen(val)*255.0).astype('uint8')
+        rgba = (self.map_screen(val)*255.0).astype('uint8')
+        if out is not None:
+            out[...] = rgba
+            return out
+        return rgba
 
 
 
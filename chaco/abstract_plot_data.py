@@ -1,6 +1,12 @@
 """ Defines the base class for plot data.
 """
-from traits.api import Bool, Event, HasTraits
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from traits.api import Any, Bool, Dict, Event, HasTraits, Int
+
+from abstract_data_source import AbstractDataSource
+from batch_updates import batch_updates
 
 
 class AbstractPlotData(HasTraits):
@@ -30,6 +36,25 @@ class AbstractPlotData(HasTraits):
     # Can consumers (Plots) set selections?
     selectable = Bool(True)
 
+    # Do the consumers (Plots) of this object share a single data source per
+    # name?  Plots sharing a data source also share its bounds and other
+    # caches, and its metadata, such as selections.
+    share_datasources = Bool(False)
+
+    #-------------------------------------------------------------------------
+    # Private traits
+    #-------------------------------------------------------------------------
+
+    # The number of nested batch_updates() blocks being executed.
+    _batch_depth = Int(0)
+
+    # Maps the names changed within the current batch to "added", "removed"
+    # or "changed".
+    _batched_changes = Any
+
+    # Maps names to the data sources shared by the consumers.
+    _shared_datasources = Dict(transient=True)
+
 
     def list_data(self):
         """ Returns a list of valid names to use for get_data().
@@ -95,6 +120,60 @@ class AbstractPlotData(HasTraits):
         """
         raise NotImplementedError
 
+    def get_shared_datasource(self, name, factory):
+        """ Returns the data source shared by the consumers of the data
+        associated with *name*.
+
+        The data source is created by calling *factory* with the data the
+        first time it is requested.  Shared data sources are updated by this
+        object when their data changes, so consumers should not update them
+        (see is_shared_datasource()).
+        """
+        source = self._shared_datasources.get(name)
+        if source is None:
+            source = factory(self.get_data(name))
+            self._shared_datasources[name] = source
+        return source
+
+    def is_shared_datasource(self, name, source):
+        """ Returns whether *source* is the shared data source for *name*.
+        """
+        return (name in self._shared_datasources and
+                self._shared_datasources[name] is source)
+
+    @contextmanager
+    def batch_updates(self):
+        """ Returns a context manager that applies the data updates made
+        within it as a single transaction.
+
+        Subclasses that support it (such as ArrayPlotData) fire a single
+        data_changed event, listing every name changed within the block, when
+        the outermost block exits.  The redraws of plots and the refreshes of
+        data ranges are deferred until then as well (see
+        chaco.batch_updates), so that each data range is refreshed once and
+        each plot is redrawn once::
+
+            with plot_data.batch_updates():
+                for name, values in acquired.items():
+                    plot_data.set_data(name, values)
+        """
+        with batch_updates():
+            if self._batch_depth == 0:
+                self._batched_changes = OrderedDict()
+            self._batch_depth += 1
+            try:
+                yield
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    changes = self._batched_changes
+                    self._batched_changes = None
+                    event = {}
+                    for name, kind in changes.items():
+                        event.setdefault(kind, []).append(name)
+                    if event:
+                        self.data_changed = event
+
     def set_selection(self, name, selection):
         """ Sets the selection on the specified data.
 
@@ -111,6 +190,61 @@ class AbstractPlotData(HasTraits):
         """
         raise NotImplementedError
 
+    #------------------------------------------------------------------------
+    # Event handlers
+    #------------------------------------------------------------------------
+
+    def _data_changed_fired(self, event):
+        """ Updates the shared data sources of the changed names.
+        """
+        if not self._shared_datasources:
+            return
+        for name in event.get("removed", []):
+            self._shared_datasources.pop(name, None)
+        # Refresh the data ranges of the sources once, after all of them
+        # were updated.
+        with batch_updates():
+            for name in event.get("changed", []):
+                source = self._shared_datasources.get(name)
+                if source is not None:
+                    data = self.get_data(name)
+                    if isinstance(data, AbstractDataSource):
+                        # The data source itself was replaced.
+                        del self._shared_datasources[name]
+                    elif source is not data:
+                        source.set_data(data)
+
+    def _share_datasources_changed(self):
+        self._shared_datasources = {}
+
+    #------------------------------------------------------------------------
+    # Protected methods
+    #------------------------------------------------------------------------
+
+    def _notify_data_changed(self, event):
+        """ Fires **data_changed** with *event*, or merges *event* into the
+        event of the current batch.
+        """
+        if self._batch_depth == 0:
+            self.data_changed = event
+            return
+
+        changes = self._batched_changes
+        for name in event.get("removed", []):
+            if changes.get(name) == "added":
+                # The consumers have never seen this name.
+                del changes[name]
+            else:
+                changes[name] = "removed"
+        for name in event.get("added", []):
+            if changes.get(name) == "removed":
+                changes[name] = "changed"
+            else:
+                changes[name] = "added"
+        for name in event.get("changed", []):
+            if name not in changes:
+                changes[name] = "changed"
+
     #------------------------------------------------------------------------
     # Dictionary Interface
     #------------------------------------------------------------------------
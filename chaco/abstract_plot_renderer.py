@@ -1,7 +1,7 @@
 """ Defines a base class for plot renderers.
 """
 # Enthought library imports.
-from traits.api import Enum
+from traits.api import Enum, Int
 
 # Local relative imports
 from plot_component import PlotComponent
@@ -18,6 +18,17 @@ class AbstractPlotRenderer(PlotComponent):
 
     origin = Enum("bottom left", "top left", "bottom right", "top right")
 
+    # The rendering quality to use while plots are panned or zoomed
+    # interactively (see chaco.interaction).  Renderers that support "low"
+    # quality draw faster, coarser versions of themselves during the
+    # interaction, and are redrawn at full quality once it is over.
+    interaction_quality = Enum("full", "low")
+
+    # The level of detail at which the renderer is drawn: 0 draws it at full
+    # detail, and each higher level coarser and faster.  The frame budget
+    # scheduler of its container sets it (see chaco.frame_budget).
+    detail_level = Int(0)
+
     #------------------------------------------------------------------------
     # Override default values of inherited traits PlotComponent
     #------------------------------------------------------------------------
@@ -1,118 +1,209 @@
 """ Defines the publicly accessible items of the Chaco API.
+
+The names are resolved lazily: each one is imported from its defining module
+the first time it is accessed, so that ``import chaco.api`` only pays for the
+parts of Chaco that are actually used.  ``from chaco.api import *`` still
+imports everything.
 """
 # This just imports the key datamodel classes into the top-level package
 # namespace for convenience.
 
-from base import NumericalSequenceTrait, PointTrait, ImageTrait, DimensionTrait, \
-                 SortOrderTrait, bin_search, reverse_map_1d, right_shift, \
-                 left_shift, sort_points, find_runs, arg_find_runs, \
-                 point_line_distance
-
-# Data model
-from abstract_data_source import AbstractDataSource
-from array_data_source import ArrayDataSource
-from grid_data_source import GridDataSource
-from image_data import ImageData
-from multi_array_data_source import MultiArrayDataSource
-from point_data_source import PointDataSource
-from abstract_data_range import AbstractDataRange
-from base_data_range import BaseDataRange
-from data_range_1d import DataRange1D
-from data_range_2d import DataRange2D
-
-# Mappers
-from abstract_mapper import AbstractMapper
-from base_1d_mapper import Base1DMapper
-from grid_mapper import GridMapper
-from log_mapper import LogMapper
-from linear_mapper import LinearMapper
-from color_mapper import ColorMapper, ColorMapTemplate
-from discrete_color_mapper import DiscreteColorMapper
-from transform_color_mapper import TransformColorMapper
-
-# Colormaps and color palettes
-from default_colormaps import *
-from default_colors import *
-
-# Visual components
-from abstract_plot_renderer import AbstractPlotRenderer
-from abstract_overlay import AbstractOverlay
-from base_plot_container import BasePlotContainer
-from base_plot_frame import BasePlotFrame
-from cross_plot_frame import CrossPlotFrame
-from data_view import DataView
-from simple_plot_frame import SimplePlotFrame
-from plot_component import PlotComponent
-from plot_graphics_context import PlotGraphicsContext, PlotGraphicsContextMixin
-from selectable_overlay_container import SelectableOverlayPlotContainer
-from plot_containers import OverlayPlotContainer, HPlotContainer, VPlotContainer, \
-                            GridPlotContainer
-GridContainer = GridPlotContainer
-
-from label import Label
-from plot_label import PlotLabel
-from legend import Legend
-from tooltip import ToolTip
-from data_label import DataLabel
-from lasso_overlay import LassoOverlay
-from color_bar import ColorBar
-from text_box_overlay import TextBoxOverlay
-from scatter_inspector_overlay import ScatterInspectorOverlay
-
-# Renderers
-from barplot import BarPlot
-from base_1d_plot import Base1DPlot
-from base_2d_plot import Base2DPlot
-from base_xy_plot import BaseXYPlot
-from scatterplot import ScatterPlot, render_markers
-from image_plot import ImagePlot
-from cmap_image_plot import CMapImagePlot
-from contour_line_plot import ContourLinePlot
-from contour_poly_plot import ContourPolyPlot
-from lineplot import LinePlot
-from colormapped_scatterplot import ColormappedScatterPlot
-from colormapped_selection_overlay import ColormappedSelectionOverlay
-from polygon_plot import PolygonPlot
-from errorbar_plot import ErrorBarPlot
-from filled_line_plot import FilledLinePlot
-from quiverplot import QuiverPlot
-from candle_plot import CandlePlot
-from multi_line_plot import MultiLinePlot
-from jitterplot import JitterPlot
-from variable_size_scatterplot import VariableSizeScatterPlot
-from horizon_plot import BandedMapper, HorizonPlot
-from scatterplot_1d import ScatterPlot1D
-from line_scatterplot_1d import LineScatterPlot1D
-from text_plot_1d import TextPlot1D
-
-# Plot factories
-from plot_factory import create_bar_plot, create_line_plot, create_scatter_plot, \
-                         create_polar_plot, add_default_axes, add_default_grids
-
-from abstract_plot_data import AbstractPlotData
-from array_plot_data import ArrayPlotData
-from plot import Plot
-from toolbar_plot import ToolbarPlot
-
-# Axis
-from axis import PlotAxis, MinorPlotAxis
-from label_axis import LabelAxis
-from ticks import AbstractTickGenerator, DefaultTickGenerator, auto_ticks, auto_interval, \
-                  tick_intervals, log_auto_ticks, auto_bounds, calc_bound
-
-# Grid
-from grid import PlotGrid
-
-# Style stuff
-#from stylable import Stylable
-#from stylesheets import Style, StyleSheet
-
-# Tools
-from abstract_controller import AbstractController
-
-# Importing various symbols into the Chaco namespace for backwards
-# compatibility.  New code should directly import from Enable.
-from enable.base_tool import BaseTool, KeySpec
-from enable.markers import marker_trait
+import sys
+from importlib import import_module
+from types import ModuleType
+
+
+# Each entry maps a module to the public names that are imported from it.
+_lazy_imports = [
+    ('chaco.base', ['NumericalSequenceTrait', 'PointTrait', 'ImageTrait',
+                    'DimensionTrait', 'SortOrderTrait', 'bin_search',
+                    'reverse_map_1d', 'right_shift', 'left_shift',
+                    'sort_points', 'find_runs', 'arg_find_runs',
+                    'point_line_distance']),
+
+    # Data model
+    ('chaco.abstract_data_source', ['AbstractDataSource']),
+    ('chaco.array_data_source', ['ArrayDataSource']),
+    ('chaco.grid_data_source', ['GridDataSource']),
+    ('chaco.image_data', ['ImageData']),
+    ('chaco.multi_array_data_source', ['MultiArrayDataSource']),
+    ('chaco.point_data_source', ['PointDataSource']),
+    ('chaco.abstract_data_range', ['AbstractDataRange']),
+    ('chaco.base_data_range', ['BaseDataRange']),
+    ('chaco.data_range_1d', ['DataRange1D']),
+    ('chaco.data_range_2d', ['DataRange2D']),
+    ('chaco.selection', ['Selection']),
+    ('chaco.selection_statistics', ['SelectionStatistics']),
+
+    # Mappers
+    ('chaco.abstract_mapper', ['AbstractMapper']),
+    ('chaco.base_1d_mapper', ['Base1DMapper']),
+    ('chaco.grid_mapper', ['GridMapper']),
+    ('chaco.log_mapper', ['LogMapper']),
+    ('chaco.linear_mapper', ['LinearMapper']),
+    ('chaco.color_mapper', ['ColorMapper', 'ColorMapTemplate']),
+    ('chaco.discrete_color_mapper', ['DiscreteColorMapper']),
+    ('chaco.transform_color_mapper', ['TransformColorMapper']),
+
+    # Color palettes.  The colormaps are the names in default_colormaps'
+    # __all__; see _star_imports below.
+    ('chaco.default_colors', ['cbrewer', 'palette11', 'palette14',
+                              'PALETTES']),
+
+    # Visual components
+    ('chaco.abstract_plot_renderer', ['AbstractPlotRenderer']),
+    ('chaco.abstract_overlay', ['AbstractOverlay']),
+    ('chaco.base_plot_container', ['BasePlotContainer']),
+    ('chaco.pick_buffer', ['PickBuffer']),
+    ('chaco.frame_budget', ['FrameBudgetScheduler']),
+    ('chaco.base_plot_frame', ['BasePlotFrame']),
+    ('chaco.cross_plot_frame', ['CrossPlotFrame']),
+    ('chaco.data_view', ['DataView']),
+    ('chaco.simple_plot_frame', ['SimplePlotFrame']),
+    ('chaco.plot_component', ['PlotComponent']),
+    ('chaco.batch_updates', ['batch_updates']),
+    ('chaco.interaction', ['begin_interaction', 'end_interaction',
+                           'step_interaction', 'interacting']),
+    ('chaco.background_preparation', ['wait_for_preparations']),
+    ('chaco.plot_graphics_context', ['PlotGraphicsContext',
+                                     'PlotGraphicsContextMixin']),
+    ('chaco.selectable_overlay_container',
+        ['SelectableOverlayPlotContainer']),
+    ('chaco.plot_containers', ['OverlayPlotContainer', 'HPlotContainer',
+                               'VPlotContainer', 'GridPlotContainer']),
+
+    ('chaco.label', ['Label']),
+    ('chaco.plot_label', ['PlotLabel']),
+    ('chaco.legend', ['Legend']),
+    ('chaco.tooltip', ['ToolTip']),
+    ('chaco.data_label', ['DataLabel']),
+    ('chaco.lasso_overlay', ['LassoOverlay']),
+    ('chaco.color_bar', ['ColorBar']),
+    ('chaco.text_box_overlay', ['TextBoxOverlay']),
+    ('chaco.scatter_inspector_overlay', ['ScatterInspectorOverlay']),
+
+    # Renderers
+    ('chaco.barplot', ['BarPlot']),
+    ('chaco.base_1d_plot', ['Base1DPlot']),
+    ('chaco.base_2d_plot', ['Base2DPlot']),
+    ('chaco.base_xy_plot', ['BaseXYPlot']),
+    ('chaco.scatterplot', ['ScatterPlot', 'render_markers']),
+    ('chaco.image_plot', ['ImagePlot']),
+    ('chaco.cmap_image_plot', ['CMapImagePlot']),
+    ('chaco.contour_line_plot', ['ContourLinePlot']),
+    ('chaco.contour_poly_plot', ['ContourPolyPlot']),
+    ('chaco.lineplot', ['LinePlot']),
+    ('chaco.colormapped_scatterplot', ['ColormappedScatterPlot']),
+    ('chaco.colormapped_selection_overlay', ['ColormappedSelectionOverlay']),
+    ('chaco.polygon_plot', ['PolygonPlot']),
+    ('chaco.errorbar_plot', ['ErrorBarPlot']),
+    ('chaco.filled_line_plot', ['FilledLinePlot']),
+    ('chaco.quiverplot', ['QuiverPlot']),
+    ('chaco.candle_plot', ['CandlePlot']),
+    ('chaco.multi_line_plot', ['MultiLinePlot']),
+    ('chaco.jitterplot', ['JitterPlot']),
+    ('chaco.variable_size_scatterplot', ['VariableSizeScatterPlot']),
+    ('chaco.horizon_plot', ['BandedMapper', 'HorizonPlot']),
+    ('chaco.scatterplot_1d', ['ScatterPlot1D']),
+    ('chaco.line_scatterplot_1d', ['LineScatterPlot1D']),
+    ('chaco.text_plot_1d', ['TextPlot1D']),
+
+    # Plot factories
+    ('chaco.plot_factory', ['create_bar_plot', 'create_line_plot',
+                            'create_scatter_plot', 'create_polar_plot',
+                            'add_default_axes', 'add_default_grids']),
+
+    ('chaco.abstract_plot_data', ['AbstractPlotData']),
+    ('chaco.array_plot_data', ['ArrayPlotData']),
+    ('chaco.plot', ['Plot']),
+    ('chaco.toolbar_plot', ['ToolbarPlot']),
+
+    # Axis
+    ('chaco.axis', ['PlotAxis', 'MinorPlotAxis']),
+    ('chaco.label_axis', ['LabelAxis']),
+    ('chaco.ticks', ['AbstractTickGenerator', 'DefaultTickGenerator',
+                     'auto_ticks', 'auto_interval', 'tick_intervals',
+                     'log_auto_ticks', 'auto_bounds', 'calc_bound']),
+
+    # Grid
+    ('chaco.grid', ['PlotGrid']),
+
+    # Style stuff
+    #('chaco.stylable', ['Stylable']),
+    #('chaco.stylesheets', ['Style', 'StyleSheet']),
+
+    # Tools
+    ('chaco.abstract_controller', ['AbstractController']),
+
+    # Importing various symbols into the Chaco namespace for backwards
+    # compatibility.  New code should directly import from Enable.
+    ('enable.base_tool', ['BaseTool', 'KeySpec']),
+    ('enable.markers', ['marker_trait']),
+]
+
+# Alternative names for items of the API.
+_aliases = {
+    'GridContainer': 'GridPlotContainer',
+}
+
+# Modules whose whole __all__ is part of the API.
+_star_imports = ['chaco.default_colormaps']
+
+# Maps each public name to the module that defines it.
+_name_to_module = {}
+for _module_name, _names in _lazy_imports:
+    for _name in _names:
+        _name_to_module[_name] = _module_name
+del _module_name, _names, _name
+
+
+class _LazyAPIModule(ModuleType):
+    """ Module type of chaco.api, which imports each name on first access.
+    """
+
+    def __getattr__(self, name):
+        if name == '__all__':
+            value = self._get_all()
+        elif name.startswith('__'):
+            # Special attributes probed by the import machinery and tools.
+            raise AttributeError(name)
+        else:
+            value = self._import_name(_aliases.get(name, name))
+        # Cache the value so that later lookups are plain attribute accesses.
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__all__))
+
+    def _import_name(self, name):
+        module_name = _name_to_module.get(name)
+        if module_name is not None:
+            return getattr(import_module(module_name), name)
+
+        for module_name in _star_imports:
+            module = import_module(module_name)
+            if name in module.__all__:
+                return getattr(module, name)
+
+        raise AttributeError("module %r has no attribute %r"
+                             % (self.__name__, name))
+
+    def _get_all(self):
+        names = list(_name_to_module) + list(_aliases)
+        for module_name in _star_imports:
+            names.extend(import_module(module_name).__all__)
+        return sorted(names)
+
+
+# Replace this module by its lazy version.  The original module is kept
+# alive because the functions above use its namespace.
+_lazy_module = _LazyAPIModule(__name__, __doc__)
+_lazy_module.__dict__.update(
+    (key, value) for key, value in globals().items()
+    if key.startswith('__') and key != '__doc__'
+)
+_lazy_module._original_module = sys.modules[__name__]
+sys.modules[__name__] = _lazy_module
 
 #EOF
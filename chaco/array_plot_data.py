@@ -1,7 +1,7 @@
 """ Defines ArrayPlotData.
 """
 
-from numpy import array, ndarray
+from numpy import ndarray
 
 # Enthought library imports
 from traits.api import Dict
@@ -9,6 +9,7 @@ from traits.api import Dict
 # Local, relative imports
 from .abstract_plot_data import AbstractPlotData
 from .abstract_data_source import AbstractDataSource
+from .base import as_data_array
 
 
 class ArrayPlotData(AbstractPlotData):
@@ -17,6 +18,12 @@ class ArrayPlotData(AbstractPlotData):
 
     By default, it doesn't allow its input data to be modified by downstream
     Chaco components or interactors.
+
+    The data is stored without copying it if it is a Numpy array or if it
+    exposes its memory through the array interface or the buffer protocol
+    (e.g. pandas columns or memoryviews); other sequences, including
+    ``array.array`` objects, are converted to new arrays.  See
+    chaco.base.as_data_array().
     """
 
     #-------------------------------------------------------------------------
@@ -93,7 +100,7 @@ class ArrayPlotData(AbstractPlotData):
 
         if name in self.arrays:
             del self.arrays[name]
-            self.data_changed = {'removed': [name]}
+            self._notify_data_changed({'removed': [name]})
         else:
             raise KeyError("Data series '%s' does not exist." % name)
 
@@ -153,7 +160,7 @@ class ArrayPlotData(AbstractPlotData):
                 event.setdefault('added', []).append(name)
 
         self._update_data(data)
-        self.data_changed = event
+        self._notify_data_changed(event)
 
 
     def set_selection(self, name, selection):
@@ -191,7 +198,7 @@ class ArrayPlotData(AbstractPlotData):
         # all create the dictionary that they pass in
         for name, value in data.items():
             if not isinstance(value, (ndarray, AbstractDataSource)):
-                data[name] = array(value)
+                data[name] = as_data_array(value)
             else:
                 data[name] = value
 
@@ -3,6 +3,9 @@
 
 from __future__ import with_statement
 
+# Standard library imports
+from collections import OrderedDict
+
 # Major library import
 from numpy import array, around, absolute, cos, dot, float64, inf, pi, \
                   sqrt, sin, transpose
@@ -24,6 +27,36 @@ from log_mapper import LogMapper
 def DEFAULT_TICK_FORMATTER(val):
     return ("%f"%val).rstrip("0").rstrip(".")
 
+# The maximum number of tick labels kept by the cache shared by all axes.
+TICK_LABEL_CACHE_SIZE = 1024
+
+# Tick labels and their bounding boxes, shared by all axes and keyed on
+# (text, font, color, rotate_angle, margin).  The entries are kept in least
+# recently used order.
+_tick_label_cache = OrderedDict()
+
+def _get_tick_label(gc, text, font, color, rotate_angle=0.0, margin=2):
+    """ Returns a tick Label and its bounding box, reusing the ones created
+    for a previous tick with the same text and style.
+
+    The returned Label is shared, so it must not be modified.
+    """
+    font_key = (font.face_name, font.size, font.family, font.weight,
+                font.style, font.underline, font.encoding)
+    key = (text, font_key, color, rotate_angle, margin)
+    entry = _tick_label_cache.pop(key, None)
+    if entry is None:
+        label = Label(text=text, font=font, color=color,
+                      rotate_angle=rotate_angle, margin=margin)
+        bounds = array(label.get_bounding_box(gc), float64)
+        bounds.flags.writeable = False
+        entry = (label, bounds)
+        if len(_tick_label_cache) >= TICK_LABEL_CACHE_SIZE:
+            _tick_label_cache.popitem(last=False)
+    _tick_label_cache[key] = entry
+    return entry
+
+
 class PlotAxis(AbstractOverlay):
     """
     The PlotAxis is a visual component that can be rendered on its own as
@@ -475,12 +508,7 @@ class PlotAxis(AbstractOverlay):
             else:
                 tick_list, labels = tmp
             # compute the labels here
-            self.ticklabel_cache = [Label(text=lab,
-                                          font=self.tick_label_font,
-                                          color=self.tick_label_color) \
-                                    for lab in labels]
-            self._tick_label_bounding_boxes = [array(ticklabel.get_bounding_box(gc), float64) \
-                                               for ticklabel in self.ticklabel_cache]
+            self._set_tick_labels(gc, labels)
         else:
             scale = 'log' if isinstance(self.mapper, LogMapper) else 'linear'
             if self.small_haxis_style:
@@ -511,17 +539,25 @@ class PlotAxis(AbstractOverlay):
             return
 
         formatter = self.tick_label_formatter
-        def build_label(val):
-            tickstring = formatter(val) if formatter is not None else str(val)
-            return Label(text=tickstring,
-                         font=self.tick_label_font,
-                         color=self.tick_label_color,
-                         rotate_angle=self.tick_label_rotate_angle,
-                         margin=self.tick_label_margin)
-
-        self.ticklabel_cache = [build_label(val) for val in self._tick_label_list]
-        self._tick_label_bounding_boxes = [array(ticklabel.get_bounding_box(gc), float)
-                                               for ticklabel in self.ticklabel_cache]
+        if formatter is None:
+            formatter = str
+        self._set_tick_labels(gc, [formatter(val)
+                                   for val in self._tick_label_list],
+                              rotate_angle=self.tick_label_rotate_angle,
+                              margin=self.tick_label_margin)
+        return
+
+    def _set_tick_labels(self, gc, texts, rotate_angle=0.0, margin=2):
+        """ Sets the Labels and bounding boxes of the tick labels, taking them
+        from the tick label cache shared by all axes.
+        """
+        font = self.tick_label_font
+        color = self.tick_label_color_
+        entries = [_get_tick_label(gc, text, font, color, rotate_angle,
+                                   margin)
+                   for text in texts]
+        self.ticklabel_cache = [label for label, bounds in entries]
+        self._tick_label_bounding_boxes = [bounds for label, bounds in entries]
         return
 
 
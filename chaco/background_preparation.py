@@ -0,0 +1,176 @@
+""" Preparation of the data of renderers on background threads.
+
+Before drawing, renderers prepare their data: they gather the points within
+their ranges and downsample them.  With large datasets, this can take long
+enough to make the user interface lag.  Renderers whose
+**prepare_in_background** is True instead request their prepared data with
+request_preparation(), which runs the preparation on a shared pool of
+threads, where NumPy releases the GIL for most of the work, and returns
+immediately.  Until the prepared data is ready, the renderers keep drawing the
+data they prepared for a previous frame; once it is ready, they are redrawn
+and swap it in.
+
+Each renderer has at most one preparation running at a time.  The requests
+made while it runs are coalesced into the latest one, which runs next.
+"""
+from multiprocessing.pool import ThreadPool
+from threading import Condition
+from weakref import WeakKeyDictionary
+
+from numpy import ndarray
+from traits import trait_notifiers
+
+
+# The number of threads that prepare the data of renderers.
+MAX_WORKERS = 4
+
+# Guards the states of the preparations, and signals when one is done.
+_condition = Condition()
+
+# Maps each renderer with preparations to a _PreparationState.  The
+# renderers are referenced weakly, so that a finished preparation that is
+# never collected does not keep its renderer alive.
+_states = WeakKeyDictionary()
+
+# The pool of threads, created when first needed.
+_pool = None
+
+
+class _PreparationState(object):
+    """ The preparations of a renderer.
+    """
+
+    def __init__(self):
+        # The key of the running preparation, or None.
+        self.running_key = None
+        # The (key, compute) of the preparation to run next, or None.
+        self.pending = None
+        # The (key, result, error) of the last finished preparation, or None.
+        self.finished = None
+        # Incremented to discard the running preparation.
+        self.generation = 0
+
+
+def request_preparation(owner, key, compute):
+    """ Requests the result of *compute*, a function without arguments which
+    prepares the data of *owner* and is called on a background thread.
+
+    *key* is a tuple of the inputs of *compute*, which are compared by
+    identity for arrays and by equality otherwise.  Returns None if no
+    preparation finished since the last request, or a (result, current)
+    tuple, where *current* tells whether the result was prepared with *key*
+    or is the result of an earlier request.  Any error raised by *compute* is
+    raised again here.
+
+    Requesting a *key* that is neither running nor just finished starts
+    preparing it, or queues it after the running preparation in place of any
+    other queued request.
+    """
+    with _condition:
+        state = _states.get(owner)
+        if state is None:
+            state = _states[owner] = _PreparationState()
+        finished, state.finished = state.finished, None
+        if state.running_key is not None:
+            if not _same_key(state.running_key, key):
+                state.pending = (key, compute)
+        elif finished is None or not _same_key(finished[0], key):
+            _submit(owner, state, key, compute)
+        else:
+            del _states[owner]
+    if finished is None:
+        return None
+    finished_key, result, error = finished
+    if error is not None:
+        raise error
+    return result, _same_key(finished_key, key)
+
+
+def discard_preparations(owner):
+    """ Discards the running, queued and finished preparations of *owner*,
+    typically because its data changed in place.
+    """
+    with _condition:
+        state = _states.get(owner)
+        if state is not None:
+            state.generation += 1
+            state.pending = None
+            state.finished = None
+            if state.running_key is None:
+                del _states[owner]
+
+
+def wait_for_preparations(timeout=None):
+    """ Waits until no preparation is running, for at most *timeout* seconds
+    if it is not None, and returns whether none is.
+
+    This is needed to draw renderers that prepare their data in the
+    background offscreen, where no redraw follows the preparation.
+    """
+    with _condition:
+        if timeout is None:
+            while _running():
+                _condition.wait()
+        elif _running():
+            _condition.wait(timeout)
+        return not _running()
+
+
+#----------------------------------------------------------------------------
+# Private functions
+#----------------------------------------------------------------------------
+
+def _same_key(key1, key2):
+    if len(key1) != len(key2):
+        return False
+    for item1, item2 in zip(key1, key2):
+        if item1 is item2:
+            continue
+        if isinstance(item1, ndarray) or isinstance(item2, ndarray) or \
+                item1 != item2:
+            return False
+    return True
+
+
+def _running():
+    return any(state.running_key is not None for state in _states.values())
+
+
+def _submit(owner, state, key, compute):
+    """ Starts preparing *key*; must be called with the condition acquired.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ThreadPool(MAX_WORKERS)
+    state.running_key = key
+    _pool.apply_async(_prepare, (owner, state, key, compute,
+                                 state.generation))
+
+
+def _prepare(owner, state, key, compute, generation):
+    """ Runs a preparation on a thread of the pool.
+    """
+    result = error = None
+    try:
+        result = compute()
+    except Exception as exc:
+        error = exc
+    with _condition:
+        state.running_key = None
+        if generation == state.generation:
+            state.finished = (key, result, error)
+        if state.pending is not None:
+            pending_key, pending_compute = state.pending
+            state.pending = None
+            _submit(owner, state, pending_key, pending_compute)
+        elif state.finished is None:
+            _states.pop(owner, None)
+        _condition.notify_all()
+    _redraw(owner)
+
+
+def _redraw(owner):
+    """ Redraws *owner* from the GUI thread, if there is a GUI.
+    """
+    if trait_notifiers.ui_handler is not None:
+        trait_notifiers.ui_dispatch(owner.invalidate_and_redraw)
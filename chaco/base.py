@@ -3,11 +3,14 @@ Defines basic traits and functions for the data model.
 """
 
 # Standard library imports
+from array import ArrayType
 from math import radians, sqrt
 
 # Major library imports
-from numpy import (array, argsort, concatenate, cos, diff, dot, empty, isfinite,
-                   nonzero, pi, searchsorted, seterr, sin, int8)
+from numpy import (array, argsort, asarray, concatenate, cos, diff, dot,
+                   empty, frombuffer, isfinite, ndarray, nonzero, pi,
+                   searchsorted, seterr, sin, int8)
+from numpy import dtype as numpy_dtype
 
 # Enthought library imports
 from traits.api import CArray, Enum, Trait
@@ -301,3 +304,30 @@ def intersect_range(x, low, high, mask=None):
         result[-1] |= interval_mask[-1]
 
     return result
+
+
+def as_data_array(data):
+    """ Returns *data* as a numpy array, sharing its memory when possible.
+
+    Numpy arrays (including subclasses) are returned unchanged.  Objects that
+    expose their values through the numpy array interface (``__array__`` or
+    ``__array_interface__``, e.g. pandas columns) or the buffer protocol
+    (e.g. memoryviews) are wrapped without copying, even if their values are
+    not contiguous.  Lists, tuples and other sequences are copied, as are
+    objects that can only convert themselves to a new array.  ``array.array``
+    objects are copied too: on Python 2 they do not lock their buffer, which
+    they reallocate when they grow.
+    """
+    if isinstance(data, ArrayType):
+        try:
+            data_dtype = numpy_dtype(data.typecode)
+        except TypeError:
+            return asarray(data)
+        if len(data) == 0:
+            return empty(0, dtype=data_dtype)
+        # Copied right away, while the buffer cannot be reallocated.
+        return frombuffer(data, dtype=data_dtype).copy()
+    elif isinstance(data, ndarray):
+        return data
+    else:
+        return asarray(data)
@@ -1,7 +1,7 @@
 """ Defines the Base1DMapper class.
 """
 # Enthought library imports
-from traits.api import Bool, Instance, Float, Property
+from traits.api import Bool, Enum, Instance, Float, Property
 
 # Local relative imports
 from abstract_mapper import AbstractMapper
@@ -35,6 +35,11 @@ class Base1DMapper(AbstractMapper):
     # The sign of the mapping: 1 if deltas match sign, -1 if opposite sign
     sign = Property
 
+    # The dtype of the arrays returned by map_screen() when no output array
+    # is given.  Screen coordinates rarely need more than float32 precision,
+    # which halves the memory used by renderers that cache them.
+    screen_dtype = Enum('float64', 'float32')
+
     # If the subclass uses a cache, _cache_valid is maintained to
     # monitor its status
     _cache_valid = Bool(False)
@@ -1,13 +1,20 @@
 """ Defines the BasePlotContainer class.
 """
 import warnings
+from time import time
 
 # Enthought library imports
 from enable.api import Container
-from traits.api import Bool, Instance, Property, Str, Tuple
+from traits.api import Any, Bool, Dict, Float, Instance, List, Property, \
+    Str, Tuple
 
 # Local, relative imports
-from plot_component import DEFAULT_DRAWING_ORDER, PlotComponent
+from batch_updates import batch_updates, defer_invalidate_draw, \
+    defer_request_redraw
+from frame_budget import FrameBudgetScheduler
+from pick_buffer import PickBuffer
+from plot_component import DEFAULT_DRAWING_ORDER, PlotComponent, \
+    draw_layer_backbuffered
 
 
 class BasePlotContainer(Container):
@@ -38,6 +45,37 @@ class BasePlotContainer(Container):
     draw_order = Instance(list, args=(DEFAULT_DRAWING_ORDER,))
     draw_layer = Str("plot")
 
+    # Should each layer of this container be rendered into an offscreen image
+    # that is kept until the container calls invalidate_draw()?  (See
+    # PlotComponent.)
+    use_layer_backbuffers = Bool(False)
+
+    # The layers that are always drawn directly, even when
+    # **use_layer_backbuffers** is True.
+    unbuffered_layers = List(Str, ["overlay"])
+
+    # Maps each buffered layer to a (key, image) tuple.
+    _layer_backbuffers = Dict
+
+    # The number of seconds that the last draw of this container took.
+    last_draw_time = Float(0.0)
+
+    # Render the pick buffer used by pick() after each draw, rather than when
+    # pick() is first called after the draw?
+    use_pick_buffer = Bool(False)
+
+    # The PickBuffer of the last draw, or None if it was not rendered yet.
+    _pick_buffer = Any
+
+    # The number of seconds within which to draw each frame, by lowering the
+    # level of detail of the renderers in this container and its nested
+    # containers as needed (see chaco.frame_budget), or 0.0 for no budget.
+    frame_budget = Float(0.0)
+
+    # The FrameBudgetScheduler of the renderers, or None if there is no
+    # **frame_budget**.
+    _frame_scheduler = Any
+
     #------------------------------------------------------------------------
     # Deprecated traits
     #------------------------------------------------------------------------
@@ -59,6 +97,91 @@ class BasePlotContainer(Container):
                       "Use components attribute instead.", DeprecationWarning)
         self._components = new
 
+    def batch_updates(self):
+        """ Returns a context manager that defers the draw invalidations and
+        redraw requests of all Chaco components until it exits.
+        """
+        return batch_updates()
+
+    def draw(self, gc, view_bounds=None, mode="default"):
+        """ Draws the container within its frame budget, if it has one, and
+        records the time it took in **last_draw_time**.
+        """
+        scheduler = self._frame_scheduler
+        if scheduler is not None:
+            scheduler.begin_frame()
+        start = time()
+        super(BasePlotContainer, self).draw(gc, view_bounds, mode)
+        self.last_draw_time = time() - start
+        if scheduler is not None:
+            scheduler.end_frame()
+        if self.use_pick_buffer and self._pick_buffer is None:
+            self._pick_buffer = PickBuffer(self)
+
+    def pick(self, screen_pt, threshold=7.0):
+        """ Returns the (renderer, index) of the data point drawn nearest to
+        *screen_pt*, within *threshold* pixels, among all the X-Y renderers
+        in this container and its nested containers, or None if there is
+        none.
+
+        The renderers and data points drawn in each pixel are looked up in an
+        offscreen PickBuffer, which is kept until the container is invalidated
+        or resized, so that picking costs the same however many renderers and
+        data points the container has.
+        """
+        buffer = self._pick_buffer
+        if buffer is None or buffer.bounds != tuple(self.bounds):
+            buffer = self._pick_buffer = PickBuffer(self)
+        return buffer.pick(screen_pt, threshold)
+
+    def invalidate_draw(self, damaged_regions=None, self_relative=False):
+        """ Invalidates the pick buffer and the backbuffers, at the end of the
+        current update batch if there is one.
+        """
+        self._pick_buffer = None
+        if not defer_invalidate_draw(self, damaged_regions, self_relative):
+            super(BasePlotContainer, self).invalidate_draw(damaged_regions,
+                                                           self_relative)
+
+    def request_redraw(self):
+        """ Requests a redraw at the end of the current update batch, if any.
+        """
+        if not defer_request_redraw(self):
+            super(BasePlotContainer, self).request_redraw()
+
+    def dispatch(self, event, suffix):
+        """ Dispatches a mouse event, coalescing the redraws it causes.
+        """
+        with batch_updates(refreshes=False):
+            super(BasePlotContainer, self).dispatch(event, suffix)
+
+    def _dispatch_draw(self, layer, gc, view_bounds, mode):
+        """ Renders the named *layer*, from its backbuffer if it is buffered.
+        """
+        if self.use_layer_backbuffers and layer not in self.unbuffered_layers:
+            draw_layer_backbuffered(
+                self, layer, gc, view_bounds, mode,
+                super(BasePlotContainer, self)._dispatch_draw)
+        else:
+            super(BasePlotContainer, self)._dispatch_draw(layer, gc,
+                                                          view_bounds, mode)
+
+    def _draw_valid_changed(self, new):
+        """ Discards the layer backbuffers once the container is invalidated.
+        """
+        if not new:
+            self._layer_backbuffers.clear()
+
+    def _use_layer_backbuffers_changed(self):
+        self._layer_backbuffers.clear()
+
+    def _frame_budget_changed(self, new):
+        if self._frame_scheduler is not None:
+            self._frame_scheduler.reset()
+            self._frame_scheduler = None
+        if new > 0.0:
+            self._frame_scheduler = FrameBudgetScheduler(self)
+
     def _use_draw_order_changed(self, old, new):
         """ Handler to catch the case when someone is trying to use the
         old-style drawing mechanism, which is now unsupported.
@@ -4,7 +4,8 @@
 from __future__ import with_statement
 
 from math import sqrt
-from numpy import around, array, isnan, transpose
+from numpy import arange, argsort, around, array, empty, hypot, inf, isnan, \
+    result_type, searchsorted, transpose
 
 # Enthought library imports
 from enable.api import black_color_trait
@@ -18,8 +19,11 @@ from abstract_plot_renderer import AbstractPlotRenderer
 from abstract_data_source import AbstractDataSource
 from array_data_source import ArrayDataSource
 from axis import PlotAxis
+from background_preparation import discard_preparations, request_preparation
 from base import point_line_distance, reverse_map_1d
 from grid import PlotGrid
+from linear_mapper import LinearMapper
+from log_mapper import LogMapper
 from plot_label import PlotLabel
 
 
@@ -109,6 +113,11 @@ class BaseXYPlot(AbstractPlotRenderer):
     # This makes data updates slower, but makes hit-tests extremely fast.
     use_subdivision = Bool(False)
 
+    # Does the plot prepare its data (gather and downsample the points to
+    # draw) on a background thread, drawing the data prepared for a previous
+    # frame until it is ready?  See chaco.background_preparation.
+    prepare_in_background = Bool(False)
+
     # Overrides the default background color trait in PlotComponent.
     bgcolor = "transparent"
 
@@ -143,6 +152,27 @@ class BaseXYPlot(AbstractPlotRenderer):
     # Reference to a spatial subdivision acceleration structure.
     _subdivision = Any
 
+    # Can the cached data points be kept when the mappers change, as long as
+    # all the data points were gathered and are still within the ranges?
+    # Subclasses set this when _cached_data_pts is an array of all the points
+    # collected by _gather_points, or a list of such arrays.
+    _reuse_gathered_points = Bool(False)
+
+    # The screen points last computed by _reuse_screen_points(), as a tuple
+    # (key, linear transform parameters, screen points), or None.
+    _screen_pts_cache = Any
+
+    # Is the plot getting the screen points that it draws?  Only its own draw
+    # path gets the reused screen points themselves, which later pans and
+    # zooms transform in place; callers of get_screen_points() get copies.
+    _drawing = Bool(False)
+
+    # The index used by nearest_point(), as a tuple (index data, value data,
+    # order, sorted index data), where *order* gives the positions of the
+    # non-NaN index values in increasing order, or is None if the index data
+    # is sorted in increasing order.
+    _nearest_point_index = Any
+
     #------------------------------------------------------------------------
     # Abstract methods that subclasses must implement
     #------------------------------------------------------------------------
@@ -343,6 +373,9 @@ class BaseXYPlot(AbstractPlotRenderer):
         if len(data_array) == 0:
             return []
 
+        if getattr(data_array, "ndim", 0) == 2:
+            return self._map_screen_points(data_array[:, 0], data_array[:, 1])
+
         x_ary, y_ary = transpose(data_array)
 
         sx = self.index_mapper.map_screen(x_ary)
@@ -352,6 +385,156 @@ class BaseXYPlot(AbstractPlotRenderer):
         else:
             return transpose(array((sy,sx)))
 
+    def _map_screen_points(self, x_ary, y_ary):
+        """ Maps the index values *x_ary* and the values *y_ary* into a single
+        newly allocated Nx2 array of screen points.
+        """
+        index_dtype = getattr(self.index_mapper, "screen_dtype", "float64")
+        value_dtype = getattr(self.value_mapper, "screen_dtype", "float64")
+        points = empty((len(x_ary), 2), dtype=result_type(index_dtype,
+                                                          value_dtype))
+        if self.orientation == "h":
+            sx, sy = points[:, 0], points[:, 1]
+        else:
+            sy, sx = points[:, 0], points[:, 1]
+        self._map_screen_into(self.index_mapper, x_ary, sx)
+        self._map_screen_into(self.value_mapper, y_ary, sy)
+        return points
+
+    def _map_screen_into(self, mapper, data_array, out):
+        """ Maps *data_array* through *mapper*, writing the result into *out*.
+        """
+        if isinstance(mapper, (LinearMapper, LogMapper)):
+            mapper.map_screen(data_array, out=out)
+        else:
+            out[...] = mapper.map_screen(data_array)
+
+    def _reuse_screen_points(self, key, map_points):
+        """ Returns the screen points computed by *map_points*, reusing the
+        ones returned by a previous call with the same *key* if possible.
+
+        The first item of *key* is compared by identity and is normally the
+        cached data points; any other items are compared by equality.  When
+        both mappers are linear, the cached screen points are only shifted
+        and scaled in place to account for a pan or zoom.
+        """
+        # The columns of the screen points depend on the orientation.
+        key = key + (self.orientation,)
+        params = self._linear_screen_params()
+        cache = self._screen_pts_cache
+        if (params is not None and cache is not None and
+                cache[0][0] is key[0] and cache[0][1:] == key[1:] and
+                cache[1] is not None):
+            screen_pts = cache[2]
+            if cache[1] != params:
+                self._transform_screen_points(screen_pts, cache[1], params)
+        else:
+            screen_pts = map_points()
+        self._screen_pts_cache = (key, params, screen_pts)
+        return screen_pts
+
+    def _own_screen_points(self, screen_pts):
+        """ Returns *screen_pts*, which may be reused by later draws, or a copy
+        of them unless the plot is drawing them.
+        """
+        if self._drawing:
+            return screen_pts
+        if isinstance(screen_pts, list):
+            return [pts.copy() for pts in screen_pts]
+        return screen_pts.copy()
+
+    def _prepare(self, key, compute):
+        """ Returns the (result, current) of *compute*, which prepares the
+        data to draw from the inputs in *key*, or None if it is being
+        prepared in the background.
+
+        *current* is False if the result was prepared from other inputs, for
+        a previous frame.  See request_preparation().
+        """
+        if not self.prepare_in_background:
+            return compute(), True
+        return request_preparation(self, key, compute)
+
+    def _get_nearest_point_index(self):
+        """ Returns the index used by nearest_point(), updating it if the data
+        arrays changed.
+        """
+        index_data = self.index.get_data()
+        value_data = self.value.get_data()
+        cache = self._nearest_point_index
+        if cache is None or cache[0] is not index_data or \
+                cache[1] is not value_data:
+            sort_order = self.index.sort_order
+            if sort_order == "ascending":
+                order = None
+                sorted_index = index_data
+            else:
+                if sort_order == "descending":
+                    order = arange(len(index_data) - 1, -1, -1)
+                else:
+                    order = argsort(index_data, kind="mergesort")
+                order = order[~isnan(index_data[order])]
+                sorted_index = index_data[order]
+            cache = (index_data, value_data, order, sorted_index)
+            self._nearest_point_index = cache
+        return cache
+
+    def _linear_screen_params(self):
+        """ Returns the (low, scale, low_pos) of the mappers for the x and y
+        screen coordinates, or None if they are not both linear.
+        """
+        params = []
+        for mapper in (self.index_mapper, self.value_mapper):
+            if not isinstance(mapper, LinearMapper) or mapper.range is None:
+                return None
+            mapper._compute_scale()
+            if mapper._null_data_range or mapper._scale == 0:
+                return None
+            params.append((mapper.range.low, mapper._scale, mapper.low_pos))
+        if self.orientation == "v":
+            params.reverse()
+        return tuple(params)
+
+    def _transform_screen_points(self, screen_pts, old_params, new_params):
+        """ Updates, in place, screen points mapped with the linear mapper
+        parameters *old_params* so that they match *new_params*.
+        """
+        if isinstance(screen_pts, list):
+            for pts in screen_pts:
+                self._transform_screen_points(pts, old_params, new_params)
+            return
+        if len(screen_pts) == 0:
+            return
+        for column, old, new in zip((0, 1), old_params, new_params):
+            old_low, old_scale, old_low_pos = old
+            low, scale, low_pos = new
+            factor = scale / old_scale
+            screen_pts[:, column] *= factor
+            screen_pts[:, column] += (low_pos - old_low_pos * factor +
+                                      (old_low - low) * scale)
+
+    def _gathered_points_unchanged(self):
+        """ Returns whether the cached data points are still the points that
+        _gather_points() would collect, i.e. whether all the data points were
+        gathered and they all lie within the current ranges.
+        """
+        if (not self._reuse_gathered_points or not self._cache_valid or
+                self.index is None or self.value is None):
+            return False
+        data_pts = self._cached_data_pts
+        if isinstance(data_pts, list):
+            num_points = sum(len(pts) for pts in data_pts)
+        else:
+            num_points = len(data_pts)
+        for ds, rng in ((self.index, self.index_range),
+                        (self.value, self.value_range)):
+            if len(ds.get_data()) != num_points:
+                return False
+            low, high = ds.get_bounds()
+            if not (rng.low <= low and high <= rng.high):
+                return False
+        return True
+
     def map_data(self, screen_pt, all_values=False):
         """ Maps a screen space point into the "index" space of the plot.
 
@@ -405,19 +588,28 @@ class BaseXYPlot(AbstractPlotRenderer):
         if len(value_data) == 0 or len(index_data) == 0:
             return None
 
-        try:
-            # find the closest point to data_pt in index_data
-            ndx = reverse_map_1d(index_data, data_pt, self.index.sort_order)
-        except IndexError:
-            # if reverse_map raises this exception, it means that data_pt is
-            # outside the range of values in index_data.
-            if outside_returns_none:
+        if self.index.sort_order == "none":
+            # Unsorted index data can't be searched in place; find the
+            # closest point along the index axis through the sorted copy of
+            # the index data kept by nearest_point().
+            ndx = self.nearest_point(screen_pt, index_only=True)
+            if ndx is None:
                 return None
-            else:
-                if data_pt < index_data[0]:
-                    return 0
+        else:
+            try:
+                # find the closest point to data_pt in index_data
+                ndx = reverse_map_1d(index_data, data_pt,
+                                     self.index.sort_order)
+            except IndexError:
+                # if reverse_map raises this exception, it means that data_pt
+                # is outside the range of values in index_data.
+                if outside_returns_none:
+                    return None
                 else:
-                    return len(index_data) - 1
+                    if data_pt < index_data[0]:
+                        return 0
+                    else:
+                        return len(index_data) - 1
 
         if threshold == 0.0:
             # Don't do any threshold testing
@@ -442,6 +634,90 @@ class BaseXYPlot(AbstractPlotRenderer):
         else:
             return None
 
+    def nearest_point(self, screen_pt, threshold=0.0, index_only=False):
+        """ Returns the index of the data point nearest to a screen space
+        point.
+
+        Parameters
+        ----------
+        screen_pt : (x,y)
+            Screen space point
+        threshold : float
+            Maximum screen space distance between *screen_pt* and the data
+            point.  A value of 0.0 means no threshold (any distance will do).
+        index_only : bool
+            If True, the distance is measured along the index axis only, as
+            when snapping a cursor to the index of a line; otherwise, it is
+            the Euclidean distance between the points.
+
+        Returns
+        -------
+        The index of the nearest data point, or None if no data point is
+        within *threshold* of *screen_pt*.
+
+        The data points are searched by a binary search of the index data,
+        or of a sorted copy of it that is kept until the data changes, so
+        that only the points near *screen_pt* along the index axis are mapped
+        to screen space.
+        """
+        index_data, value_data, order, sorted_index = \
+            self._get_nearest_point_index()
+        n = len(sorted_index)
+        if n == 0:
+            return None
+        if self.orientation == "h":
+            index_pos, value_pos = screen_pt
+        else:
+            value_pos, index_pos = screen_pt
+        index_mapper = self.index_mapper
+        center = searchsorted(sorted_index, index_mapper.map_data(index_pos))
+
+        def index_distance(position):
+            # Map a 1-element array, as mappers do not all accept scalars.
+            screen = index_mapper.map_screen(sorted_index[position:position+1])
+            return abs(screen[0] - index_pos)
+
+        best = None
+        best_distance = threshold if threshold > 0.0 else inf
+        if index_only:
+            for position in (center - 1, center):
+                if 0 <= position < n:
+                    distance = index_distance(position)
+                    if distance < best_distance:
+                        best, best_distance = position, distance
+        else:
+            # Search outwards from the center, in growing chunks, until the
+            # points left are further along the index axis than the nearest
+            # point found.
+            low = high = center
+            chunk = 64
+            while low > 0 or high < n:
+                for start, stop in ((max(low - chunk, 0), low),
+                                    (high, min(high + chunk, n))):
+                    if start == stop:
+                        continue
+                    positions = arange(start, stop)
+                    rows = positions if order is None else order[positions]
+                    distances = hypot(
+                        index_mapper.map_screen(sorted_index[positions]) -
+                        index_pos,
+                        self.value_mapper.map_screen(value_data[rows]) -
+                        value_pos)
+                    distances[isnan(distances)] = inf
+                    nearest = distances.argmin()
+                    if distances[nearest] < best_distance:
+                        best, best_distance = start + nearest, \
+                            distances[nearest]
+                low, high = max(low - chunk, 0), min(high + chunk, n)
+                chunk *= 2
+                if min(index_distance(low - 1) if low > 0 else inf,
+                       index_distance(high) if high < n else inf) \
+                        > best_distance:
+                    break
+        if best is None:
+            return None
+        return int(best if order is None else order[best])
+
     def get_screen_points(self):
         """Returns the currently visible screen-space points.
 
@@ -453,7 +729,9 @@ class BaseXYPlot(AbstractPlotRenderer):
             # do any downsampling.
             return self._downsample()
         else:
-            return self.map_screen(self._cached_data_pts)
+            return self._own_screen_points(self._reuse_screen_points(
+                (self._cached_data_pts,),
+                lambda: self.map_screen(self._cached_data_pts)))
 
 
     #------------------------------------------------------------------------
@@ -470,7 +748,11 @@ class BaseXYPlot(AbstractPlotRenderer):
         # This method should be folded into self._draw_plot(), but is here for
         # backwards compatibilty with non-draw-order stuff.
 
-        pts = self.get_screen_points()
+        self._drawing = True
+        try:
+            pts = self.get_screen_points()
+        finally:
+            self._drawing = False
         self._render(gc, pts)
         return
 
@@ -634,6 +916,8 @@ class BaseXYPlot(AbstractPlotRenderer):
 
     def _either_data_changed(self):
         self.invalidate_draw()
+        self._nearest_point_index = None
+        discard_preparations(self)
         self._cache_valid = False
         self._screen_cache_valid = False
         self.request_redraw()
@@ -694,7 +978,8 @@ class BaseXYPlot(AbstractPlotRenderer):
         return
 
     def _mapper_updated_handler(self):
-        self._cache_valid = False
+        if not self._gathered_points_unchanged():
+            self._cache_valid = False
         self._screen_cache_valid = False
         self.invalidate_draw()
         self.request_redraw()
@@ -719,7 +1004,7 @@ class BaseXYPlot(AbstractPlotRenderer):
     def __getstate__(self):
         state = super(BaseXYPlot,self).__getstate__()
         for key in ['_cache_valid', '_cached_data_pts', '_screen_cache_valid',
-                    '_cached_screen_pts']:
+                    '_cached_screen_pts', '_screen_pts_cache']:
             if state.has_key(key):
                 del state[key]
 
@@ -0,0 +1,183 @@
+""" Coalescing of the redraw requests, draw invalidations and data range
+refreshes of Chaco components.
+
+A single user action, such as a change of the range shared by linked plots,
+typically makes every plot, axis, grid and overlay call invalidate_draw() and
+request_redraw(), and each of these calls walks up the container hierarchy
+to the window.  Within a ``with batch_updates():`` block, these calls only
+mark the components; each marked component then propagates its invalidation
+and its redraw request once, when the outermost block exits.  Likewise, a
+data range whose data sources change within a block refreshes its bounds
+once, at the end of the block.
+
+Chaco components and containers open such a block around the dispatch of
+each event, so that all the invalidations caused by an event are coalesced.
+These blocks do not defer the refreshes of data ranges, so that a tool that
+changes data while handling an event reads the updated bounds of the ranges.
+
+Batches are per thread: a block opened on a thread, such as one that
+acquires data, only defers the calls made on that thread.
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import local
+
+
+class _BatchState(local):
+    """ The state of the update batch of a thread.
+    """
+
+    def __init__(self):
+        # The number of nested batch_updates() blocks being executed.
+        self.depth = 0
+
+        # The number of those blocks that defer the refreshes of data ranges.
+        self.refresh_depth = 0
+
+        # The data ranges whose data sources changed within the batch.
+        self.pending_refreshes = OrderedDict()
+
+        # Maps the components invalidated within the batch to a tuple
+        # (default, regions): whether their default damaged regions are
+        # invalid, and the set of other damaged regions (in the coordinates
+        # of their container).
+        self.pending_invalidations = OrderedDict()
+
+        # The components whose redraw was requested within the batch.
+        self.pending_redraws = OrderedDict()
+
+        # The component whose deferred call is being made while flushing.
+        self.flushing = None
+
+
+_state = _BatchState()
+
+
+@contextmanager
+def batch_updates(refreshes=True):
+    """ Defers the draw invalidations and redraw requests of Chaco
+    components, and the refreshes of data ranges caused by changes of their
+    data sources, until the end of the block.
+
+    Blocks can be nested; the deferred calls are made when the outermost
+    block exits.  If *refreshes* is False, the block does not defer the
+    refreshes of data ranges, and the ones deferred by the blocks nested in
+    it are made when these blocks exit.
+    """
+    state = _state
+    state.depth += 1
+    if refreshes:
+        state.refresh_depth += 1
+    try:
+        yield
+    finally:
+        try:
+            if refreshes:
+                state.refresh_depth -= 1
+            if state.depth == 1:
+                flush_updates()
+            elif state.refresh_depth == 0:
+                _flush_refreshes()
+        finally:
+            state.depth -= 1
+
+
+def updates_batched():
+    """ Returns whether draw invalidations and redraw requests are currently
+    being deferred.
+    """
+    return _state.depth > 0
+
+
+def flush_updates():
+    """ Makes the deferred data range refreshes, draw invalidations and
+    redraw requests.
+
+    Data ranges are refreshed first, since the mappers and plots that they
+    update invalidate themselves.  Invalidations are then propagated before
+    the redraw requests, so that containers coalesce the invalidations of
+    their components before the window is asked to redraw.
+    """
+    state = _state
+    try:
+        while state.pending_refreshes or state.pending_invalidations or \
+                state.pending_redraws:
+            _flush_refreshes()
+            while state.pending_invalidations:
+                component, (default, regions) = \
+                    state.pending_invalidations.popitem(last=False)
+                regions = [list(region) for region in regions]
+                if default:
+                    regions.extend(component._default_damaged_regions())
+                state.flushing = component
+                component.invalidate_draw(damaged_regions=regions)
+            if state.pending_redraws:
+                component, _ = state.pending_redraws.popitem(last=False)
+                state.flushing = component
+                component.request_redraw()
+    finally:
+        state.flushing = None
+
+
+def defer_invalidate_draw(component, damaged_regions=None,
+                          self_relative=False):
+    """ Records an invalidate_draw() call on *component* if updates are
+    batched.
+
+    Returns whether the call was deferred; if it was not, the caller should
+    propagate the invalidation itself.  The component's **draw_valid** trait
+    is reset immediately in any case.
+    """
+    state = _state
+    if state.depth == 0 or component is state.flushing:
+        return False
+
+    component.draw_valid = False
+    pending = state.pending_invalidations
+    default, regions = pending.setdefault(component, (False, set()))
+    if damaged_regions is None:
+        if not default:
+            pending[component] = (True, regions)
+    else:
+        if self_relative:
+            x, y = component.x, component.y
+            damaged_regions = [(region[0] + x, region[1] + y,
+                                region[2], region[3])
+                               for region in damaged_regions]
+        regions.update(tuple(region) for region in damaged_regions)
+    return True
+
+
+def defer_request_redraw(component):
+    """ Records a request_redraw() call on *component* if updates are
+    batched.
+
+    Returns whether the call was deferred.
+    """
+    state = _state
+    if state.depth == 0 or component is state.flushing:
+        return False
+    state.pending_redraws[component] = None
+    return True
+
+
+def defer_refresh(data_range):
+    """ Records that the data sources of *data_range* changed, if updates are
+    batched.
+
+    Returns whether the refresh of the data range was deferred.
+    """
+    state = _state
+    if state.refresh_depth == 0:
+        return False
+    state.pending_refreshes[data_range] = None
+    return True
+
+
+def _flush_refreshes():
+    """ Makes the deferred data range refreshes.
+    """
+    pending = _state.pending_refreshes
+    while pending:
+        data_range, _ = pending.popitem(last=False)
+        data_range.refresh()
@@ -15,6 +15,7 @@ from traits.api import Any, Bool, Float, Instance, Property, Tuple
 from image_plot import ImagePlot
 from abstract_colormap import AbstractColormap
 from speedups import apply_selection_fade
+from selection import as_selection, Selection
 
 
 class CMapImagePlot(ImagePlot):
@@ -105,18 +106,26 @@ class CMapImagePlot(ImagePlot):
     # Private methods
     #------------------------------------------------------------------------
     
-    def _cmap_values(self, data, selection_masks=None):
+    def _cmap_values(self, data, selection_masks=None, out=None):
         """ Maps the data to RGB(A) with optional selection masks overlayed
-        
+
+        The selection masks can be boolean arrays or Selection objects of the
+        flattened data.
+
+        If *out* is given, it is a previously mapped image of the right shape
+        which is overwritten rather than allocating a new one.
         """
         # get the RGBA values from the color map as uint8
-        mapped_image = self.value_mapper.map_uint8(data)
+        mapped_image = self.value_mapper.map_uint8(data, out=out)
         if selection_masks is not None:
             # construct a composite mask
             if len(selection_masks) > 0:
-                mask = zeros(mapped_image.shape[:2], dtype=bool)
+                shape = mapped_image.shape[:2]
+                size = shape[0] * shape[1]
+                selection = Selection(size)
                 for m in selection_masks:
-                    mask = mask | m
+                    selection |= as_selection(m, size)
+                mask = selection.to_mask().reshape(shape)
             else:
                 mask = zeros(self._cached_mapped_image.shape[:2], dtype=bool)
             # Apply the selection fade, from speedups.py
@@ -129,8 +138,9 @@ class CMapImagePlot(ImagePlot):
         """
         if self.cache_full_map:
             if not self._mapped_image_cache_valid:
-                self._cached_mapped_image = self._cmap_values(self.value.data,
-                    selection_masks)
+                data = self.value.data
+                self._cached_mapped_image = self._cmap_values(data,
+                    selection_masks, out=self._reusable_mapped_image(data))
                 self._mapped_image_cache_valid = True
 
             mapped_value = self._cached_mapped_image
@@ -140,6 +150,17 @@ class CMapImagePlot(ImagePlot):
             ImagePlot._compute_cached_image(self, self.value.data, mapper=lambda data:
                 self._cmap_values(data))
             
+    def _reusable_mapped_image(self, data):
+        """ Returns the previously mapped image if it can hold the colors for
+        *data*, so that it can be overwritten in place.
+        """
+        image = self._cached_mapped_image
+        if (image is None or self.value_mapper.color_depth != 'rgba' or
+                image.shape != data.shape + (4,) or
+                not image.flags.c_contiguous):
+            return None
+        return image
+
     def _update_value_mapper(self):
         self._mapped_image_cache_valid = False
         self._image_cache_valid = False
@@ -180,6 +201,8 @@ class CMapImagePlot(ImagePlot):
         if old and new:
             if new.range is None and old.range is not None:
                 new.range = old.range
+        # A different mapper may produce a different color depth.
+        self._cached_mapped_image = None
         self._update_value_mapper()
     
     def _value_data_changed_fired(self):
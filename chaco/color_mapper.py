@@ -1,10 +1,13 @@
 """ Defines the ColorMapper and ColorMapTemplate classes.
 """
 
+# Standard library imports
+from collections import OrderedDict
+
 # Major library imports
 from numpy import arange, array, asarray, clip, divide, float32, int8, isinf, \
-        isnan, ones, searchsorted, sometrue, sort, take, uint8, where, zeros, \
-        linspace, ones_like
+        isnan, ones, searchsorted, sometrue, sort, take, uint8, uint16, \
+        uint32, where, zeros, linspace, ones_like
 
 # Enthought library imports
 from traits.api import Any, Array, Bool, Dict, Event, Float, HasTraits, \
@@ -14,7 +17,18 @@ from traits.api import Any, Array, Bool, Dict, Event, Float, HasTraits, \
 from abstract_colormap import AbstractColormap
 from data_range_1d import DataRange1D
 
-from speedups import map_colors, map_colors_uint8
+from speedups import map_colors, map_colors_uint8, map_colors_parallel, \
+        map_colors_uint8_parallel
+
+
+# Lookup tables shared by all ColorMappers, keyed by the number of steps and
+# the segment data they were computed from.  The tables are read-only, since
+# every mapper built from the same colormap factory uses the same arrays.
+_lut_cache = OrderedDict()
+
+# The maximum number of entries in _lut_cache; the least recently used entry
+# is dropped beyond that.
+LUT_CACHE_SIZE = 128
 
 
 class ColorMapTemplate(HasTraits):
@@ -84,6 +98,14 @@ class ColorMapper(AbstractColormap):
     # The name of this color map.
     name = Str
 
+    # Arrays with at least this many values are mapped in chunks on a pool of
+    # threads by map_screen() and map_uint8().
+    parallel_threshold = Int(1 << 20)
+
+    # The number of threads used to map large arrays.  If 0, the number of
+    # CPUs is used.
+    num_threads = Int(0)
+
     # Not used.
     low_pos = None
     # Not used.
@@ -99,6 +121,11 @@ class ColorMapper(AbstractColormap):
     # The raw segment data for creating the mapping array.
     _segmentdata = Dict  # (Str, Tuple | List)
 
+    # Packed RGBA lookup tables covering every value of an unsigned integer
+    # dtype, keyed by dtype.  Each entry is a (low, high, lut) tuple so that
+    # the table is rebuilt whenever the range changes.
+    _integer_luts = Dict
+
 
     #------------------------------------------------------------------------
     # Static methods.
@@ -241,15 +268,23 @@ class ColorMapper(AbstractColormap):
         return
 
 
-    def map_screen(self, data_array):
+    def map_screen(self, data_array, out=None):
         """ Maps an array of data values to an array of colors.
+
+        If *out* is given, it must be a C-contiguous float32 array of shape
+        data_array.shape + (4,), and the colors are written into it.
         """
         if self._dirty:
             self._recalculate()
 
-        rgba = map_colors(data_array, self.steps, self.range.low,
-                self.range.high, self._red_lut, self._green_lut,
-                self._blue_lut, self._alpha_lut)
+        args = (data_array, self.steps, self.range.low, self.range.high,
+                self._red_lut, self._green_lut, self._blue_lut,
+                self._alpha_lut)
+        if data_array.size >= self.parallel_threshold:
+            rgba = map_colors_parallel(*args, out=out,
+                                       num_threads=self.num_threads)
+        else:
+            rgba = map_colors(*args, out=out)
 
         return rgba
 
@@ -275,15 +310,38 @@ class ColorMapper(AbstractColormap):
             self._segmentdata[name] = data[::-1]
         self._recalculate()
 
-    def map_uint8(self, data_array):
+    def map_uint8(self, data_array, out=None):
         """ Maps an array of data values to an array of colors.
+
+        Arrays of uint8 or uint16 values are mapped with a single lookup into
+        a table of packed RGBA colors covering the whole integer domain,
+        which avoids normalizing every value in floating point.
+
+        If *out* is given, it must be a C-contiguous uint8 array of shape
+        data_array.shape + (4,), and the colors are written into it.
         """
         if self._dirty:
             self._recalculate()
 
-        rgba = map_colors_uint8(data_array, self.steps, self.range.low,
-                self.range.high, self._red_lut_uint8, self._green_lut_uint8,
+        dtype = getattr(data_array, 'dtype', None)
+        if dtype in (uint8, uint16):
+            lut = self._get_integer_lut(dtype, data_array.size)
+            if lut is not None:
+                if out is None:
+                    rgba = take(lut, data_array)
+                    return rgba.view(uint8).reshape(data_array.shape + (4,))
+                take(lut, data_array,
+                     out=out.view(uint32).reshape(data_array.shape))
+                return out
+
+        args = (data_array, self.steps, self.range.low, self.range.high,
+                self._red_lut_uint8, self._green_lut_uint8,
                 self._blue_lut_uint8, self._alpha_lut_uint8)
+        if data_array.size >= self.parallel_threshold:
+            rgba = map_colors_uint8_parallel(*args, out=out,
+                                             num_threads=self.num_threads)
+        else:
+            rgba = map_colors_uint8(*args, out=out)
 
         return rgba
 
@@ -292,6 +350,30 @@ class ColorMapper(AbstractColormap):
     # Private methods
     #------------------------------------------------------------------------
 
+    def _get_integer_lut(self, dtype, size):
+        """ Returns the packed RGBA lookup table for an unsigned integer dtype.
+
+        The table holds one uint32 per representable value of *dtype*.  It is
+        only built when *size* is at least as large as the table itself, so
+        that small arrays do not pay for a full 16-bit table; returns None in
+        that case.
+        """
+        low = self.range.low
+        high = self.range.high
+        cached = self._integer_luts.get(dtype)
+        if cached is not None and cached[0] == low and cached[1] == high:
+            return cached[2]
+
+        n = 1 << (8 * dtype.itemsize)
+        if size < n:
+            return None
+
+        rgba = map_colors_uint8(arange(n, dtype=dtype), self.steps, low, high,
+                self._red_lut_uint8, self._green_lut_uint8,
+                self._blue_lut_uint8, self._alpha_lut_uint8)
+        lut = rgba.view(uint32).reshape(n)
+        self._integer_luts[dtype] = (low, high, lut)
+        return lut
 
     def _get_color_bands(self):
         """ Gets the color bands array.
@@ -309,29 +391,58 @@ class ColorMapper(AbstractColormap):
 
     def _recalculate(self):
         """ Recalculates the mapping arrays.
-        """
 
-        self._red_lut = self._make_mapping_array(
-            self.steps, self._segmentdata['red']
-        )
-        self._green_lut = self._make_mapping_array(
-            self.steps, self._segmentdata['green']
-        )
-        self._blue_lut = self._make_mapping_array(
-            self.steps, self._segmentdata['blue']
-        )
-        self._alpha_lut = self._make_mapping_array(
-            self.steps, self._segmentdata['alpha']
-        )
-        self._red_lut_uint8 = (self._red_lut * 255.0).astype('uint8')
-        self._green_lut_uint8 = (self._green_lut * 255.0).astype('uint8')
-        self._blue_lut_uint8 = (self._blue_lut * 255.0).astype('uint8')
-        self._alpha_lut_uint8 = (self._alpha_lut * 255.0).astype('uint8')
+        Mappers with the same segment data and number of steps share the
+        same (read-only) mapping arrays, which are only computed once.
+        """
+        key = self._lut_cache_key()
+        luts = _lut_cache.pop(key, None) if key is not None else None
+        if luts is None:
+            luts = self._make_luts()
+        if key is not None:
+            # Re-inserting marks the entry as the most recently used.
+            _lut_cache[key] = luts
+            if len(_lut_cache) > LUT_CACHE_SIZE:
+                _lut_cache.popitem(last=False)
+
+        (self._red_lut, self._green_lut, self._blue_lut, self._alpha_lut,
+         self._red_lut_uint8, self._green_lut_uint8, self._blue_lut_uint8,
+         self._alpha_lut_uint8) = luts
+        self._integer_luts = {}
         self.updated = True
         self._dirty = False
 
         return
 
+    def _lut_cache_key(self):
+        """ Returns the key of the mapping arrays in the shared cache, or None
+        if the segment data cannot be used as a key.
+        """
+        key = [self.steps]
+        for name in ("red", "green", "blue", "alpha"):
+            try:
+                data = asarray(self._segmentdata[name], dtype=float)
+            except (TypeError, ValueError):
+                return None
+            key.append((data.shape, data.tobytes()))
+        return tuple(key)
+
+    def _make_luts(self):
+        """ Computes the float32 and uint8 mapping arrays of each channel.
+
+        Returns a tuple of read-only arrays: the red, green, blue and alpha
+        float32 arrays followed by the uint8 ones.
+        """
+        float_luts = [
+            self._make_mapping_array(self.steps, self._segmentdata[name])
+            for name in ("red", "green", "blue", "alpha")
+        ]
+        uint8_luts = [(lut * 255.0).astype('uint8') for lut in float_luts]
+        luts = tuple(float_luts + uint8_luts)
+        for lut in luts:
+            lut.flags.writeable = False
+        return luts
+
     #### matplotlib ####
     def _make_mapping_array(self, n, data):
         """Creates an N-element 1-D lookup table
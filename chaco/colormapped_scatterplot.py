@@ -16,6 +16,7 @@ from traitsui.api import Item, RangeEditor
 from array_data_source import ArrayDataSource
 from base import left_shift, right_shift
 from abstract_colormap import AbstractColormap
+from frame_budget import LOW_DETAIL, NO_ANTIALIAS, draw_level
 from scatterplot import ScatterPlot, ScatterPlotView
 
 
@@ -74,6 +75,10 @@ class ColormappedScatterPlot(ScatterPlot):
     # This mapping is only valid if **_cache_valid** is True.
     _index_bands = Dict()
 
+    # The cached data points include the color data, so they are always
+    # gathered again when the mappers change.
+    _reuse_gathered_points = False
+
     # Traits UI View for customizing the plot. Overrides the ScatterPlot value.
     traits_view = ColormappedScatterPlotView()
 
@@ -180,12 +185,20 @@ class ColormappedScatterPlot(ScatterPlot):
         else:
             batch_capable = False
 
+        level = draw_level(self)
+        if self.detail_level >= NO_ANTIALIAS:
+            points = self._deduplicate(points)
+        if level >= LOW_DETAIL:
+            points = self._decimate(points, level)
+
         if self.render_method == 'auto':
-            method = self._calc_render_method(len(points))
+            method = self._calc_render_method(len(points), level)
         else:
             method = self.render_method
 
         with gc:
+            if level >= NO_ANTIALIAS:
+                gc.set_antialias(False)
             if method == 'bruteforce' or (not batch_capable):
                 self._render_bruteforce(gc, points)
             elif method == 'banded':
@@ -249,10 +262,14 @@ class ColormappedScatterPlot(ScatterPlot):
         self._cache_valid = True
         return
 
-    def _calc_render_method(self, numpoints):
+    def _calc_render_method(self, numpoints, level=0):
         """ Returns a string indicating the render method.
+
+        Below full detail, the markers are drawn band by band however few
+        they are.
         """
-        if numpoints > 1000 and isinstance(self.marker_size, float):
+        if (numpoints > 1000 or level >= NO_ANTIALIAS) and \
+                isinstance(self.marker_size, float):
             return 'banded'
         else:
             return "bruteforce"
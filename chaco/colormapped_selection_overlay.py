@@ -1,6 +1,6 @@
 """ Defines the ColormappedSelectionOverlay class.
 """
-from numpy import logical_and
+from operator import and_
 
 # Enthought library imports
 from traits.api import Any, Bool, Float, Instance, Property, Enum
@@ -8,6 +8,7 @@ from traits.api import Any, Bool, Float, Instance, Property, Enum
 # Local imports
 from abstract_overlay import AbstractOverlay
 from colormapped_scatterplot import ColormappedScatterPlot
+from selection import as_selection
 
 class ColormappedSelectionOverlay(AbstractOverlay):
     """
@@ -74,9 +75,12 @@ class ColormappedSelectionOverlay(AbstractOverlay):
             mask = (data_pts >= low) & (data_pts <= high)
 
         elif self.selection_type == 'mask':
-            mask = reduce(logical_and, datasource.metadata["selection_masks"])
-            if sum(mask)<2:
+            n = len(datasource.get_data())
+            selection = reduce(and_, [as_selection(mask, n) for mask in
+                                      datasource.metadata["selection_masks"]])
+            if selection.count() < 2:
                 return
+            mask = selection.to_mask()
 
         datasource.set_mask(mask)
 
@@ -14,6 +14,7 @@ from traits.api import Bool, CFloat, Enum, Float, Property, Trait, \
 # Local relative imports
 from base import arg_find_runs
 from base_data_range import BaseDataRange
+from batch_updates import defer_refresh
 from ticks import heckbert_interval
 
 
@@ -375,16 +376,23 @@ class DataRange1D(BaseDataRange):
     def _sources_items_changed(self, event):
         self.refresh()
         for source in event.removed:
-            source.on_trait_change(self.refresh, "data_changed", remove=True)
+            source.on_trait_change(self._source_data_changed, "data_changed",
+                                   remove=True)
         for source in event.added:
-            source.on_trait_change(self.refresh, "data_changed")
+            source.on_trait_change(self._source_data_changed, "data_changed")
 
     def _sources_changed(self, old, new):
         self.refresh()
         for source in old:
-            source.on_trait_change(self.refresh, "data_changed", remove=True)
+            source.on_trait_change(self._source_data_changed, "data_changed",
+                                   remove=True)
         for source in new:
-            source.on_trait_change(self.refresh, "data_changed")
+            source.on_trait_change(self._source_data_changed, "data_changed")
+
+    def _source_data_changed(self):
+        # Coalesce the refreshes caused by data changes within update batches.
+        if not defer_refresh(self):
+            self.refresh()
 
     #------------------------------------------------------------------------
     # Serialization interface
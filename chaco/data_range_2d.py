@@ -10,6 +10,7 @@ from traits.api import Any, Bool, CFloat, Instance, Property, Trait, \
 
 # Local relative imports
 from base_data_range import BaseDataRange
+from batch_updates import defer_refresh
 from data_range_1d import DataRange1D
 
 
@@ -205,9 +206,10 @@ class DataRange2D(BaseDataRange):
 
     def _sources_items_changed(self, event):
         for source in event.removed:
-            source.on_trait_change(self.refresh, "data_changed", remove=True)
+            source.on_trait_change(self._source_data_changed, "data_changed",
+                                   remove=True)
         for source in event.added:
-            source.on_trait_change(self.refresh, "data_changed")
+            source.on_trait_change(self._source_data_changed, "data_changed")
         # the _xdata and _ydata of the sources may be created anew on every
         # access, so we can't just add/delete from _xrange and _yrange sources
         # based on object identity. So recreate lists each time:
@@ -217,9 +219,10 @@ class DataRange2D(BaseDataRange):
 
     def _sources_changed(self, old, new):
         for source in old:
-            source.on_trait_change(self.refresh, "data_changed", remove=True)
+            source.on_trait_change(self._source_data_changed, "data_changed",
+                                   remove=True)
         for source in new:
-            source.on_trait_change(self.refresh, "data_changed")
+            source.on_trait_change(self._source_data_changed, "data_changed")
         # the _xdata and _ydata of the sources may be created anew on every
         # access, so we can't just add/delete from _xrange and _yrange sources
         # based on object identity. So recreate lists each time:
@@ -227,6 +230,11 @@ class DataRange2D(BaseDataRange):
         self._yrange.sources = [s._ydata for s in self.sources]
         self.refresh()
 
+    def _source_data_changed(self):
+        # Coalesce the refreshes caused by data changes within update batches.
+        if not defer_refresh(self):
+            self.refresh()
+
     @on_trait_change("_xrange.updated,_yrange.updated")
     def _subranges_updated(self):
         self.updated = True
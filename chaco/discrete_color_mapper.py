@@ -1,5 +1,5 @@
 
-from numpy import asarray, floor, ones
+from numpy import asarray, floor, ones, take
 
 from traits.api import Array, Str, on_trait_change
 from chaco.abstract_colormap import AbstractColormap
@@ -47,9 +47,9 @@ class DiscreteColorMapper(AbstractColormap):
         palette = colormapper.color_bands
         return cls(palette=palette, **traits)
 
-    def map_screen(self, data):
+    def map_screen(self, data, out=None):
         """ Maps an array of data to an array of colors """
-        return self._palette[self.map_index(data)]
+        return take(self._palette, self.map_index(data), axis=0, out=out)
 
     def map_index(self, data):
         """ Maps an array of data to an array of indexes into the palette """
@@ -57,9 +57,10 @@ class DiscreteColorMapper(AbstractColormap):
         index = index.clip(0, len(self.palette)-1).astype(int, copy=False)
         return index
 
-    def map_uint8(self, data):
+    def map_uint8(self, data, out=None):
         """ Maps an array of data to an array of colors """
-        return self._uint8_palette[self.map_index(data)]
+        return take(self._uint8_palette, self.map_index(data), axis=0,
+                    out=out)
 
     def reverse_colormap(self):
         """ Reverses the palette of this colormap. """
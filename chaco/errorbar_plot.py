@@ -36,6 +36,10 @@ class ErrorBarPlot(LinePlot):
     # Override the inherited trait definition
     _cached_data_pts = Any
 
+    # The cached data points include the error bounds, so they are always
+    # gathered again when the mappers change.
+    _reuse_gathered_points = False
+
     def map_screen(self, data_array):
         """ data_array can be Nx2 or Nx3.  In the former case, each row is
         treated as (index, value), and this method returns screen X and Y
@@ -0,0 +1,252 @@
+""" Scheduling of the level of detail of renderers to fit a frame budget.
+
+Plot containers whose **frame_budget** is set draw their renderers at the
+levels of detail that let each frame be drawn within that many seconds.  The
+container's FrameBudgetScheduler measures how long each renderer takes to
+draw.  After each frame drawn over the budget, it lowers the detail of the
+costliest renderers until the estimated time of the next frame fits the
+budget; after frames drawn well within it, it raises the detail of one
+renderer by a level.
+
+Renderers are drawn at these levels of detail, stored in their
+**detail_level** trait:
+
+FULL_DETAIL (0)
+    Drawn normally.
+NO_ANTIALIAS (1)
+    Drawn without antialiasing.  Scatter plots draw only the last marker
+    drawn at each pixel, and color-mapped scatter plots draw their markers
+    color band by color band.
+LOW_DETAIL (2)
+    Like NO_ANTIALIAS, and drawn as at low quality during interactions (see
+    chaco.interaction): line plots are downsampled into buckets of
+    **interaction_bucket_width** pixels, scatter plots draw at most
+    **interaction_max_points** markers and image plots use nearest-neighbor
+    interpolation.
+3 to MAX_DETAIL_LEVEL
+    Like LOW_DETAIL, with buckets twice as wide and half as many markers at
+    each level.
+
+Once no frame was drawn for RESTORE_DELAY seconds, the scheduler restores
+the detail of the renderers progressively, redrawing them a level more
+detailed every RESTORE_DELAY seconds until they are drawn at full detail.
+The levels that fit the budget are kept, and applied again as soon as an
+interaction starts.
+"""
+from time import time
+
+# Local relative imports
+from abstract_plot_renderer import AbstractPlotRenderer
+from interaction import call_after, draw_low_quality, interacting
+
+
+# The levels of detail of renderers.
+FULL_DETAIL = 0
+NO_ANTIALIAS = 1
+LOW_DETAIL = 2
+MAX_DETAIL_LEVEL = 4
+
+# The factor by which the time a renderer takes to draw is estimated to drop
+# at each lower level of detail.
+LEVEL_COST_FACTOR = 2.0
+
+# The detail of a renderer is raised after a frame only if the next frame is
+# then estimated to take at most this fraction of the budget.
+RAISE_THRESHOLD = 0.75
+
+# The number of seconds without frames after which the plots are idle, and
+# between the steps that restore their detail.
+RESTORE_DELAY = 0.25
+
+
+def draw_level(component):
+    """ Returns the level of detail at which *component* should be drawn now:
+    its **detail_level**, or LOW_DETAIL if it is drawn at low quality during
+    an interaction (see chaco.interaction.draw_low_quality()).
+    """
+    level = component.detail_level
+    if draw_low_quality(component):
+        level = max(level, LOW_DETAIL)
+    return level
+
+
+class FrameBudgetScheduler(object):
+    """ Chooses the levels of detail of the renderers in a plot container, and
+    in its nested containers, so that the container draws each frame within
+    its **frame_budget**.
+
+    BasePlotContainer creates its scheduler when its **frame_budget** is set,
+    and calls begin_frame() and end_frame() around each of its draws.
+    """
+
+    def __init__(self, container):
+        self.container = container
+        # Maps the renderers to the levels of detail that fit the budget.
+        self.levels = {}
+        # Maps the renderers to the (level, seconds) of their last draw.
+        self._costs = {}
+        # The time at which the last frame that was not drawn to restore the
+        # detail of the renderers ended.
+        self._last_frame_time = 0.0
+        # Is the frame being drawn to restore the detail of the renderers?
+        self._restoring = False
+        self._restore_timer = None
+
+    def begin_frame(self):
+        """ Prepares the renderers for a frame.
+
+        During interactions, the renderers are drawn at the levels of detail
+        that fit the budget, even if they were restored since.
+        """
+        renderers = self._renderers()
+        for renderer in renderers:
+            renderer.last_render_time = 0.0
+        if interacting() and not self._restoring:
+            for renderer in renderers:
+                renderer.detail_level = max(renderer.detail_level,
+                                            self.levels.get(renderer, 0))
+
+    def end_frame(self):
+        """ Records how long the renderers took to draw, and chooses the
+        levels of detail of the next frame.
+        """
+        renderers = self._renderers()
+        costs = {}
+        for renderer in renderers:
+            if renderer.last_render_time > 0.0:
+                costs[renderer] = (self._drawn_level(renderer),
+                                   renderer.last_render_time)
+            elif renderer in self._costs:
+                costs[renderer] = self._costs[renderer]
+        self._costs = costs
+        self.levels = dict((renderer, self.levels.get(renderer, 0))
+                           for renderer in renderers)
+
+        if self._restoring:
+            self._restoring = False
+        else:
+            self._last_frame_time = time()
+            self._fit_budget(renderers)
+            container = self.container
+            if interacting() or \
+                    container.last_draw_time > container.frame_budget:
+                for renderer in renderers:
+                    renderer.detail_level = self.levels[renderer]
+
+        if any(renderer.detail_level > FULL_DETAIL
+               for renderer in renderers):
+            self._schedule_restore()
+
+    def reset(self):
+        """ Draws all the renderers at full detail again, and forgets the
+        levels that fit the budget.
+        """
+        for renderer in self._renderers():
+            renderer.detail_level = FULL_DETAIL
+        self.levels = {}
+        self._costs = {}
+
+    #------------------------------------------------------------------------
+    # Private methods
+    #------------------------------------------------------------------------
+
+    def _renderers(self, container=None):
+        """ Returns the visible renderers in *container*, or in the
+        scheduler's container, and in their nested containers.
+        """
+        if container is None:
+            container = self.container
+        renderers = []
+        for component in container.components:
+            if not component.visible:
+                continue
+            if isinstance(component, AbstractPlotRenderer):
+                renderers.append(component)
+            elif hasattr(component, "components"):
+                renderers.extend(self._renderers(component))
+        return renderers
+
+    def _drawn_level(self, renderer):
+        level = renderer.detail_level
+        if interacting() and renderer.interaction_quality == "low":
+            level = max(level, LOW_DETAIL)
+        return level
+
+    def _estimate(self, renderer, level):
+        """ Returns the estimated number of seconds that *renderer* takes to
+        draw at *level*.
+        """
+        if renderer not in self._costs:
+            return 0.0
+        measured_level, seconds = self._costs[renderer]
+        return seconds * LEVEL_COST_FACTOR ** (measured_level - level)
+
+    def _fit_budget(self, renderers):
+        """ Lowers the levels of detail of the costliest renderers until the
+        next frame is estimated to fit the budget, or raises the level of the
+        cheapest degraded renderer if the frame is estimated to stay well
+        within it.
+        """
+        budget = self.container.frame_budget
+        levels = self.levels
+        drawn = sum(renderer.last_render_time for renderer in renderers)
+        total = max(self.container.last_draw_time - drawn, 0.0)
+        estimates = {}
+        for renderer in renderers:
+            estimates[renderer] = self._estimate(renderer, levels[renderer])
+            total += estimates[renderer]
+
+        if total > budget:
+            while total > budget:
+                candidates = [renderer for renderer in renderers
+                              if levels[renderer] < MAX_DETAIL_LEVEL and
+                              estimates[renderer] > 0.0]
+                if not candidates:
+                    break
+                renderer = max(candidates, key=estimates.get)
+                levels[renderer] += 1
+                saved = estimates[renderer] * (1.0 - 1.0 / LEVEL_COST_FACTOR)
+                estimates[renderer] -= saved
+                total -= saved
+        else:
+            candidates = [renderer for renderer in renderers
+                          if levels[renderer] > FULL_DETAIL]
+            if candidates:
+                renderer = min(candidates, key=estimates.get)
+                added = estimates[renderer] * (LEVEL_COST_FACTOR - 1.0)
+                if total + added <= budget * RAISE_THRESHOLD:
+                    levels[renderer] -= 1
+
+    def _schedule_restore(self):
+        if self._restore_timer is not None:
+            return
+        self._restore_timer = call_after(RESTORE_DELAY,
+                                         self._restore_timer_fired)
+        if self._restore_timer is None:
+            # Without a GUI toolkit there are no timers, and no interactions
+            # either: the next frame is drawn at full detail.
+            for renderer in self._renderers():
+                renderer.detail_level = FULL_DETAIL
+
+    def _restore_timer_fired(self):
+        self._restore_timer = None
+        idle = time() - self._last_frame_time
+        if interacting() or idle < RESTORE_DELAY:
+            delay = RESTORE_DELAY if interacting() else RESTORE_DELAY - idle
+            self._restore_timer = call_after(delay, self._restore_timer_fired)
+            if self._restore_timer is not None:
+                return
+        self._restore_step()
+
+    def _restore_step(self):
+        """ Redraws the degraded renderers a level more detailed.
+        """
+        restored = False
+        for renderer in self._renderers():
+            if renderer.detail_level > FULL_DETAIL:
+                renderer.detail_level -= 1
+                renderer.invalidate_draw()
+                restored = True
+        if restored:
+            self._restoring = True
+            self.container.invalidate_and_redraw()
@@ -25,6 +25,7 @@ from kiva.agg import GraphicsContextArray
 # Local relative imports
 from base_2d_plot import Base2DPlot
 from image_utils import trim_screen_rect
+from frame_budget import LOW_DETAIL, draw_level
 
 try:
     # InterpolationQuality required for Quartz backend only (requires OSX).
@@ -148,7 +149,11 @@ class ImagePlot(Base2DPlot):
             # Translate the origin back to its original position.
             gc.translate_ctm(-x_center, -y_center)
 
-            with self._temporary_interp_setting(gc):
+            if draw_level(self) >= LOW_DETAIL:
+                interpolation = "nearest"
+            else:
+                interpolation = self.interpolation
+            with self._temporary_interp_setting(gc, interpolation):
                 gc.draw_image(self._cached_image, self._cached_dest_rect)
 
     def map_index(self, screen_pt, threshold=0.0, outside_returns_none=True,
@@ -182,10 +187,12 @@ class ImagePlot(Base2DPlot):
         gc.rotate_ctm(pi/2)
 
     @contextmanager
-    def _temporary_interp_setting(self, gc):
+    def _temporary_interp_setting(self, gc, interpolation=None):
+        if interpolation is None:
+            interpolation = self.interpolation
         if hasattr(gc, "set_interpolation_quality"):
             # Quartz uses interpolation setting on the destination GC.
-            interp_quality = QUARTZ_INTERP_QUALITY[self.interpolation]
+            interp_quality = QUARTZ_INTERP_QUALITY[interpolation]
             gc.set_interpolation_quality(interp_quality)
             yield
         elif hasattr(gc, "set_image_interpolation"):
@@ -195,7 +202,7 @@ class ImagePlot(Base2DPlot):
             old_interp = self._cached_image.get_image_interpolation()
             set_interp = self._cached_image.set_image_interpolation
             try:
-                set_interp(self.interpolation)
+                set_interp(interpolation)
                 yield
             finally:
                 set_interp(old_interp)
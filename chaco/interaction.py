@@ -0,0 +1,135 @@
+""" Signalling of the interactive pans and zooms of plots.
+
+While the user drags a plot or zooms it with the mouse wheel, its ranges
+change on every mouse event, and each change redraws the plots.  Tools
+signal such interactions with begin_interaction() and end_interaction(), or
+with step_interaction() for interactions made of separate events, such as
+mouse wheel zooms, which end when no step follows for SETTLE_DELAY seconds.
+
+While an interaction is in progress, renderers whose **interaction_quality**
+is "low" draw faster, coarser versions of themselves: line plots downsample
+their data more, scatter plots draw fewer markers and image plots use
+nearest-neighbor interpolation, all without antialiasing.  The renderers that
+were drawn at low quality are redrawn at full quality when the last
+interaction ends.
+"""
+from collections import OrderedDict
+from time import time
+import weakref
+
+
+# The number of seconds after the last step of a stepwise interaction at
+# which the interaction ends.
+SETTLE_DELAY = 0.25
+
+# Maps weak references to the sources of the interactions in progress to the
+# time at which they end, or None if they are ended explicitly.  A source that
+# is deleted during its interaction ends it.
+_interactions = OrderedDict()
+
+# The components drawn at low quality during the current interactions.
+_low_quality_components = OrderedDict()
+
+# The timer that ends the stepwise interactions, if one is running.
+_settle_timer = None
+
+
+def begin_interaction(source):
+    """ Signals that *source*, typically a tool, starts changing plots
+    interactively, until end_interaction(source) is called.
+    """
+    _interactions[_source_ref(source)] = None
+
+
+def end_interaction(source):
+    """ Signals that the interaction of *source* is over.
+
+    The components that were drawn at low quality are redrawn when no other
+    interaction is in progress.
+    """
+    _end(weakref.ref(source))
+
+
+def step_interaction(source):
+    """ Signals one step of an interaction of *source* that has no explicit
+    end, such as a mouse wheel zoom.
+
+    The interaction ends SETTLE_DELAY seconds after its last step.  This
+    requires a GUI toolkit with timers; without one, the step is ignored.
+    """
+    global _settle_timer
+    if _settle_timer is None:
+        _settle_timer = call_after(SETTLE_DELAY, _end_settled_interactions)
+        if _settle_timer is None:
+            return
+    _interactions[_source_ref(source)] = time() + SETTLE_DELAY
+
+
+def interacting():
+    """ Returns whether plots are being changed interactively.
+    """
+    return len(_interactions) > 0
+
+
+def draw_low_quality(component):
+    """ Returns whether *component* should be drawn at low quality now, in
+    which case it is redrawn at full quality when the interactions end.
+    """
+    if component.interaction_quality != "low" or not _interactions:
+        return False
+    _low_quality_components[component] = None
+    return True
+
+
+def _source_ref(source):
+    """ Returns a weak reference to *source* that ends its interaction when
+    *source* is deleted.
+    """
+    return weakref.ref(source, _end)
+
+
+def _end(ref):
+    """ Ends the interaction of the source referenced by *ref*.
+    """
+    if _interactions.pop(ref, False) is not False and not _interactions:
+        _settle()
+
+
+def _settle():
+    """ Redraws the components that were drawn at low quality.
+    """
+    while _low_quality_components:
+        component, _ = _low_quality_components.popitem(last=False)
+        component.invalidate_and_redraw()
+
+
+def _end_settled_interactions():
+    """ Ends the stepwise interactions whose last step is SETTLE_DELAY
+    seconds old, and restarts the timer if some are still in progress.
+    """
+    global _settle_timer
+    _settle_timer = None
+    now = time()
+    pending = [deadline for deadline in _interactions.values()
+               if deadline is not None and deadline > now]
+    if pending:
+        _settle_timer = call_after(min(pending) - now,
+                                   _end_settled_interactions)
+    for ref, deadline in list(_interactions.items()):
+        if deadline is not None and (deadline <= now or
+                                     _settle_timer is None):
+            _end(ref)
+
+
+def call_after(delay, callback):
+    """ Calls *callback* once, after *delay* seconds, from the GUI event
+    loop.
+
+    Returns the timer, or None if the GUI toolkit has no timers.
+    """
+    try:
+        from pyface.timer.api import do_after
+        return do_after(max(int(delay * 1000), 1), callback)
+    except Exception:
+        # No GUI toolkit, or a toolkit without timers.
+        return None
@@ -4,7 +4,7 @@ into a 1-D output space.
 """
 
 # Major library imports
-from numpy import array, empty, ndarray
+from numpy import add, array, empty, multiply, ndarray, subtract
 
 # Enthought library imports
 from traits.api import Bool, Float
@@ -37,21 +37,35 @@ class LinearMapper(Base1DMapper):
     # Public methods
     #------------------------------------------------------------------------
 
-    def map_screen(self, data_array):
-        """ map_screen(data_array) -> screen_array
+    def map_screen(self, data_array, out=None):
+        """ map_screen(data_array, out=None) -> screen_array
 
         Overrides AbstractMapper. Maps values from data space into screen space.
+
+        If *out* is given, it must be an array of the same shape as
+        *data_array*; the screen values are written into it and it is
+        returned.  Otherwise arrays are mapped into a new array of
+        **screen_dtype**.
         """
         self._compute_scale()
         if self._null_data_range:
             if isinstance(data_array, (tuple, list, ndarray)):
-                x = empty(data_array.shape)
-                x.fill(self.low_pos)
-                return x
+                if out is None:
+                    out = empty(data_array.shape, dtype=self.screen_dtype)
+                out.fill(self.low_pos)
+                return out
             else:
                 return array([self.low_pos])
-        else:
+        elif out is None and not isinstance(data_array, ndarray):
             return (data_array - self.range.low) * self._scale + self.low_pos
+        else:
+            # Compute in place so that only the result array is allocated.
+            if out is None:
+                out = empty(data_array.shape, dtype=self.screen_dtype)
+            subtract(data_array, self.range.low, out)
+            multiply(out, self._scale, out)
+            add(out, self.low_pos, out)
+            return out
 
     def map_data(self, screen_val):
         """ map_data(screen_val) -> data_val
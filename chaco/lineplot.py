@@ -12,12 +12,14 @@ from numpy import argsort, array, concatenate, inf, invert, isnan, \
 
 # Enthought library imports
 from enable.api import black_color_trait, ColorTrait, LineStyle
-from traits.api import Enum, Float, List, Str, Property, Tuple, cached_property
+from traits.api import Any, Enum, Float, Int, List, Str, Property, \
+    Tuple, cached_property
 from traitsui.api import Item, View
 
 # Local relative imports
 from base import arg_find_runs, arg_true_runs, reverse_map_1d, intersect_range
 from base_xy_plot import BaseXYPlot
+from frame_budget import LOW_DETAIL, NO_ANTIALIAS, draw_level
 
 
 
@@ -67,6 +69,11 @@ class LinePlot(BaseXYPlot):
     #     point.  Also called a "right angle plot".
     render_style = Enum("connectedpoints", "hold", "connectedhold")
 
+    # The width in pixels of the buckets into which the line is downsampled
+    # when it is drawn at low quality (see **interaction_quality**), or at
+    # a low level of detail (see **detail_level**).
+    interaction_bucket_width = Int(4)
+
     # Traits UI View for customizing the plot.
     traits_view = View(Item("color", style="custom"), "line_width", "line_style",
                        buttons=["OK", "Cancel"])
@@ -83,6 +90,18 @@ class LinePlot(BaseXYPlot):
     # Cached list of non-NaN arrays of (x,y) screen-space points.
     _cached_screen_pts = List
 
+    # The gathered points are only the visible ones, so they can be reused
+    # while all the data is visible.
+    _reuse_gathered_points = True
+
+    # The downsampled points prepared in the background along with the
+    # gathered points, as a tuple (gathered points, number of buckets,
+    # downsampled points), or None.
+    _prepared_downsample = Any
+
+    # The level of detail at which the plot is being drawn.
+    _level = Int(0)
+
 
     def hittest(self, screen_pt, threshold=7.0, return_distance = False):
         """
@@ -215,10 +234,15 @@ class LinePlot(BaseXYPlot):
 
     def get_screen_points(self):
         self._gather_points()
-        if self.use_downsampling:
-            return self._downsample()
+        if self._level >= LOW_DETAIL:
+            screen_pts = self._downsample_low_quality()
+        elif self.use_downsampling:
+            screen_pts = self._downsample()
         else:
-            return [self.map_screen(ary) for ary in self._cached_data_pts]
+            screen_pts = self._reuse_screen_points(
+                (self._cached_data_pts,),
+                lambda: [self.map_screen(ary) for ary in self._cached_data_pts])
+        return self._own_screen_points(screen_pts)
 
     #------------------------------------------------------------------------
     # Private methods; implements the BaseXYPlot stub methods
@@ -265,44 +289,108 @@ class LinePlot(BaseXYPlot):
             #if selection is not None and type(selection) in (ndarray, list) and \
             #        len(selection) > 0:
 
-            # Split the index and value raw data into non-NaN chunks
-            mask = invert(isnan(value)) & invert(isnan(index))
-
-            # throw out index and value points outside the visible region
-            mask = intersect_range(index, self.index_range.low,
-                                   self.index_range.high, mask)
-            mask = intersect_range(value, self.value_range.low,
-                                   self.value_range.high, mask)
+            bounds = (self.index_range.low, self.index_range.high,
+                      self.value_range.low, self.value_range.high)
+            buckets = None
+            if self.use_downsampling and self.prepare_in_background:
+                m = self.index_mapper
+                buckets = int(m.high_pos - m.low_pos)
+
+            def prepare():
+                points = self._visible_points(index, value, *bounds)
+                if buckets is None:
+                    return points, None
+                return points, self._downsample_points(points, buckets)
+
+            prepared = self._prepare((self.index.get_data(),
+                                      self.value.get_data(), buckets) + bounds,
+                                     prepare)
+            if prepared is None:
+                # Keep drawing the previous points until they are ready.
+                return
+            (points, downsampled), self._cache_valid = prepared
+            self._cached_data_pts = points
+            if downsampled is not None:
+                self._prepared_downsample = (points, buckets, downsampled)
+            self._screen_cache_valid = False
+
+    @staticmethod
+    def _visible_points(index, value, index_low, index_high, value_low,
+                        value_high):
+        """ Returns the list of the arrays of (index, value) points of the
+        runs of non-NaN points within the ranges.
+        """
+        # Split the index and value raw data into non-NaN chunks
+        mask = invert(isnan(value)) & invert(isnan(index))
 
-            points = [column_stack([index[start:end], value[start:end]])
-                      for start, end in arg_true_runs(mask)]
+        # throw out index and value points outside the visible region
+        mask = intersect_range(index, index_low, index_high, mask)
+        mask = intersect_range(value, value_low, value_high, mask)
 
-            self._cached_data_pts = points
-            self._cache_valid = True
+        return [column_stack([index[start:end], value[start:end]])
+                for start, end in arg_true_runs(mask)]
 
     def _downsample(self):
         if not self._screen_cache_valid:
             m = self.index_mapper
             delta_screen = int(m.high_pos - m.low_pos)
-            if delta_screen == 0:
-                downsampled = []
-            else:
-                # TODO: implement other downsampling methods
-                from chaco.downsample.lttb import largest_triangle_three_buckets
-                downsampled = [largest_triangle_three_buckets(p, delta_screen)
-                               for p in self._cached_data_pts]
-
-            self._cached_screen_pts = [self.map_screen(p) for p in downsampled]
+            # The downsampled points only depend on the data and on the
+            # screen width, so a pan or zoom can reuse them.
+            self._cached_screen_pts = self._reuse_screen_points(
+                (self._cached_data_pts, delta_screen),
+                lambda: self._downsample_and_map(delta_screen))
             self._screen_cache_valid = True
 
         return self._cached_screen_pts
 
+    def _downsample_low_quality(self):
+        """ Returns the screen points downsampled into buckets of
+        **interaction_bucket_width** pixels, twice as wide at each level of
+        detail above LOW_DETAIL.
+        """
+        m = self.index_mapper
+        bucket_width = max(self.interaction_bucket_width, 1) << \
+            (self._level - LOW_DETAIL)
+        n_buckets = int(abs(m.high_pos - m.low_pos)) // bucket_width
+        return self._reuse_screen_points(
+            (self._cached_data_pts, n_buckets, "low quality"),
+            lambda: self._downsample_and_map(n_buckets))
+
+    def _downsample_and_map(self, delta_screen):
+        prepared = self._prepared_downsample
+        if prepared is not None and prepared[0] is self._cached_data_pts \
+                and prepared[1] == delta_screen:
+            downsampled = prepared[2]
+        else:
+            downsampled = self._downsample_points(self._cached_data_pts,
+                                                  delta_screen)
+        return [self.map_screen(p) for p in downsampled]
+
+    @staticmethod
+    def _downsample_points(points, delta_screen):
+        """ Returns the arrays of *points* downsampled into *delta_screen*
+        buckets.
+        """
+        if delta_screen == 0:
+            return []
+        # TODO: implement other downsampling methods
+        from chaco.downsample.lttb import largest_triangle_three_buckets
+        return [largest_triangle_three_buckets(p, delta_screen)
+                for p in points]
+
+    def _draw_component(self, gc, view_bounds=None, mode="normal"):
+        self._level = draw_level(self)
+        try:
+            super(LinePlot, self)._draw_component(gc, view_bounds, mode)
+        finally:
+            self._level = 0
+
     def _render(self, gc, points, selected_points=None):
         if len(points) == 0:
             return
 
         with gc:
-            gc.set_antialias(True)
+            gc.set_antialias(self._level < NO_ANTIALIAS)
             gc.clip_to_rect(self.x, self.y, self.width, self.height)
 
             render_method_dict = {
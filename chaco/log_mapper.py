@@ -1,11 +1,14 @@
 """ Defines the LogMapper and InvalidDataRangeException classes.
 """
+# Standard library imports
+import weakref
+
 # Major library imports
-from numpy import array, isnan, log, log10, exp, zeros, sometrue,\
-    floor, ceil, ndarray
+from numpy import add, array, divide, empty, isnan, log, log10, exp, \
+    multiply, sometrue, subtract, floor, ceil, ndarray
 
 # Enthought library imports
-from traits.api import Bool, Float
+from traits.api import Any, Bool, Float, Int
 
 #Local relative imports
 from base_1d_mapper import Base1DMapper
@@ -24,6 +27,13 @@ class LogMapper(Base1DMapper):
     # The value to map when asked to map values <= LOG_MINIMUM to screen space.
     fill_value = Float(1.0)
 
+    # Whether to keep the logarithm of the last mapped array, so that mapping
+    # the same data again after a pan or zoom only needs a linear transform.
+    # The cached values are discarded when a data source of the range fires
+    # data_changed; arrays modified in place without firing that event must
+    # not be mapped with this enabled.
+    cache_log_data = Bool(True)
+
     #------------------------------------------------------------------------
     # Private traits
     #------------------------------------------------------------------------
@@ -35,35 +45,47 @@ class LogMapper(Base1DMapper):
     _null_screen_range = Bool(False)
     _null_data_range = Bool(False)
 
+    # Incremented whenever the data of one of the range's sources changes.
+    _data_version = Int(0)
+
+    # The cached logarithm: a tuple (key, weakref to the array owning the
+    # data, log values), or None.
+    _log_cache = Any
+
     #------------------------------------------------------------------------
     # Public methods
     #------------------------------------------------------------------------
 
-    def map_screen(self, data_array):
-        """ map_screen(data_array) -> screen_array
+    def map_screen(self, data_array, out=None):
+        """ map_screen(data_array, out=None) -> screen_array
 
         Overrides AbstractMapper. Maps values from data space to screen space.
+
+        If *out* is given, it must be an array of the same shape as
+        *data_array*; the screen values are written into it and it is
+        returned.  Otherwise a new array of **screen_dtype** is returned.
         """
         # Ensure that data_array is actually an array.
         if not isinstance(data_array, ndarray):
             data_array = array(data_array, ndmin=1)
+        if out is None:
+            out = empty(data_array.shape, dtype=self.screen_dtype)
         # First convert to a [0,1] space, then to the screen space.
         if not self._cache_valid:
             self._compute_scale()
         if self._inter_scale == 0.0:
-            intermediate = data_array*0.0
+            multiply(data_array, 0.0, out)
         else:
             try:
-                mask = (data_array <= LOG_MINIMUM) | isnan(data_array)
-                if sometrue(mask):
-                    data_array = array(data_array, copy=True, ndmin=1)
-                    data_array[mask] = self.fill_value
-                intermediate = (log(data_array) - self._inter_offset)/self._inter_scale
+                subtract(self._log_data(data_array, out), self._inter_offset,
+                         out)
+                divide(out, self._inter_scale, out)
             except ValueError:
-                intermediate = zeros(len(data_array))
+                out.fill(0.0)
 
-        result = intermediate * self._screen_scale + self._screen_offset
-        return result
+        multiply(out, self._screen_scale, out)
+        add(out, self._screen_offset, out)
+        return out
 
     def map_data(self, screen_val):
         """ map_data(screen_val) -> data_val
@@ -85,6 +107,38 @@ class LogMapper(Base1DMapper):
     # Private methods
     #------------------------------------------------------------------------
 
+    def _log_data(self, data_array, out):
+        """ Returns the logarithm of data_array, with the values that have no
+        logarithm replaced by **fill_value**.
+
+        The values are computed into *out* unless they are cached.
+        """
+        if self.cache_log_data:
+            base = data_array if data_array.base is None else data_array.base
+            key = (self._data_version, data_array.__array_interface__['data'],
+                   data_array.shape, data_array.strides, data_array.dtype.str,
+                   self.fill_value)
+            cache = self._log_cache
+            if cache is not None and cache[0] == key and cache[1]() is base:
+                return cache[2]
+
+        mask = (data_array <= LOG_MINIMUM) | isnan(data_array)
+        if sometrue(mask):
+            data_array = array(data_array, copy=True)
+            data_array[mask] = self.fill_value
+
+        if not self.cache_log_data:
+            return log(data_array, out)
+
+        log_data = log(data_array)
+        log_data.flags.writeable = False
+        try:
+            self._log_cache = (key, weakref.ref(base), log_data)
+        except TypeError:
+            # The data is owned by an object that can't be weakly referenced.
+            self._log_cache = None
+        return log_data
+
     def _get_safe_scale(self, range):
         orig_low = range.low
         orig_high = range.high
@@ -142,4 +196,28 @@ class LogMapper(Base1DMapper):
         self._cache_valid = True
         return
 
+    #------------------------------------------------------------------------
+    # Event handlers
+    #------------------------------------------------------------------------
+
+    def _range_changed(self, old, new):
+        super(LogMapper, self)._range_changed(old, new)
+        if old is not None:
+            old.on_trait_change(self._sources_data_changed,
+                                "sources.data_changed", remove=True)
+        if new is not None:
+            new.on_trait_change(self._sources_data_changed,
+                                "sources.data_changed")
+        self._sources_data_changed()
+
+    def _sources_data_changed(self):
+        self._data_version += 1
+        self._log_cache = None
+
+    def _fill_value_changed(self):
+        self._log_cache = None
+
+    def _cache_log_data_changed(self):
+        self._log_cache = None
+
 # EOF
@@ -0,0 +1,208 @@
+""" Defines the PickBuffer class.
+"""
+# Major library imports
+from numpy import absolute, arange, ceil, column_stack, concatenate, \
+    cumsum, empty, errstate, flatnonzero, int32, int64, isfinite, maximum, \
+    minimum, ndim, nonzero, repeat, rint, unique, where, zeros
+
+# Local relative imports
+from errorbar_plot import ErrorBarPlot
+from lineplot import LinePlot
+from polygon_plot import PolygonPlot
+from scatterplot import ScatterPlot
+
+
+class PickBuffer(object):
+    """ An offscreen buffer of the renderers and data points drawn in each
+    pixel of a plot container.
+
+    The buffer rasterizes the data of the line, scatter and polygon plots in
+    the container and in its nested containers (see renders()), one pixel
+    wide, and records for each pixel which
+    renderer and which data point were drawn last in it: the data points of
+    scatter plots, and the segments between the data points of line plots,
+    whose pixels are attributed to the nearest end point.  Finding what is
+    under the cursor then takes the lookup of a few pixels around it, however
+    many renderers and data points the container has.
+
+    The buffer must be rendered again when the plots change, which
+    BasePlotContainer.pick() takes care of.
+    """
+
+    def __init__(self, container):
+        """ Renders the pick buffer of the renderers in *container*.
+        """
+        self.container = container
+        self.bounds = tuple(container.bounds)
+        self.width = max(int(ceil(container.width)), 0)
+        self.height = max(int(ceil(container.height)), 0)
+        # The renderers, in the order of their IDs, which start from 1.
+        self.renderers = []
+        # The ID of the renderer drawn in each pixel, or 0.
+        self.ids = zeros((self.height, self.width), dtype=int32)
+        # The index of the data point drawn in each pixel.
+        self.indices = zeros((self.height, self.width), dtype=int64)
+        self._render_components(container, 0.0, 0.0)
+
+    def pick(self, screen_pt, threshold=7.0):
+        """ Returns the (renderer, index) of the data point drawn nearest to
+        *screen_pt*, within *threshold* pixels, or None if there is none.
+
+        *screen_pt* is in the coordinates of the container's container, like
+        the points given to the hittest() methods of renderers.
+        """
+        x = int(rint(screen_pt[0] - self.container.x))
+        y = int(rint(screen_pt[1] - self.container.y))
+        radius = int(ceil(threshold))
+        x0, y0 = max(x - radius, 0), max(y - radius, 0)
+        ids = self.ids[y0:max(y + radius + 1, 0), x0:max(x + radius + 1, 0)]
+        rows, columns = nonzero(ids)
+        if len(rows) == 0:
+            return None
+        distances = (columns + x0 - x) ** 2 + (rows + y0 - y) ** 2
+        nearest = distances.argmin()
+        if distances[nearest] > threshold * threshold:
+            return None
+        row, column = rows[nearest] + y0, columns[nearest] + x0
+        return (self.renderers[self.ids[row, column] - 1],
+                int(self.indices[row, column]))
+
+    @staticmethod
+    def renders(component):
+        """ Returns whether pick buffers render *component*: line, scatter and
+        polygon plots whose index and value data are 1-D.
+
+        Other renderers, such as multi-line, candle and error bar plots, are
+        not in pick buffers, and must be hit-tested with their hittest()
+        methods.
+        """
+        if not isinstance(component, (LinePlot, PolygonPlot, ScatterPlot)) \
+                or isinstance(component, ErrorBarPlot):
+            return False
+        if component.index is None or component.value is None:
+            return False
+        return ndim(component.index.get_data()) == 1 and \
+            ndim(component.value.get_data()) == 1
+
+    #------------------------------------------------------------------------
+    # Private methods
+    #------------------------------------------------------------------------
+
+    def _render_components(self, container, dx, dy):
+        """ Renders the renderers in *container*, whose origin is at (dx, dy)
+        in the buffer, in drawing order.
+        """
+        for component in container.components:
+            if not component.visible:
+                continue
+            if self.renders(component):
+                self._render_plot(component, dx, dy)
+            elif hasattr(component, "components"):
+                self._render_components(component, dx + component.x,
+                                        dy + component.y)
+
+    def _render_plot(self, plot, dx, dy):
+        """ Renders the data points or line segments of *plot*.
+        """
+        index = plot.index.get_data()
+        value = plot.value.get_data()
+        n = min(len(index), len(value))
+        if n == 0:
+            return
+        points = plot.map_screen(column_stack((index[:n], value[:n])))
+        points = points.reshape(-1, 2) + (dx, dy)
+        self.renderers.append(plot)
+        plot_id = len(self.renderers)
+
+        if isinstance(plot, LinePlot) or plot.hittest_type in ("line",
+                                                                "poly"):
+            if plot.hittest_type == "poly":
+                vertices = arange(n)
+                vertices = concatenate((vertices, vertices[:1]))
+            else:
+                axis = 0 if plot.orientation == "h" else 1
+                vertices = self._reduce_polyline(points, axis)
+            x, y, indices = self._rasterize_segments(
+                points[vertices[:-1]], points[vertices[1:]], vertices)
+        else:
+            x, y = points[:, 0], points[:, 1]
+            indices = arange(n)
+
+        finite = isfinite(x) & isfinite(y)
+        x, y, indices = rint(x[finite]), rint(y[finite]), indices[finite]
+        visible = (x >= 0) & (y >= 0) & (x < self.width) & (y < self.height)
+        x = x[visible].astype(int)
+        y = y[visible].astype(int)
+        self.ids[y, x] = plot_id
+        self.indices[y, x] = indices[visible]
+
+    def _reduce_polyline(self, points, axis):
+        """ Returns the indices of the vertices of the polyline *points* that
+        suffice to draw it pixel for pixel.
+
+        Within each run of consecutive points in the same pixel column along
+        *axis*, only the first and last points and the points with the lowest
+        and highest other coordinate are kept, which draw the same pixels in
+        that column as the whole run.  Dense line plots are thus reduced to
+        at most four points per pixel column.
+        """
+        n = len(points)
+        columns = rint(points[:, axis])
+        other = points[:, 1 - axis]
+        with errstate(invalid="ignore"):
+            # Non-finite points are runs of their own, as NaN != NaN.
+            starts = concatenate(([0],
+                                  flatnonzero(columns[1:] != columns[:-1]) +
+                                  1))
+        if 4 * len(starts) >= n:
+            return arange(n)
+        stops = concatenate((starts[1:], [n]))
+        runs = repeat(arange(len(starts)), stops - starts)
+        vertices = [starts, stops - 1]
+        for reduction in (minimum, maximum):
+            extremes = reduction.reduceat(other, starts)
+            # The first point of each run with the extreme coordinate.
+            matches = flatnonzero(other == extremes[runs])
+            vertices.append(matches[unique(runs[matches],
+                                           return_index=True)[1]])
+        return unique(concatenate(vertices))
+
+    def _rasterize_segments(self, starts, ends, vertices):
+        """ Returns the (x, y, index) of the samples of the line segments from
+        *starts* to *ends*, one per pixel along the longer axis of each
+        segment.  *vertices* are the indices of the data points at the ends
+        of the segments, and the index of a sample is that of the nearest
+        end.
+        """
+        # Clip the segments to the buffer, so that segments that reach far
+        # outside of it are not sampled there.
+        x0, y0 = starts[:, 0], starts[:, 1]
+        dx, dy = ends[:, 0] - x0, ends[:, 1] - y0
+        t0 = zeros(len(starts))
+        t1 = t0 + 1.0
+        with errstate(divide="ignore", invalid="ignore"):
+            for p, q in ((-dx, x0), (dx, self.width - x0),
+                         (-dy, y0), (dy, self.height - y0)):
+                t = q / p
+                t0 = where(p < 0, maximum(t0, t), t0)
+                t1 = where(p > 0, minimum(t1, t), t1)
+                # Segments parallel to an edge, outside of the buffer.
+                t1 = where((p == 0) & (q < 0), -1.0, t1)
+            keep = flatnonzero((t0 <= t1) & isfinite(dx) & isfinite(dy))
+        x0, y0, dx, dy = x0[keep], y0[keep], dx[keep], dy[keep]
+        t0, t1 = t0[keep], t1[keep]
+        if len(keep) == 0:
+            return empty(0), empty(0), empty(0, dtype=int64)
+
+        # Sample each clipped segment at every pixel of its longer axis.
+        lengths = maximum(absolute(dx), absolute(dy)) * (t1 - t0)
+        counts = (ceil(lengths) + 1).astype(int)
+        segments = repeat(arange(len(x0)), counts)
+        offsets = arange(counts.sum()) - repeat(cumsum(counts) - counts,
+                                                counts)
+        steps = maximum(counts - 1, 1).astype(float)
+        t = t0[segments] + (t1 - t0)[segments] * offsets / steps[segments]
+        x = x0[segments] + dx[segments] * t
+        y = y0[segments] + dy[segments] * t
+        indices = vertices[keep[segments] + (t > 0.5)]
+        return x, y, indices
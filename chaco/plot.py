@@ -3,7 +3,7 @@
 # Major library imports
 import itertools
 import warnings
-from numpy import arange, array, ndarray, linspace
+from numpy import arange, ndarray, linspace
 from types import FunctionType
 
 # Enthought library imports
@@ -15,6 +15,8 @@ from abstract_data_source import AbstractDataSource
 from abstract_plot_data import AbstractPlotData
 from array_data_source import ArrayDataSource
 from array_plot_data import ArrayPlotData
+from base import as_data_array
+from batch_updates import batch_updates
 from base_xy_plot import BaseXYPlot
 from barplot import BarPlot
 from candle_plot import CandlePlot
@@ -1131,34 +1133,48 @@ class Plot(DataView):
     def _get_or_create_datasource(self, name):
         """ Returns the data source associated with the given name, or creates
         it if it doesn't exist.
+
+        If the plot data shares its data sources (see
+        AbstractPlotData.share_datasources), the data source is shared with
+        the other plots of the same data.
         """
 
         if name not in self.datasources:
-            data = self.data.get_data(name)
-
-            if type(data) in (list, tuple):
-                data = array(data)
-
-            if isinstance(data, ndarray):
-                if len(data.shape) == 1:
-                    ds = ArrayDataSource(data, sort_order="none")
-                elif len(data.shape) == 2:
-                    ds = ImageData(data=data, value_depth=1)
-                elif len(data.shape) == 3 and data.shape[2] in (3,4):
-                    ds = ImageData(data=data, value_depth=int(data.shape[2]))
-                else:
-                    raise ValueError("Unhandled array shape in creating new "
-                                     "plot: %s" % str(data.shape))
-            elif isinstance(data, AbstractDataSource):
-                ds = data
+            if self.data.share_datasources:
+                ds = self.data.get_shared_datasource(name,
+                                                     self._create_datasource)
             else:
-                raise ValueError("Couldn't create datasource for data of "
-                                 "type %s" % type(data))
-
+                ds = self._create_datasource(self.data.get_data(name))
             self.datasources[name] = ds
 
         return self.datasources[name]
 
+    def _create_datasource(self, data):
+        """ Returns a new data source for *data*, or *data* itself if it is
+        a data source.
+        """
+        if data is not None and \
+                not isinstance(data, (ndarray, AbstractDataSource)):
+            # Array-like data is wrapped without copying when possible.
+            data = as_data_array(data)
+
+        if isinstance(data, ndarray):
+            if len(data.shape) == 1:
+                ds = ArrayDataSource(data, sort_order="none")
+            elif len(data.shape) == 2:
+                ds = ImageData(data=data, value_depth=1)
+            elif len(data.shape) == 3 and data.shape[2] in (3,4):
+                ds = ImageData(data=data, value_depth=int(data.shape[2]))
+            else:
+                raise ValueError("Unhandled array shape in creating new "
+                                 "plot: %s" % str(data.shape))
+        elif isinstance(data, AbstractDataSource):
+            ds = data
+        else:
+            raise ValueError("Couldn't create datasource for data of "
+                             "type %s" % type(data))
+        return ds
+
     #------------------------------------------------------------------------
     # Event handlers
     #------------------------------------------------------------------------
@@ -1178,20 +1194,25 @@ class Plot(DataView):
 
     def _data_update_handler(self, name, event):
         # event should be a dict with keys "added", "removed", and "changed",
-        # per the comments in AbstractPlotData.
-        if "removed" in event:
-            for name in event["removed"]:
-                del self.datasources[name]
-
-        if "added" in event:
-            for name in event["added"]:
-                self._get_or_create_datasource(name)
-
-        if "changed" in event:
-            for name in event["changed"]:
-                if name in self.datasources:
-                    source = self.datasources[name]
-                    source.set_data(self.data.get_data(name))
+        # per the comments in AbstractPlotData.  The updates are batched so
+        # that each data range refreshes once, however many of its sources
+        # change.
+        with batch_updates():
+            if "removed" in event:
+                for name in event["removed"]:
+                    del self.datasources[name]
+
+            if "added" in event:
+                for name in event["added"]:
+                    self._get_or_create_datasource(name)
+
+            if "changed" in event:
+                for name in event["changed"]:
+                    if name in self.datasources:
+                        source = self.datasources[name]
+                        # Shared data sources are updated by the plot data.
+                        if not self.data.is_shared_datasource(name, source):
+                            source.set_data(self.data.get_data(name))
 
     def _plots_items_changed(self, event):
         if self.legend:
@@ -1,15 +1,89 @@
 """ Defines the PlotComponent class.
 """
+# Major library imports
+from math import ceil, floor
+from time import time
+from numpy import minimum, newaxis
+
 # Enthought library imports
 from enable.api import Component
 from enable.kiva_graphics_context import GraphicsContext
-from traits.api import Bool, Instance, Str
+from traits.api import Bool, Dict, Float, Instance, List, Str
 
+# Local relative imports
+from batch_updates import batch_updates, defer_invalidate_draw, \
+    defer_request_redraw
 
 DEFAULT_DRAWING_ORDER = ["background", "image", "underlay",      "plot",
                          "selection", "border", "annotation", "overlay"]
 
 
+def draw_layer_backbuffered(component, layer, gc, view_bounds, mode, draw):
+    """ Draws a layer of *component* from its cached image.
+
+    The layer is rendered into an offscreen image by calling
+    ``draw(layer, gc, view_bounds, mode)``, which is then reused until the
+    component is invalidated (i.e. its **draw_valid** trait is reset) or
+    moves or resizes.  The images are stored in the component's
+    **_layer_backbuffers** dict.  Vector and scaled graphics contexts are
+    always drawn into directly.
+    """
+    ctm = gc.get_ctm() if hasattr(gc, "bmp_array") else None
+    if ctm is None or tuple(ctm[:4]) != (1.0, 0.0, 0.0, 1.0):
+        draw(layer, gc, view_bounds, mode)
+        return
+
+    if component.layout_needed:
+        component.do_layout()
+
+    # The image covers the pixels touched by the component's outer bounds
+    # and has the same subpixel offset as the graphics context.
+    tx, ty = ctm[4:6]
+    x, y = component.outer_position
+    width, height = component.outer_bounds
+    x0 = int(floor(x + tx))
+    y0 = int(floor(y + ty))
+    w = int(ceil(x + width + tx)) - x0
+    h = int(ceil(y + height + ty)) - y0
+    if w <= 0 or h <= 0:
+        return
+
+    if view_bounds is not None:
+        view_bounds = tuple(view_bounds)
+    key = (x, y, width, height, tx % 1.0, ty % 1.0, view_bounds, mode)
+    cached = component._layer_backbuffers.get(layer)
+    if cached is not None and cached[0] == key:
+        bb = cached[1]
+    else:
+        bb = GraphicsContext((w, h))
+        bb.clear((0.0, 0.0, 0.0, 0.0))
+        bb.translate_ctm(tx - x0, ty - y0)
+        draw(layer, bb, view_bounds, mode)
+        if bb.bmp_array[..., 3].any():
+            _unpremultiply(bb.bmp_array)
+        else:
+            # Nothing was drawn on this layer, so there is nothing to blit.
+            bb = None
+        component._layer_backbuffers[layer] = (key, bb)
+        component.draw_valid = True
+
+    if bb is not None:
+        gc.draw_image(bb, (x0 - tx, y0 - ty, w, h))
+    return
+
+
+def _unpremultiply(image):
+    """ Converts the colors of an RGBA image from premultiplied alpha, as
+    rendered by Agg, to the straight alpha that draw_image() expects.
+    """
+    alpha = image[..., 3]
+    partial = (alpha > 0) & (alpha < 255)
+    if partial.any():
+        rgb = image[partial, :3] * 255.0
+        rgb /= alpha[partial][:, newaxis]
+        image[partial, :3] = minimum(rgb + 0.5, 255.0)
+
+
 class PlotComponent(Component):
     """
     PlotComponent is the base class for all plot-related visual components.
@@ -53,6 +127,112 @@ class PlotComponent(Component):
     # compatibility).
     use_draw_order = Bool(True)
 
+    #------------------------------------------------------------------------
+    # Layer backbuffer traits
+    #------------------------------------------------------------------------
+
+    # Should each layer of this component be rendered into an offscreen image
+    # that is kept until the component calls invalidate_draw()?  This spares
+    # re-rendering expensive plots when only the overlays of a plot change,
+    # e.g. while an inspector tool is hovering.  Components whose appearance
+    # changes without invalidating them should not use layer backbuffers.
+    use_layer_backbuffers = Bool(False)
+
+    # The layers that are always drawn directly, even when
+    # **use_layer_backbuffers** is True.
+    unbuffered_layers = List(Str, ["overlay"])
+
+    # Maps each buffered layer to a (key, image) tuple.
+    _layer_backbuffers = Dict
+
+    # The number of seconds that the last draw of this component took.  Tools
+    # that throttle their updates use it to keep up with slow plots.
+    last_draw_time = Float(0.0)
+
+    # The number of seconds that the last draw of the "plot" layer of this
+    # component took.  Frame budget schedulers use it to measure the cost of
+    # renderers.
+    last_render_time = Float(0.0)
+
+    #------------------------------------------------------------------------
+    # Public methods
+    #------------------------------------------------------------------------
+
+    def batch_updates(self):
+        """ Returns a context manager that defers the draw invalidations and
+        redraw requests of all Chaco components until it exits, so that
+        each component is invalidated and redrawn only once::
+
+            with plot.batch_updates():
+                plot.index_range.set_bounds(0.0, 10.0)
+                plot.value_range.set_bounds(-1.0, 1.0)
+        """
+        return batch_updates()
+
+    def draw(self, gc, view_bounds=None, mode="default"):
+        """ Draws the component, and records the time it took in
+        **last_draw_time**.
+
+        Overrides Enable Component.
+        """
+        start = time()
+        super(PlotComponent, self).draw(gc, view_bounds, mode)
+        self.last_draw_time = time() - start
+
+    def invalidate_draw(self, damaged_regions=None, self_relative=False):
+        """ Invalidates any backbuffer that may exist, and notifies our
+        parents and viewports of any damaged regions, at the end of the
+        current update batch if there is one.
+
+        Overrides Enable Component.
+        """
+        if not defer_invalidate_draw(self, damaged_regions, self_relative):
+            super(PlotComponent, self).invalidate_draw(damaged_regions,
+                                                       self_relative)
+
+    def request_redraw(self):
+        """ Requests that the component redraw itself, at the end of the
+        current update batch if there is one.
+
+        Overrides Enable Component.
+        """
+        if not defer_request_redraw(self):
+            super(PlotComponent, self).request_redraw()
+
+    def dispatch(self, event, suffix):
+        """ Dispatches a mouse event, coalescing the redraws it causes.
+
+        Overrides Enable Component.
+        """
+        with batch_updates(refreshes=False):
+            super(PlotComponent, self).dispatch(event, suffix)
+
+    #------------------------------------------------------------------------
+    # Protected methods
+    #------------------------------------------------------------------------
+
+    def _dispatch_draw(self, layer, gc, view_bounds, mode):
+        """ Renders the named *layer* of this component, from its backbuffer
+        if **use_layer_backbuffers** is True, and records the time that the
+        "plot" layer took in **last_render_time**.
+        """
+        start = time()
+        if self.use_layer_backbuffers and layer not in self.unbuffered_layers:
+            draw_layer_backbuffered(self, layer, gc, view_bounds, mode,
+                                    super(PlotComponent, self)._dispatch_draw)
+        else:
+            super(PlotComponent, self)._dispatch_draw(layer, gc, view_bounds,
+                                                      mode)
+        if layer == "plot":
+            self.last_render_time = time() - start
+
+    def _draw_valid_changed(self, new):
+        if not new:
+            self._layer_backbuffers.clear()
+
+    def _use_layer_backbuffers_changed(self):
+        self._layer_backbuffers.clear()
+
     def _use_draw_order_changed(self, old, new):
         """ Handler to catch the case when someone is trying to use the
         old-style drawing mechanism, which is now unsupported.
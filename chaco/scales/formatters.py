@@ -2,9 +2,11 @@
 Classes for formatting labels for values or times.
 """
 
+from collections import OrderedDict
 from math import ceil, floor, fmod, log10
 from numpy import abs, all, array, asarray, amax, amin
 from safetime import strftime, time, safe_fromtimestamp, localtime
+import time as stdlib_time
 import warnings
 
 
@@ -128,7 +130,7 @@ class BasicFormatter(object):
         else:
             # For decimal mode,
             if not (ticks % 1).any():
-                labels = map(str, ticks.astype(int))
+                labels = ticks.astype(int).astype(str).tolist()
             else:
                 labels = map(str, ticks)
 
@@ -451,6 +453,18 @@ class TimeFormatter(object):
     # Whether or not to strip the leading zeros on tick labels.
     strip_leading_zeros = True
 
+    # The maximum number of tick labels remembered by each formatter.
+    label_cache_size = 1024
+
+    # Labels of previously formatted ticks, keyed on the tick, its format and
+    # resolution, and the local timezone; in least recently used order.
+    # Created when the first ticks are formatted.
+    _label_cache = None
+
+    # Results of estimate_width(), keyed on its arguments that matter.
+    # Created when the first width is estimated.
+    _width_cache = None
+
     def __init__(self, **kwds):
         self.__dict__.update(kwds)
         self._compute_format_weights()
@@ -544,6 +558,36 @@ class TimeFormatter(object):
         labels = []
         resol_ndx = self.format_order.index(resol)
 
+        # Format the ticks, reusing the labels of the ticks that were already
+        # formatted in the same way, as most are when panning.
+        label_cache = self._label_cache
+        if label_cache is None:
+            label_cache = self._label_cache = OrderedDict()
+        # The local timezone may be changed with time.tzset().
+        timezone = (stdlib_time.timezone, stdlib_time.altzone,
+                    stdlib_time.tzname)
+        key_suffix = (format, resol, self.strip_leading_zeros, timezone)
+        for t in ticks:
+            key = (t,) + key_suffix
+            label = label_cache.pop(key, None)
+            if label is None:
+                try:
+                    label = self._format_tick(t, format, resol, resol_ndx)
+                except ValueError, e:
+                    warnings.warn("Unable to convert tick for timestamp " + str(t))
+                    labels.append("ERR")
+                    continue
+                if len(label_cache) >= self.label_cache_size:
+                    label_cache.popitem(last=False)
+            label_cache[key] = label
+            labels.append(label)
+
+        return labels
+
+    def _format_tick(self, t, format, resol, resol_ndx):
+        """ Formats the single tick *t* with *format*, at the resolution
+        *resol* whose index in **format_order** is *resol_ndx*.
+        """
         # This dictionary maps the name of a time resolution (in self.format_order)
         # to its index in a time.localtime() timetuple.  The default is to map
         # everything to index 0, which is year.  This is not ideal; it might cause
@@ -558,53 +602,45 @@ class TimeFormatter(object):
                 "hours" : 3,
                 })
 
-        # As we format each tick, check to see if we are at a boundary of the
-        # next higher unit of time.  If so, replace the current format with one
-        # from that resolution.  This is not the best heuristic in the world,
-        # but it works!  There is some trickiness here due to having to deal
-        # with hybrid formats in a reasonable manner.
-        for t in ticks:
-            try:
-                tm = localtime(t)
-                s = strftimeEx(format, t, tm)
-            except ValueError, e:
-                warnings.warn("Unable to convert tick for timestamp " + str(t))
-                labels.append("ERR")
-                continue
-
-            hybrid_handled = False
-            next_ndx = resol_ndx
-
-            # The way to check that we are at the boundary of the next unit of
-            # time is by checking that we have 0 units of the resolution, i.e.
-            # we are at zero minutes, so display hours, or we are at zero seconds,
-            # so display minutes (and if that is zero as well, then display hours).
-            while tm[ time_tuple_ndx_for_resol[self.format_order[next_ndx]] ] == 0:
-                next_ndx += 1
-                if next_ndx == len(self.format_order):
+        # Check to see if we are at a boundary of the next higher unit of
+        # time.  If so, replace the current format with one from that
+        # resolution.  This is not the best heuristic in the world, but it
+        # works!  There is some trickiness here due to having to deal with
+        # hybrid formats in a reasonable manner.
+        tm = localtime(t)
+        s = strftimeEx(format, t, tm)
+
+        hybrid_handled = False
+        next_ndx = resol_ndx
+
+        # The way to check that we are at the boundary of the next unit of
+        # time is by checking that we have 0 units of the resolution, i.e.
+        # we are at zero minutes, so display hours, or we are at zero seconds,
+        # so display minutes (and if that is zero as well, then display hours).
+        while tm[ time_tuple_ndx_for_resol[self.format_order[next_ndx]] ] == 0:
+            next_ndx += 1
+            if next_ndx == len(self.format_order):
+                break
+            if resol in ("minsec", "hourmin") and not hybrid_handled:
+                if (resol == "minsec" and tm.tm_min == 0 and tm.tm_sec != 0) or \
+                    (resol == "hourmin" and tm.tm_hour == 0 and tm.tm_min != 0):
+                    next_format = self.formats[self.format_order[resol_ndx-1]][1][0]
+                    s = strftimeEx(next_format, t, tm)
                     break
-                if resol in ("minsec", "hourmin") and not hybrid_handled:
-                    if (resol == "minsec" and tm.tm_min == 0 and tm.tm_sec != 0) or \
-                        (resol == "hourmin" and tm.tm_hour == 0 and tm.tm_min != 0):
-                        next_format = self.formats[self.format_order[resol_ndx-1]][1][0]
-                        s = strftimeEx(next_format, t, tm)
-                        break
-                    else:
-                        hybrid_handled = True
-
-                next_format = self.formats[self.format_order[next_ndx]][1][0]
-                s = strftimeEx(next_format, t, tm)
-
-            if self.strip_leading_zeros:
-                ss = s.lstrip('0')
-                if ss != s and (ss == '' or not ss[0].isdigit()):
-                    # A label such as '000ms' should leave one zero.
-                    ss = '0' + ss
-                labels.append(ss)
-            else:
-                labels.append(s)
+                else:
+                    hybrid_handled = True
 
-        return labels
+            next_format = self.formats[self.format_order[next_ndx]][1][0]
+            s = strftimeEx(next_format, t, tm)
+
+        if self.strip_leading_zeros:
+            ss = s.lstrip('0')
+            if ss != s and (ss == '' or not ss[0].isdigit()):
+                # A label such as '000ms' should leave one zero.
+                ss = '0' + ss
+            return ss
+        else:
+            return s
 
     def estimate_width(self, start, end, numlabels=None, char_width=None,
                        fill_ratio = 0.2, ticker=None):
@@ -649,6 +685,24 @@ class TimeFormatter(object):
         if unit == "milliseconds":
             return numlabels, numlabels * 6
 
+        key = (unit, numlabels, char_width, fill_ratio)
+        width_cache = self._width_cache
+        if width_cache is None:
+            width_cache = self._width_cache = {}
+        try:
+            return numlabels, width_cache[key]
+        except KeyError:
+            pass
+        if len(width_cache) >= self.label_cache_size:
+            width_cache.clear()
+        width = width_cache[key] = self._estimate_width(
+            unit, numlabels, char_width, fill_ratio)
+        return numlabels, width
+
+    def _estimate_width(self, unit, numlabels, char_width, fill_ratio):
+        """ Returns the total width of *numlabels* labels at the resolution
+        *unit*; see estimate_width().
+        """
         widths, strings = self.formats[unit]
 
         if char_width:
@@ -666,6 +720,6 @@ class TimeFormatter(object):
             # Just pick the middle of the pack of format widths
             width = widths[ int(len(widths) / 2) ] * numlabels
 
-        return numlabels, width
+        return width
 
 
@@ -412,6 +412,11 @@ class ScaleSystem(object):
         self.fill_ratio = 0.3
         self.default_numticks = 8
 
+        # The interval for which the results of the scales' num_ticks() are
+        # cached, and the cache itself, keyed on (scale, desired_ticks).
+        self._num_ticks_interval = None
+        self._num_ticks_cache = {}
+
 
     def ticks(self, start, end, numticks=None):
         """ Computes nice locations for tick marks.
@@ -511,7 +516,8 @@ class ScaleSystem(object):
             widths = array(widths)
             closest = argmin(abs(widths - char_width*self.fill_ratio))
             if numlabels is None:
-                numlabels = scales[closest].num_ticks(start, end, counts[closest])
+                numlabels = self._num_ticks(scales[closest], start, end,
+                                            counts[closest])
             labels = scales[closest].labels(start, end, numlabels,
                                             char_width=char_width)
 
@@ -528,7 +534,8 @@ class ScaleSystem(object):
                 # Handle the edge cases and see if there is a major discrepancy between
                 # what the scales offer and the desired number of ticks; if so, revert
                 # to using the default scale
-                approx_ticks = closest_scale.num_ticks(start, end, numticks)
+                approx_ticks = self._num_ticks(closest_scale, start, end,
+                                               numticks)
                 if (approx_ticks == 0) or (numticks == 0) or \
                        (abs(approx_ticks - numticks) / numticks > 1.2) or \
                        (abs(numticks - approx_ticks) / approx_ticks > 1.2):
@@ -536,7 +543,8 @@ class ScaleSystem(object):
         return closest_scale
 
     def _get_scale_bisect(self, start, end, numticks):
-        scale_intervals = [s.num_ticks(start, end, numticks) for s in self.scales]
+        scale_intervals = [self._num_ticks(s, start, end, numticks)
+                           for s in self.scales]
         sorted_scales = sorted(zip(scale_intervals, self.scales))
         ndx = bisect(sorted_scales, numticks, lo=0, hi=len(self.scales))
         if ndx == len(self.scales):
@@ -545,7 +553,25 @@ class ScaleSystem(object):
 
     def _get_scale_np(self, start, end, numticks):
         # Extract the intervals from the scales we were given
-        scale_intervals = array([s.num_ticks(start, end, numticks) for s in self.scales])
+        scale_intervals = array([self._num_ticks(s, start, end, numticks)
+                                 for s in self.scales])
         closest = argmin(abs(scale_intervals - numticks))
         return self.scales[closest]
 
+    def _num_ticks(self, scale, start, end, numticks):
+        """ Returns scale.num_ticks(start, end, numticks), reusing the value
+        computed for the same interval if possible.
+
+        Only the results for the last interval are kept, which covers the
+        repeated evaluations of the scales while picking one for a draw.
+        """
+        if self._num_ticks_interval != (start, end):
+            self._num_ticks_interval = (start, end)
+            self._num_ticks_cache = {}
+        key = (scale, numticks)
+        try:
+            return self._num_ticks_cache[key]
+        except KeyError:
+            result = self._num_ticks_cache[key] = scale.num_ticks(start, end,
+                                                                   numticks)
+            return result
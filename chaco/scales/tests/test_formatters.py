@@ -1,5 +1,9 @@
 
-from chaco.scales.formatters import strftimeEx, TimeFormatter
+import os
+import pickle
+import time
+
+from chaco.scales.formatters import BasicFormatter, strftimeEx, TimeFormatter
 
 
 #----------------------------------------------------------------
@@ -83,3 +87,62 @@ def test_time_formatter_01():
     expected = ["5.000ms", "5.300ms", "5.600ms"]
     print "labels =", labels, " expected =", expected
     assert labels == expected
+
+def test_time_formatter_label_cache():
+    tf = TimeFormatter()
+    ticks = [10.005, 10.0053, 10.0056]
+    labels = tf.format(ticks, char_width=130)
+    assert len(tf._label_cache) == 3
+    # Formatting the same ticks again gives the same labels from the cache.
+    assert tf.format(ticks, char_width=130) == labels
+    assert len(tf._label_cache) == 3
+    assert tf.format(ticks[1:] + [10.0059], char_width=130) == \
+        labels[1:] + ["5.900ms"]
+    assert len(tf._label_cache) == 4
+
+def test_time_formatter_label_cache_size():
+    tf = TimeFormatter(label_cache_size=2)
+    ticks = [10.005, 10.0053, 10.0056]
+    tf.format(ticks, char_width=130)
+    assert len(tf._label_cache) == 2
+    assert [key[0] for key in tf._label_cache] == ticks[1:]
+
+def test_time_formatter_label_cache_timezone():
+    old_tz = os.environ.get("TZ")
+    try:
+        os.environ["TZ"] = "UTC"
+        time.tzset()
+        tf = TimeFormatter()
+        ticks = [10.005, 10.0053, 10.0056]
+        tf.format(ticks, char_width=130)
+        assert len(tf._label_cache) == 3
+        # The labels cached for the previous timezone are not reused.
+        os.environ["TZ"] = "EST+05"
+        time.tzset()
+        tf.format(ticks, char_width=130)
+        assert len(tf._label_cache) == 6
+    finally:
+        if old_tz is None:
+            del os.environ["TZ"]
+        else:
+            os.environ["TZ"] = old_tz
+        time.tzset()
+
+def test_time_formatter_unpickled_without_caches():
+    # Formatters pickled before their caches were added have no caches in
+    # their state.
+    tf = pickle.loads(pickle.dumps(TimeFormatter()))
+    assert "_label_cache" not in tf.__dict__
+    assert tf.format([10.005, 10.0053], char_width=130) == \
+        ["5.000ms", "5.300ms"]
+    assert len(tf._label_cache) == 2
+
+#----------------------------------------------------------------
+# BasicFormatter tests
+#----------------------------------------------------------------
+
+def test_basic_formatter_integers():
+    bf = BasicFormatter()
+    labels = bf.format([-20.0, 0.0, 20.0, 40.0])
+    assert labels == ["-20", "0", "20", "40"]
+    assert all(type(label) is str for label in labels)
@@ -66,6 +66,13 @@ def set_timezone(tz):
         chaco.scales.safetime.EPOCH = old_epoch
         chaco.scales.time_scale.EPOCH = old_epoch
 
+def to_sec(*args):
+    """ Returns the time in seconds of a date in the selected timezone.
+    """
+    import chaco.scales.time_scale
+    epoch = chaco.scales.time_scale.EPOCH
+    return (datetime.datetime(*args) - epoch).total_seconds()
+
 
 #----------------------------------------------------------------
 # tfrac tests
@@ -296,6 +303,13 @@ def test_tfrac_milliseconds_05():
     assert base == 1.007
     assert frac == 0.000806
 
+def test_tfrac_array():
+    with set_timezone(UTC):
+        t = np.array([3601, 3600 * 5.5, -1])
+        (base, frac) = tfrac(t, hours=2)
+        assert (base == [0, 3600 * 4, -7200]).all()
+        assert (frac == [3601, 3600 * 1.5, 7199]).all()
+
 
 #----------------------------------------------------------------
 # trange tests
@@ -408,6 +422,24 @@ def test_trange_seconds_03():
     r = trange(0, 1.5, seconds=1)
     assert r == [0.0, 1.0]
 
+def test_trange_months_01():
+    with set_timezone(UTC):
+        start = to_sec(2000, 2, 10)
+        end = to_sec(2001, 1, 1)
+        r = trange(start, end, months=3)
+        expected = [to_sec(y, m, 1)
+                    for y, m in ((2000, 4), (2000, 7), (2000, 10), (2001, 1))]
+        assert r == expected
+
+def test_trange_years_01():
+    with set_timezone(UTC):
+        start = to_sec(1993, 6, 1)
+        end = to_sec(2021, 1, 1)
+        r = trange(start, end, years=5)
+        expected = [to_sec(y, 1, 1)
+                    for y in (1995, 2000, 2005, 2010, 2015, 2020)]
+        assert r == expected
+
 def test_trange_milliseconds_01():
     r = trange(0, 0.1, milliseconds=1)
     assert np.allclose(np.array(r), np.linspace(0.0, 0.1, 101))
@@ -439,6 +471,18 @@ def test_time_scale_milliseconds_01():
     assert len(ticks) == 11
     assert (np.array(ticks) == np.linspace(0.0, 0.1, 11)).all()
 
+def test_time_scale_day_of_month():
+    with set_timezone(UTC):
+        ts = TimeScale(day_of_month=(1, 15))
+        start = to_sec(1999, 12, 20)
+        end = to_sec(2000, 3, 1)
+        ticks = ts.ticks(start, end)
+        expected = [to_sec(y, m, d)
+                    for y, m, d in ((2000, 1, 1), (2000, 1, 15),
+                                    (2000, 2, 1), (2000, 2, 15),
+                                    (2000, 3, 1))]
+        assert ticks == expected
+
 def test_time_scale_with_formatter():
     """ Regression test for TimeScale() with formatter keyword.
 
@@ -460,6 +504,23 @@ def test_calendar_scale_system_01():
     assert len(ticks) == 11
     assert (np.array(ticks) == np.linspace(0,10,11)).all()
 
+def test_calendar_scale_system_num_ticks_cached():
+    class CountingScale(TimeScale):
+        calls = 0
+        def num_ticks(self, start, end, desired_ticks=None):
+            CountingScale.calls += 1
+            return super(CountingScale, self).num_ticks(start, end,
+                                                        desired_ticks)
+
+    css = CalendarScaleSystem(CountingScale(seconds=1),
+                              CountingScale(minutes=1))
+    css.ticks(0, 600, 8)
+    calls = CountingScale.calls
+    css.ticks(0, 600, 8)
+    assert CountingScale.calls == calls
+    css.ticks(0, 900, 8)
+    assert CountingScale.calls > calls
+
 
 # TODO: Add more tests of the ticks() and labels() methods of
 # the CalendarScaleSystem.
@@ -2,7 +2,10 @@
 A scale for time and calendar intervals.
 """
 
-from math import floor
+import warnings
+
+from numpy import arange, around, array, asarray, datetime64, floor_divide, \
+    int64, isnan, remainder, trunc, where
 
 from scales import AbstractScale, ScaleSystem, frange, heckbert_interval
 from formatters import TimeFormatter
@@ -14,6 +17,25 @@ datetime_scale = ["microsecond", "second", "minute", "hour",
                   "day", "month", "year"]
 datetime_zeros = zip(datetime_scale, [0, 0, 0, 0, 1, 1, 1])
 
+# For each unit of datetime_scale but "year": the numpy datetime64 codes of
+# the unit and of the next larger unit, and the value of the first unit in
+# the larger one.
+_datetime64_units = {"microsecond": ("us", "s", 0),
+                     "second": ("s", "m", 0),
+                     "minute": ("m", "h", 0),
+                     "hour": ("h", "D", 0),
+                     "day": ("D", "M", 1),
+                     "month": ("M", "Y", 1)}
+
+# The range of datetime64 values that datetime objects can represent.
+_MIN_DATETIME64 = datetime64(datetime(MINYEAR, 1, 1), "us")
+_MAX_DATETIME64 = datetime64(datetime(MAXYEAR, 12, 31, 23, 59, 59, 999999),
+                             "us")
+
+# Timestamps are clipped to this many seconds from the epoch before being
+# converted, which is well outside the range of datetime.
+_MAX_TIMESTAMP = 1e12
+
 
 __all__ = ["TimeScale", "CalendarScaleSystem", "HMSScales", "MDYScales",
            "trange", "tfrac", "td_to_sec", "dt_to_sec"]
@@ -35,6 +57,66 @@ def dt_to_sec(t):
     return td_to_sec(t - EPOCH)
 
 
+def _td64_to_sec(td):
+    """ Returns the floating point numbers of seconds in timedelta64 values,
+    rounded the same way as by td_to_sec().
+    """
+    microseconds = asarray(td).astype("m8[us]").astype(int64)
+    return (floor_divide(microseconds, 1000000) +
+            remainder(microseconds, 1000000) * 1e-6)
+
+
+def _dt64_to_sec(dt):
+    """ Returns the floating point numbers of seconds since the UNIX epoch
+    corresponding to naive datetime64 values, like dt_to_sec().
+    """
+    return _td64_to_sec(dt - datetime64(EPOCH, "us"))
+
+
+def _sec_to_dt64(t):
+    """ Returns the naive datetime64[us] values corresponding to times in
+    seconds since the UNIX epoch, like safe_fromtimestamp().
+    """
+    t = asarray(t, dtype=float)
+    nan_mask = isnan(t)
+    # NaNs are out of range on the high side, as in safe_fromtimestamp().
+    t = where(nan_mask, _MAX_TIMESTAMP, t).clip(-_MAX_TIMESTAMP,
+                                                 _MAX_TIMESTAMP)
+    seconds = trunc(t)
+    microseconds = (seconds.astype(int64) * 1000000 +
+                    around((t - seconds) * 1e6).astype(int64))
+    dt = datetime64(EPOCH, "us") + microseconds.astype("m8[us]")
+
+    low = dt < _MIN_DATETIME64
+    high = dt > _MAX_DATETIME64
+    if low.any() or high.any():
+        warnings.warn("Timestamp out of range.  Returning safe default value.")
+        dt = where(low, datetime64(datetime(MINYEAR, 1, 1), "us"), dt)
+        dt = where(high, datetime64(datetime(MAXYEAR, 1, 1), "us"), dt)
+    return dt
+
+
+def _dt64_floor(dt, unit, period):
+    """ Returns the calendar-aligned datetime64 values that tfrac() splits
+    the datetime64 values *dt* at, for a number of *period* units.
+    """
+    if unit == "year":
+        amt = dt.astype("M8[Y]").astype(int64) + 1970
+        closest_multiple = floor_divide(amt, period) * period
+        closest_multiple[closest_multiple == 0] = 1
+        whole = (closest_multiple - 1970).astype("M8[Y]")
+    else:
+        code, parent_code, first = _datetime64_units[unit]
+        parent = dt.astype("M8[%s]" % parent_code)
+        amt = (dt.astype("M8[%s]" % code) - parent).astype(int64) + first
+        closest_multiple = floor_divide(amt, period) * period
+        if first == 1:
+            # TODO: this isn't really quite right for intervals of days > 1...
+            closest_multiple[closest_multiple == 0] = 1
+        whole = parent + (closest_multiple - first).astype("m8[%s]" % code)
+    return whole.astype("M8[us]")
+
+
 def tfrac(t, **time_unit):
     """ Performs a calendar-aware split of a time into (aligned_time, frac)
     over an interval that is a multiple of one of the following time units:
@@ -57,14 +139,15 @@ def tfrac(t, **time_unit):
 
     Parameters
     ==========
-    t : float
+    t : float or array of floats
         time in seconds
     ``**time_unit`` : dict
         a single (interval=value) item
 
     Returns
     =======
-    A tuple: (aligned time as UNIX time, remainder in seconds)
+    A tuple: (aligned time as UNIX time, remainder in seconds).  Both items
+    are arrays if *t* is an array.
     """
     unit, period = time_unit.items()[0]
     if unit == "milliseconds":
@@ -74,68 +157,50 @@ def tfrac(t, **time_unit):
         unit = unit[:-1]  # strip off the 's'
 
     # Find the nearest round date
-    dt = safe_fromtimestamp(t)
-    amt = getattr(dt, unit)
-    ndx = datetime_scale.index(unit)
-    closest_multiple = int(floor(amt / period) * period)
-    if closest_multiple == 0 and unit in ("day", "year"):
-        # TODO: this isn't really quite right for intervals of days > 1...
-        closest_multiple = 1
-    whole = dt.replace(**{unit: closest_multiple})
-    whole = whole.replace(**dict(datetime_zeros[:ndx]))
-    frac = td_to_sec(dt - whole)
-
-    return dt_to_sec(whole), frac
-
-def _advance_month(dt, months):
-    """ Advance a datetime object by a given number of months.
+    dt = _sec_to_dt64(array(t, dtype=float, ndmin=1))
+    whole = _dt64_floor(dt, unit, period)
+    whole_secs = _dt64_to_sec(whole)
+    frac = _td64_to_sec(dt - whole)
+    if asarray(t).ndim == 0:
+        return float(whole_secs[0]), float(frac[0])
+    return whole_secs, frac
+
+def _month_start_range(start, end, step, aligned_to):
+    """ Returns the datetime64[M] values that are *step* months apart, are
+    aligned with the month *aligned_to* and fall in the interval
+    [*start*, *end*] of datetime64 values.
     """
-    new_month = dt.month + months
-    years, extra_months = divmod(new_month-1, 12)
-    new_month = extra_months + 1
-    return dt.replace(year=dt.year+years, month=new_month)
+    start_month = start.astype("M8[M]").astype(int64)
+    end_month = end.astype("M8[M]").astype(int64)
+    first = start_month - (start_month - aligned_to) % step
+    if first.astype("M8[M]") < start:
+        first += step
+    return arange(first, end_month + 1, step).astype("M8[M]")
 
 def trange_months(start, end, months):
     """ Create a range of timestamps separated by a given number of months.
 
     The start of the iteration is always aligned to Jan 1 2000.
     """
-    dt_start = safe_fromtimestamp(start)
-    dt_end = safe_fromtimestamp(end)
-    dmonths = (12 * (dt_start.year - 2000) + dt_start.month - 1) % months
-    dt = _advance_month(dt_start.replace(day=1, hour=0, minute=0, second=0,
-        microsecond=0), -dmonths)
-    while dt < dt_start:
-        dt = _advance_month(dt, months)
-    timestamps = []
-    while dt <= dt_end:
-        timestamps.append(dt_to_sec(dt))
-        dt = _advance_month(dt, months)
-    return timestamps
-
-def _advance_years(dt, years):
-    """ Advance a datetime object by a given number of years.
-    """
-    return dt.replace(year=dt.year+years)
+    dt_start, dt_end = _sec_to_dt64([start, end])
+    # Month 360 after the start of the datetime64 epoch is January 2000.
+    dates = _month_start_range(dt_start, dt_end, months, 360)
+    return _dt64_to_sec(dates.astype("M8[us]")).tolist()
 
 def trange_years(start, end, years):
     """ Create a range of timestamps separated by a given number of years.
 
     The start of the iteration is aligned to Jan 1 2000.
     """
-    dt_start = safe_fromtimestamp(start)
-    dt_end = safe_fromtimestamp(end)
-    dyears = (dt_start.year - 2000) % years
-    if dyears < 0:
-        dyears += years
-    dt = datetime(dt_start.year-dyears, 1, 1, 0, 0, 0, 0)
-    while dt < dt_start:
-        dt = _advance_years(dt, years)
-    timestamps = []
-    while dt <= dt_end:
-        timestamps.append(dt_to_sec(dt))
-        dt = _advance_years(dt, years)
-    return timestamps
+    dt_start, dt_end = _sec_to_dt64([start, end])
+    start_year = dt_start.astype("M8[Y]").astype(int64)
+    end_year = dt_end.astype("M8[Y]").astype(int64)
+    # Year 30 after the start of the datetime64 epoch is 2000.
+    first = start_year - (start_year - 30) % years
+    if first.astype("M8[Y]") < dt_start:
+        first += years
+    dates = arange(first, end_year + 1, years).astype("M8[Y]")
+    return _dt64_to_sec(dates.astype("M8[us]")).tolist()
 
 def trange(start, end, **time_unit):
     """ Like range(), but for times, and with "natural" alignment depending on
@@ -172,8 +237,8 @@ def trange(start, end, **time_unit):
 
     # Express start and end ticks as (date, frac) where date is calendar-aligned
     # with the interval in time_unit.
-    start_whole, start_frac = tfrac(start, **time_unit)
-    end_whole, end_frac = tfrac(end, **time_unit)
+    (start_whole, end_whole), (start_frac, end_frac) = \
+        tfrac(array([start, end], dtype=float), **time_unit)
 
     # Handle some corner-cases
     if start_whole == end_whole:
@@ -191,8 +256,8 @@ def trange(start, end, **time_unit):
     delta = td_to_sec(timedelta(**time_unit))
     count = (end_whole - start_whole) / delta
 
-    ticks = [start_whole + i*delta for i in range(int(round(count))+1)]
-    return ticks[first_tick_ndx:]
+    ticks = start_whole + arange(int(round(count))+1) * delta
+    return ticks[first_tick_ndx:].tolist()
 
 
 class TimeScale(AbstractScale):
@@ -286,40 +351,39 @@ class TimeScale(AbstractScale):
         """ ticks() method for calendar-based intervals """
 
         # start and end are in seconds since Epoch, get naive datetimes
-        try:
-            start_dt = datetime.fromtimestamp(start)
-        except ValueError:
-            start_dt = datetime(MINYEAR, 1, 1, 0, 0, 0)
-        try:
-            end_dt = datetime.fromtimestamp(end)
-        except ValueError:
-            end_dt = datetime(MAXYEAR, 1, 1, 0, 0, 0)
+        dt_start, dt_end = _sec_to_dt64([start, end])
 
         # get range of years of interest
-        # add 2 because of python ranges + guard against timezone shifts
-        # eg. if 20000101 -> 19991231 because of local timezone, end is 1999+2
-        years = range(start_dt.year, min(end_dt.year+2, MAXYEAR+1))
+        # add 1 on each side to guard against timezone shifts
+        # eg. if 20000101 -> 19991231 because of local timezone
+        first_year = max(dt_start.astype("M8[Y]").astype(int64) - 1,
+                         MINYEAR - 1970)
+        last_year = min(dt_end.astype("M8[Y]").astype(int64) + 1,
+                        MAXYEAR - 1970)
+        years = arange(first_year, last_year + 1).astype("M8[Y]")
+        vals = asarray(self.vals, dtype=int64)
         if self.unit == "day_of_month":
             # get naive datetimes for start of each day of each month
             # in range of years.  Excess will be discarded later.
-            months = range(1, 13)
-            dates = [datetime(year, month, i)
-                     for year in years for month in months for i in self.vals]
+            months = arange(years[0].astype("M8[M]").astype(int64),
+                            years[-1].astype("M8[M]").astype(int64) + 12)
+            dates = (months.astype("M8[M]").astype("M8[D]")[:, None] +
+                     (vals - 1).astype("m8[D]"))
 
         elif self.unit == "month_of_year":
             # get naive datetimes for start of each month in range of years
-            dates = [datetime(year, month, 1)
-                     for year in years for month in self.vals]
+            dates = (years.astype("M8[M]")[:, None] +
+                     (vals - 1).astype("m8[M]"))
         else:
             raise ValueError("Unknown calendar unit '%s'" % self.unit)
 
         # safely convert to seconds since epoch
-        ticks = [dt_to_sec(date) for date in dates]
+        ticks = _dt64_to_sec(dates.astype("M8[us]").ravel())
 
         # trim excess timestamps
-        ticks = [t for t in ticks if start <= t <= end]
+        ticks = ticks[(start <= ticks) & (ticks <= end)]
 
-        return ticks
+        return ticks.tolist()
 
     def labels(self, start, end, numlabels=None, char_width=None):
         """ Returns a series of ticks and corresponding strings for labels
@@ -6,21 +6,23 @@ function.
 import itertools
 
 # Major library imports
-from numpy import around, array, asarray, column_stack, \
-    isfinite, isnan, nanargmin, ndarray, sqrt, sum, transpose, where
+from numpy import around, array, asarray, column_stack, int64, \
+    isfinite, isnan, ndarray, rint, sort, sqrt, sum, unique
 
 # Enthought library imports
 from enable.api import black_color_trait, ColorTrait, AbstractMarker, \
         CustomMarker, MarkerNameDict, MarkerTrait
 from kiva.constants import STROKE
-from traits.api import Any, Array, Bool, Float, Trait, Callable, Property, \
-        Tuple, Either, cached_property
+from traits.api import Any, Array, Bool, Float, Int, Trait, Callable, \
+        Property, Tuple, Either, cached_property
 from traitsui.api import View, VGroup, Item
 
 # Local relative imports
 from base_xy_plot import BaseXYPlot
 from speedups import scatterplot_gather_points
 from base import reverse_map_1d
+from selection import as_selection, Selection
+from frame_budget import LOW_DETAIL, NO_ANTIALIAS, draw_level
 
 #------------------------------------------------------------------------------
 # Traits UI View for customizing a scatter plot.
@@ -213,7 +215,9 @@ class ScatterPlot(BaseXYPlot):
     # A selection on the lot is indicated by setting the index or value
     # datasource's 'selections' metadata item to a list of indices, or the
     # 'selection_mask' metadata to a boolean array of the same length as the
-    # datasource.
+    # datasource.  The 'selection_masks' metadata item can also be set to a
+    # list of boolean arrays or Selection objects, whose intersection is
+    # selected.
     #------------------------------------------------------------------------
 
     show_selection = Bool(True)
@@ -228,6 +232,11 @@ class ScatterPlot(BaseXYPlot):
 
     selection_outline_color = black_color_trait
 
+    # The maximum number of markers drawn when the plot is drawn at low
+    # quality (see **interaction_quality**), or at a low level of detail (see
+    # **detail_level**).
+    interaction_max_points = Int(10000)
+
     #------------------------------------------------------------------------
     # Private traits
     #------------------------------------------------------------------------
@@ -235,9 +244,13 @@ class ScatterPlot(BaseXYPlot):
     _cached_selected_pts = Trait(None, None, Array)
     _cached_selected_screen_pts = Array
     _cached_point_mask = Array
-    _cached_selection_point_mask = Array
+    _cached_selection_point_mask = Any
     _selection_cache_valid = Bool(False)
 
+    # The gathered points are only the visible ones, so they can be reused
+    # while all the data is visible.
+    _reuse_gathered_points = True
+
     #------------------------------------------------------------------------
     # Overridden PlotRenderer methods
     #------------------------------------------------------------------------
@@ -257,8 +270,8 @@ class ScatterPlot(BaseXYPlot):
             x_ary = data_array[0]
             y_ary = data_array[1]
         else:
-            x_ary = data_array[:, 0]
-            y_ary = data_array[:, 1]
+            return self._map_screen_points(data_array[:, 0],
+                                           data_array[:, 1])
 
         sx = self.index_mapper.map_screen(x_ary)
         sy = self.value_mapper.map_screen(y_ary)
@@ -327,19 +340,20 @@ class ScatterPlot(BaseXYPlot):
             else:
                 return None
         else:
-            # Brute force implementation
-            all_data = transpose(array([index_data, value_data]))
-            screen_points = around(self.map_screen(all_data))
-            if len(screen_points) == 0:
+            # Find the nearest point through the spatial index of BaseXYPlot,
+            # rather than mapping every point to screen space.
+            ndx = self.nearest_point(screen_pt, index_only=index_only)
+            if ndx is None:
                 return None
+            screen_point = around(self.map_screen(
+                array([[index_data[ndx], value_data[ndx]]])))[0]
             if index_only:
-                distances = abs(screen_points[:,0] - screen_pt[0])
+                distance = abs(screen_point[0] - screen_pt[0])
             else:
-                delta = screen_points - array([screen_pt])
-                distances = sqrt(sum(delta*delta, axis=1))
-            closest_ndx = nanargmin(distances)
-            if distances[closest_ndx] <= threshold:
-                return closest_ndx
+                delta = screen_point - array(screen_pt)
+                distance = sqrt(sum(delta*delta))
+            if distance <= threshold:
+                return ndx
             else:
                 return None
 
@@ -368,37 +382,49 @@ class ScatterPlot(BaseXYPlot):
             self._cache_valid = True
             return
 
-        index_range_mask = self.index_mapper.range.mask_data(index)
-        value_range_mask = self.value_mapper.range.mask_data(value)
-
-        nan_mask = (isfinite(index) & index_mask &
-                    isfinite(value) & value_mask)
-        point_mask = nan_mask & index_range_mask & value_range_mask
-
         if not self._cache_valid:
-            if not point_mask.all():
-                points = column_stack([index[point_mask], value[point_mask]])
-            else:
-                points = column_stack([index, value])
-            self._cached_data_pts = points
-            self._cached_point_mask = point_mask
-            self._cache_valid = True
+            index_range = self.index_mapper.range
+            value_range = self.value_mapper.range
+            # The bounds are read now, as the ranges may change while the
+            # points are prepared in the background.
+            bounds = (index_range.low, index_range.high,
+                      value_range.low, value_range.high)
+            prepared = self._prepare(
+                (index, value) + bounds,
+                lambda: self._visible_points(index, index_mask, value,
+                                             value_mask, *bounds))
+            if prepared is not None:
+                (points, point_mask), self._cache_valid = prepared
+                self._cached_data_pts = points
+                self._cached_point_mask = point_mask
+                self._screen_cache_valid = False
+            if not self._cache_valid:
+                # Keep drawing the previous points until the current ones are
+                # ready, without a selection, which may not match them.
+                self._cached_selected_pts = None
+                self._cached_selection_point_mask = None
+                self._selection_cache_valid = False
+                return
+        point_mask = self._cached_point_mask
 
         if not self._selection_cache_valid:
             indices = None
             # Check both datasources for metadata
             # XXX: Only one is used, and if both are defined, then self.index
             # happens to take precendence.  Perhaps this should be more
-            # structured?  Hopefully, when we create the Selection objects,
-            # we'll have to define a small algebra about how they are combined,
-            # and this will fall out...
-            point_mask = point_mask.copy()
+            # structured?
             for ds in (self.index, self.value):
                 if ds.metadata.get('selection_masks', None) is not None:
                     try:
+                        # Intersect the selections in their compact forms,
+                        # and only then drop the points that are not shown.
+                        n = len(index)
+                        selection = Selection(n, [(0, n)])
                         for mask in ds.metadata['selection_masks']:
-                            point_mask &= mask
-                        indices = where(point_mask == True)
+                            selection &= as_selection(mask, n)
+                        indices = selection.to_indices()
+                        indices = indices[point_mask[indices]]
+                        point_mask = Selection(n, indices=indices)
                         points = column_stack([index[indices], value[indices]])
                     except:
                         continue
@@ -422,6 +448,25 @@ class ScatterPlot(BaseXYPlot):
 
         return
 
+    @staticmethod
+    def _visible_points(index, index_mask, value, value_mask, index_low,
+                        index_high, value_low, value_high):
+        """ Returns the array of the (index, value) points that are valid and
+        within the ranges, and their mask.
+        """
+        index_range_mask = (index >= index_low) & (index <= index_high)
+        value_range_mask = (value >= value_low) & (value <= value_high)
+
+        nan_mask = (isfinite(index) & index_mask &
+                    isfinite(value) & value_mask)
+        point_mask = nan_mask & index_range_mask & value_range_mask
+
+        if not point_mask.all():
+            points = column_stack([index[point_mask], value[point_mask]])
+        else:
+            points = column_stack([index, value])
+        return points, point_mask
+
     def _gather_points_fast(self):
         if self._cache_valid and self._selection_cache_valid:
             return
@@ -477,6 +522,14 @@ class ScatterPlot(BaseXYPlot):
             gc.save_state()
             gc.clip_to_rect(self.x, self.y, self.width, self.height)
 
+            level = draw_level(self)
+            if level >= NO_ANTIALIAS:
+                gc.set_antialias(False)
+            if self.detail_level >= NO_ANTIALIAS:
+                points = self._deduplicate(points)
+            if level >= LOW_DETAIL:
+                points = self._decimate(points, level)
+
         self.render_markers_func(gc, points, self.marker, self.marker_size,
                        self.effective_color, self.line_width, self.effective_outline_color,
                        self.custom_symbol, point_mask=self._cached_point_mask)
@@ -493,6 +546,40 @@ class ScatterPlot(BaseXYPlot):
             self._draw_default_axes(gc)
             gc.restore_state()
 
+    def _deduplicate(self, points):
+        """ Returns the *points* without those drawn at the same pixel as a
+        later point, whose marker covers theirs.
+
+        Points with individual marker sizes are not deduplicated.
+        """
+        if isinstance(self.marker_size, ndarray) or len(points) < 2 or \
+                not isfinite(points[:, :2]).all():
+            return points
+        pixels = rint(points[:, :2]).astype(int64)
+        pixels -= pixels.min(axis=0)
+        keys = pixels[:, 0] * (pixels[:, 1].max() + 1) + pixels[:, 1]
+        # The first of the reversed points is the last drawn at each pixel.
+        last = len(points) - 1 - unique(keys[::-1], return_index=True)[1]
+        if len(last) == len(points):
+            return points
+        return points[sort(last)]
+
+    def _decimate(self, points, level=LOW_DETAIL):
+        """ Returns at most **interaction_max_points** of the *points*, half
+        as many at each level of detail above LOW_DETAIL, evenly spread
+        through them.
+
+        Points with individual marker sizes are not decimated.
+        """
+        if isinstance(self.marker_size, ndarray):
+            return points
+        max_points = max(self.interaction_max_points >> (level - LOW_DETAIL),
+                         1)
+        step = -(-len(points) // max_points)
+        if step > 1:
+            return points[::step]
+        return points
+
     def _render_icon(self, gc, x, y, width, height):
         point = array([x+width/2, y+height/2])
         self._render(gc, [point], icon_mode=True)
@@ -0,0 +1,427 @@
+""" Defines the Selection class and the as_selection() function.
+"""
+# Major library imports
+from numpy import array, array_equal, asarray, bincount, concatenate, \
+    count_nonzero, cumsum, diff, dtype, empty, flatnonzero, in1d, int8, \
+    int64, integer, intersect1d, ndarray, ones, searchsorted, setxor1d, \
+    union1d, unique, zeros
+
+
+class Selection(object):
+    """ A selection of some of the items of a data source.
+
+    A selection is stored in whichever of three forms is the most compact for
+    the way it was made:
+
+    * "intervals": a sorted list of disjoint index intervals, for contiguous
+      selections such as range selections on sorted data;
+    * "indices": a sorted array of the selected indices, for sparse
+      selections;
+    * "mask": a boolean mask of the same length as the data.
+
+    Selections can be combined with the ``&`` (intersection), ``|`` (union),
+    ``^`` (symmetric difference) and ``~`` (complement) operators, which work
+    on the compact forms whenever possible, so that combining selections of
+    a few items of a large data source does not allocate masks of the size of
+    the data.  Two selections are equal if they select the same items.
+
+    A selection can also be used wherever a boolean mask of the same length as
+    the data is expected: it can be converted by numpy.asarray(), used to
+    index an array or combined with a mask, and it has the attributes and
+    methods of boolean masks that consumers of selection metadata use, such
+    as **shape**, nonzero(), any(), sum() and indexing.  The mask is only
+    built when it is first needed, and the methods that can be answered from
+    the compact forms do not build it.
+    """
+
+    def __init__(self, length, intervals=None, indices=None, mask=None):
+        """ Creates a selection of the items of a data source of *length*
+        items.
+
+        At most one of the following arguments can be given, and the
+        selection is empty if none is:
+
+        *intervals* is a sequence of (start, stop) pairs of indices, with
+        *stop* excluded, which must be sorted and disjoint.
+
+        *indices* is a sequence of the selected indices, in any order.
+
+        *mask* is a boolean array of *length* items, which is not copied if it
+        is a flat array.
+        """
+        self.length = length
+        self._intervals = None
+        self._indices = None
+        self._mask = None
+        if mask is not None:
+            self.kind = "mask"
+            mask = asarray(mask, dtype=bool).ravel()
+            if len(mask) != length:
+                raise ValueError("The mask has %d items rather than %d"
+                                 % (len(mask), length))
+            self._mask = mask
+        elif indices is not None:
+            self.kind = "indices"
+            self._indices = unique(asarray(indices, dtype=int64).ravel())
+        else:
+            self.kind = "intervals"
+            if intervals is None or len(intervals) == 0:
+                self._intervals = empty((0, 2), dtype=int64)
+            else:
+                intervals = asarray(intervals, dtype=int64).reshape(-1, 2)
+                self._intervals = intervals[intervals[:, 0] < intervals[:, 1]]
+
+    @classmethod
+    def from_range(cls, data, low, high, sort_order="ascending"):
+        """ Returns the selection of the items of *data*, sorted in
+        *sort_order* ("ascending" or "descending"), that lie between *low*
+        and *high* inclusive.
+
+        This only takes a binary search of the data.
+        """
+        length = len(data)
+        if sort_order == "ascending":
+            start = searchsorted(data, low, side="left")
+            stop = searchsorted(data, high, side="right")
+        elif sort_order == "descending":
+            # Search the reversed (ascending) view of the data.
+            reversed_data = data[::-1]
+            start = length - searchsorted(reversed_data, high, side="right")
+            stop = length - searchsorted(reversed_data, low, side="left")
+        else:
+            raise ValueError("Cannot select a range of data with sort order "
+                             "%r" % sort_order)
+        if start < stop:
+            return cls(length, [(start, stop)])
+        return cls(length)
+
+    @property
+    def intervals(self):
+        """ The (n, 2) array of the sorted, disjoint (start, stop) intervals
+        of selected indices.
+        """
+        return self.to_intervals()
+
+    def count(self):
+        """ Returns the number of selected items.
+        """
+        if self.kind == "mask":
+            return int(count_nonzero(self._mask))
+        elif self.kind == "indices":
+            return len(self._indices)
+        intervals = self._intervals
+        return int((intervals[:, 1] - intervals[:, 0]).sum())
+
+    def to_mask(self):
+        """ Returns the boolean mask of the selected items.
+
+        The mask is cached, so it must not be modified.
+        """
+        if self._mask is None:
+            mask = zeros(self.length, dtype=bool)
+            if self.kind == "indices":
+                mask[self._indices] = True
+            else:
+                for start, stop in self._intervals:
+                    mask[start:stop] = True
+            mask.flags.writeable = False
+            self._mask = mask
+        return self._mask
+
+    def to_indices(self):
+        """ Returns the sorted array of the selected indices.
+
+        The array is cached, so it must not be modified.
+        """
+        if self._indices is None:
+            if self.kind == "mask":
+                indices = flatnonzero(self._mask)
+            else:
+                indices = _expand_intervals(self._intervals)
+            indices.flags.writeable = False
+            self._indices = indices
+        return self._indices
+
+    def to_intervals(self):
+        """ Returns the (n, 2) array of the sorted, disjoint (start, stop)
+        intervals of selected indices.
+
+        The array is cached, so it must not be modified.
+        """
+        if self._intervals is None:
+            if self.kind == "mask":
+                intervals = _runs(self._mask)
+            else:
+                indices = self._indices
+                if len(indices) == 0:
+                    intervals = empty((0, 2), dtype=int64)
+                else:
+                    breaks = flatnonzero(diff(indices) != 1)
+                    starts = concatenate((indices[:1], indices[breaks + 1]))
+                    stops = concatenate((indices[breaks] + 1,
+                                         indices[-1:] + 1))
+                    intervals = array([starts, stops], dtype=int64).T
+            intervals.flags.writeable = False
+            self._intervals = intervals
+        return self._intervals
+
+    def contains(self, indices):
+        """ Returns a boolean array telling which of the *indices* are
+        selected.
+        """
+        indices = asarray(indices, dtype=int64)
+        if self.kind == "mask":
+            return self._mask[indices]
+        elif self.kind == "indices":
+            return in1d(indices, self._indices)
+        intervals = self._intervals
+        positions = searchsorted(intervals[:, 0], indices, side="right") - 1
+        result = positions >= 0
+        result[result] = indices[result] < intervals[positions[result], 1]
+        return result
+
+    #------------------------------------------------------------------------
+    # Set operations
+    #------------------------------------------------------------------------
+
+    def __and__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        if self.kind == "indices":
+            return Selection(self.length,
+                             indices=self._indices[other.contains(self._indices)])
+        elif other.kind == "indices":
+            return Selection(self.length,
+                             indices=other._indices[self.contains(other._indices)])
+        elif self.kind == "mask" or other.kind == "mask":
+            return Selection(self.length,
+                             mask=self.to_mask() & other.to_mask())
+        return Selection(self.length, _sweep(self._intervals,
+                                             other._intervals, 2))
+
+    def __or__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        if self.kind == "mask" or other.kind == "mask":
+            return Selection(self.length,
+                             mask=self.to_mask() | other.to_mask())
+        elif self.kind == "indices" and other.kind == "indices":
+            return Selection(self.length,
+                             indices=union1d(self._indices, other._indices))
+        return Selection(self.length, _sweep(self.to_intervals(),
+                                             other.to_intervals(), 1))
+
+    def __xor__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        if self.kind == "mask" or other.kind == "mask":
+            return Selection(self.length,
+                             mask=self.to_mask() ^ other.to_mask())
+        elif self.kind == "indices" and other.kind == "indices":
+            return Selection(self.length, indices=setxor1d(
+                self._indices, other._indices, assume_unique=True))
+        # Each operand's intervals are disjoint, so the items covered once
+        # are those selected by exactly one operand.
+        return Selection(self.length, _sweep(self.to_intervals(),
+                                             other.to_intervals(), 1, 1))
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self):
+        """ Returns the selection of the items that are not selected.
+        """
+        if self.kind == "mask":
+            return Selection(self.length, mask=~self._mask)
+        bounds = self.to_intervals().ravel()
+        starts = concatenate(([0], bounds[1::2]))
+        stops = concatenate((bounds[::2], [self.length]))
+        keep = starts < stops
+        return Selection(self.length,
+                         array([starts[keep], stops[keep]], dtype=int64).T)
+
+    def __eq__(self, other):
+        if len(getattr(other, "shape", ())) == 1 or \
+                isinstance(other, Selection):
+            if len(other) != self.length:
+                return False
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        if self.kind == "mask" and other.kind == "mask":
+            return array_equal(self._mask, other._mask)
+        return array_equal(self.to_intervals(), other.to_intervals())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    __hash__ = None
+
+    def _coerce(self, other):
+        """ Returns *other* as a selection of the same data source, or
+        NotImplemented if it cannot be one.
+        """
+        if isinstance(other, ndarray) and other.dtype == bool:
+            other = Selection(other.size, mask=other)
+        elif not isinstance(other, Selection):
+            return NotImplemented
+        if other.length != self.length:
+            raise ValueError("Cannot combine selections of %d and %d items"
+                             % (self.length, other.length))
+        return other
+
+    #------------------------------------------------------------------------
+    # Mask protocol
+    #------------------------------------------------------------------------
+
+    def __array__(self, dtype=None):
+        mask = self.to_mask()
+        if dtype is not None and mask.dtype != dtype:
+            return mask.astype(dtype)
+        return mask
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.to_mask())
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, long, integer)):
+            if key < 0:
+                key += self.length
+            if not 0 <= key < self.length:
+                raise IndexError("index %d is out of bounds for a selection "
+                                 "of %d items" % (key, self.length))
+            return bool(self.contains([key])[0])
+        return self.to_mask()[key]
+
+    #------------------------------------------------------------------------
+    # Boolean mask methods
+    #------------------------------------------------------------------------
+
+    dtype = dtype(bool)
+
+    ndim = 1
+
+    @property
+    def shape(self):
+        return (self.length,)
+
+    @property
+    def size(self):
+        return self.length
+
+    def nonzero(self):
+        """ Returns a tuple of the array of the selected indices, like
+        ndarray.nonzero().
+        """
+        return (self.to_indices().copy(),)
+
+    def any(self, *args, **kw):
+        if args or kw:
+            return self.to_mask().any(*args, **kw)
+        return self.count() > 0
+
+    def all(self, *args, **kw):
+        if args or kw:
+            return self.to_mask().all(*args, **kw)
+        return self.count() == self.length
+
+    def sum(self, *args, **kw):
+        if args or kw:
+            return self.to_mask().sum(*args, **kw)
+        return self.count()
+
+    def astype(self, dtype):
+        return asarray(self, dtype=dtype)
+
+    def copy(self):
+        """ Returns the boolean mask of the selected items, as a new array.
+        """
+        return self.to_mask().copy()
+
+    def tolist(self):
+        return self.to_mask().tolist()
+
+    def __repr__(self):
+        if self.kind == "mask":
+            return "Selection(%d, mask=%r)" % (self.length, self._mask)
+        elif self.kind == "indices":
+            return "Selection(%d, indices=%r)" % (self.length,
+                                                  self._indices.tolist())
+        return "Selection(%d, %r)" % (self.length, self._intervals.tolist())
+
+
+def as_selection(value, length=None):
+    """ Returns the selection described by *value* of the items of a data
+    source of *length* items.
+
+    *value* can be a Selection, a boolean mask or a sequence of indices, which
+    are the forms that selections take in the metadata of data sources.
+    *length* is required for sequences of indices.
+    """
+    if isinstance(value, Selection):
+        selection = value
+    else:
+        value = asarray(value)
+        if value.dtype == bool:
+            selection = Selection(value.size, mask=value)
+        elif length is None:
+            raise ValueError("The length of the data source is required to "
+                             "make a selection of indices")
+        else:
+            selection = Selection(length, indices=value)
+    if length is not None and selection.length != length:
+        raise ValueError("The selection has %d items rather than %d"
+                         % (selection.length, length))
+    return selection
+
+
+def _expand_intervals(intervals):
+    """ Returns the array of the indices in the sorted, disjoint, non-empty
+    *intervals*.
+    """
+    starts, stops = intervals[:, 0], intervals[:, 1]
+    lengths = stops - starts
+    total = int(lengths.sum())
+    if total == 0:
+        return empty(0, dtype=int64)
+    # Build the indices as the cumulative sum of their steps: 1 within an
+    # interval, and the gap to the next interval at its end.
+    steps = ones(total, dtype=int64)
+    steps[0] = starts[0]
+    steps[cumsum(lengths)[:-1]] = starts[1:] - stops[:-1] + 1
+    return cumsum(steps)
+
+
+def _runs(mask):
+    """ Returns the (start, stop) intervals of the runs of True in *mask*.
+    """
+    edges = diff(concatenate(([0], mask.view(int8), [0])))
+    return array([flatnonzero(edges == 1), flatnonzero(edges == -1)],
+                 dtype=int64).T
+
+
+def _sweep(intervals1, intervals2, min_cover, max_cover=2):
+    """ Returns the intervals of the items covered by between *min_cover* and
+    *max_cover* of the two lists of sorted, disjoint intervals.
+    """
+    starts = concatenate((intervals1[:, 0], intervals2[:, 0]))
+    stops = concatenate((intervals1[:, 1], intervals2[:, 1]))
+    bounds = unique(concatenate((starts, stops)))
+    if len(bounds) == 0:
+        return empty((0, 2), dtype=int64)
+    # The cover of the items between consecutive bounds.
+    n = len(bounds)
+    cover = cumsum(bincount(searchsorted(bounds, starts), minlength=n) -
+                   bincount(searchsorted(bounds, stops), minlength=n))
+    runs = _runs((cover >= min_cover) & (cover <= max_cover))
+    return bounds[runs]
@@ -0,0 +1,198 @@
+""" Defines the SelectionStatistics class.
+"""
+# Major library imports
+from math import sqrt
+
+# Local relative imports
+from selection import Selection
+
+
+class SelectionStatistics(object):
+    """ Running sums of the selected items of two data arrays, x and y.
+
+    The sums (n, sum_x, sum_y, sum_xx, sum_xy and sum_yy) are sufficient to
+    compute the means, variances and correlation of the selected items and
+    their least squares line.  When the selection changes, only the items that
+    were added to it or removed from it are summed, so that following a
+    selection as it grows or shrinks costs little, whatever the size of the
+    data.
+
+    The sums are kept of the differences between the values and a reference
+    point, the first values summed, so that they stay precise when the values
+    have a large offset, such as timestamps.
+    """
+
+    def __init__(self, x, y):
+        """ Creates the statistics of an empty selection of the items of the
+        arrays *x* and *y*, which must have the same length.
+        """
+        if len(x) != len(y):
+            raise ValueError("Cannot compute the statistics of arrays of %d "
+                             "and %d items" % (len(x), len(y)))
+        self.x = x
+        self.y = y
+        self.selection = Selection(len(x))
+        self._reset()
+
+    def update(self, selection):
+        """ Updates the sums for the new *selection*.
+
+        If most of the selection changed, the sums are computed from scratch
+        rather than updated, which is cheaper and does not accumulate rounding
+        errors.
+        """
+        changed = selection ^ self.selection
+        if changed.count() > selection.count():
+            self._reset()
+            self._add(selection.to_indices(), 1)
+        else:
+            self._add((changed & selection).to_indices(), 1)
+            self._add((changed & self.selection).to_indices(), -1)
+            if self.n == 0:
+                # Drop the rounding errors.
+                self._reset()
+        self.selection = selection
+
+    #------------------------------------------------------------------------
+    # Sums
+    #------------------------------------------------------------------------
+
+    @property
+    def sum_x(self):
+        """ The sum of the selected x values.
+        """
+        return self.n * self._x0 + self._sum_dx
+
+    @property
+    def sum_y(self):
+        """ The sum of the selected y values.
+        """
+        return self.n * self._y0 + self._sum_dy
+
+    @property
+    def sum_xx(self):
+        """ The sum of the squares of the selected x values.
+        """
+        return self._sum_dxdx + self._x0 * (2.0 * self._sum_dx +
+                                            self.n * self._x0)
+
+    @property
+    def sum_xy(self):
+        """ The sum of the products of the selected x and y values.
+        """
+        return (self._sum_dxdy + self._x0 * self._sum_dy +
+                self._y0 * (self._sum_dx + self.n * self._x0))
+
+    @property
+    def sum_yy(self):
+        """ The sum of the squares of the selected y values.
+        """
+        return self._sum_dydy + self._y0 * (2.0 * self._sum_dy +
+                                            self.n * self._y0)
+
+    #------------------------------------------------------------------------
+    # Reductions
+    #------------------------------------------------------------------------
+
+    @property
+    def mean_x(self):
+        """ The mean of the selected x values, or None if none is selected.
+        """
+        if self.n == 0:
+            return None
+        return self._x0 + self._sum_dx / self.n
+
+    @property
+    def mean_y(self):
+        """ The mean of the selected y values, or None if none is selected.
+        """
+        if self.n == 0:
+            return None
+        return self._y0 + self._sum_dy / self.n
+
+    @property
+    def var_x(self):
+        """ The (population) variance of the selected x values, or None if
+        none is selected.
+        """
+        if self.n == 0:
+            return None
+        mean_dx = self._sum_dx / self.n
+        return max(self._sum_dxdx / self.n - mean_dx ** 2, 0.0)
+
+    @property
+    def var_y(self):
+        """ The (population) variance of the selected y values, or None if
+        none is selected.
+        """
+        if self.n == 0:
+            return None
+        mean_dy = self._sum_dy / self.n
+        return max(self._sum_dydy / self.n - mean_dy ** 2, 0.0)
+
+    @property
+    def covariance(self):
+        """ The (population) covariance of the selected x and y values, or
+        None if none is selected.
+        """
+        if self.n == 0:
+            return None
+        return (self._sum_dxdy / self.n -
+                (self._sum_dx / self.n) * (self._sum_dy / self.n))
+
+    @property
+    def correlation(self):
+        """ The correlation coefficient of the selected x and y values, or
+        None if it is not defined.
+        """
+        if self.n < 2:
+            return None
+        var_product = self.var_x * self.var_y
+        if var_product <= 0.0:
+            return None
+        return self.covariance / sqrt(var_product)
+
+    def fit(self):
+        """ Returns the (slope, intercept) of the least squares line through
+        the selected points, or None if it is not defined.
+        """
+        if self.n < 2:
+            return None
+        var_x = self.var_x
+        if var_x <= 0.0:
+            return None
+        slope = self.covariance / var_x
+        return (slope, self.mean_y - slope * self.mean_x)
+
+    #------------------------------------------------------------------------
+    # Private methods
+    #------------------------------------------------------------------------
+
+    def _reset(self):
+        self.n = 0
+        # The reference point, set when the first values are summed.
+        self._x0 = 0.0
+        self._y0 = 0.0
+        self._sum_dx = 0.0
+        self._sum_dy = 0.0
+        self._sum_dxdx = 0.0
+        self._sum_dxdy = 0.0
+        self._sum_dydy = 0.0
+
+    def _add(self, indices, sign):
+        """ Adds the items at *indices* to the sums if *sign* is 1, or removes
+        them if it is -1.
+        """
+        if len(indices) == 0:
+            return
+        if self.n == 0:
+            self._x0 = float(self.x[indices[0]])
+            self._y0 = float(self.y[indices[0]])
+        dx = self.x[indices] - self._x0
+        dy = self.y[indices] - self._y0
+        self.n += sign * len(indices)
+        self._sum_dx += sign * dx.sum()
+        self._sum_dy += sign * dy.sum()
+        self._sum_dxdx += sign * dx.dot(dx)
+        self._sum_dxdy += sign * dx.dot(dy)
+        self._sum_dydy += sign * dy.dot(dy)
@@ -10,6 +10,83 @@ except ImportError:
     pass
 
 
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+
+from numpy import asarray, empty, float32, uint8
+
+# Thread pools used for chunked colormapping, keyed by thread count.  They are
+# created on first use.
+_thread_pools = {}
+
+
+def _get_thread_pool(num_threads):
+    pool = _thread_pools.get(num_threads)
+    if pool is None:
+        pool = _thread_pools[num_threads] = ThreadPool(num_threads)
+    return pool
+
+
+def _map_colors_chunked(func, dtype, data_array, args, out, num_threads):
+    """ Applies a colormapping function to chunks of *data_array* in
+    parallel, writing every chunk into a single output array.
+
+    The colormapping functions release the GIL while they run, so the chunks
+    are processed concurrently on a pool of threads.
+    """
+    data_array = asarray(data_array)
+    shape = data_array.shape + (4,)
+    if out is None:
+        out = empty(shape, dtype)
+    elif (out.shape != shape or out.dtype != dtype or
+            not out.flags.c_contiguous):
+        raise ValueError("out must be a C-contiguous %s array of shape %s"
+                         % (dtype.__name__, shape))
+
+    if not num_threads:
+        num_threads = cpu_count()
+    n = data_array.size
+    if num_threads <= 1 or n < 2 * num_threads:
+        return func(data_array, *args, out=out)
+
+    # reshape() only copies when the data is not contiguous; the output
+    # array is always contiguous, so flat_out is a view into it.
+    flat_data = data_array.reshape(n)
+    flat_out = out.reshape(n, 4)
+    chunk_size = -(-n // num_threads)
+
+    def map_chunk(start):
+        stop = start + chunk_size
+        func(flat_data[start:stop], *args, out=flat_out[start:stop])
+
+    _get_thread_pool(num_threads).map(map_chunk, range(0, n, chunk_size))
+    return out
+
+
+def map_colors_parallel(data_array, steps, low, high, red_lut, green_lut,
+        blue_lut, alpha_lut, out=None, num_threads=None):
+    """ Parallel version of map_colors.
+
+    The data are split into *num_threads* chunks which are mapped on a pool of
+    threads.  If *num_threads* is None or 0, the number of CPUs is used.
+    """
+    return _map_colors_chunked(map_colors, float32, data_array,
+        (steps, low, high, red_lut, green_lut, blue_lut, alpha_lut),
+        out, num_threads)
+
+
+def map_colors_uint8_parallel(data_array, steps, low, high, red_lut,
+        green_lut, blue_lut, alpha_lut, out=None, num_threads=None):
+    """ Parallel version of map_colors_uint8.
+
+    The data are split into *num_threads* chunks which are mapped on a pool of
+    threads.  If *num_threads* is None or 0, the number of CPUs is used.
+    """
+    return _map_colors_chunked(map_colors_uint8, uint8, data_array,
+        (steps, low, high, red_lut, green_lut, blue_lut, alpha_lut),
+        out, num_threads)
+
+
 
 
 #try:
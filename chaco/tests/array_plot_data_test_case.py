@@ -50,6 +50,29 @@ class ArrayPlotDataTestCase(unittest.TestCase):
             plot_data.del_data('Grumpy')
             self.assertEqual(events, [{'removed': ['Grumpy']}])
 
+    def test_no_copy(self):
+        data = numpy.arange(10.0)
+        plot_data = ArrayPlotData(x=memoryview(data))
+        self.assertTrue(numpy.shares_memory(plot_data.get_data('x'), data))
+
+    def test_batch_updates(self):
+        plot_data = ArrayPlotData(a=numpy.ones(3), b=numpy.ones(3))
+
+        with self.monitor_events(plot_data) as events:
+            with plot_data.batch_updates():
+                plot_data.set_data('a', numpy.zeros(3))
+                plot_data.set_data('c', numpy.zeros(3))
+                plot_data.set_data('a', numpy.ones(3))
+                plot_data.del_data('b')
+                plot_data.set_data('b', numpy.zeros(3))
+                plot_data.set_data('d', numpy.zeros(3))
+                plot_data.del_data('d')
+                self.assertEqual(events, [])
+            self.assertEqual(events, [{'changed': ['a', 'b'],
+                                       'added': ['c']}])
+        self.assertEqual(plot_data.get_data('b').tolist(), [0.0, 0.0, 0.0])
+        self.assertNotIn('d', plot_data.list_data())
+
 
 if __name__ == '__main__':
     import nose
@@ -3,12 +3,14 @@ Unit tests for utility functions in chaco.base
 """
 
 import unittest
+from array import array as PyArray
 from math import sqrt
-from numpy import arange, array, linspace, nan, ones
+from numpy import arange, array, linspace, nan, ones, shares_memory
 from numpy.testing import assert_equal, assert_almost_equal, assert_array_equal
 
-from chaco.base import (arg_find_runs, arg_true_runs, bin_search, find_runs,
-                       intersect_range, reverse_map_1d, point_line_distance)
+from chaco.base import (arg_find_runs, arg_true_runs, as_data_array,
+                        bin_search, find_runs, intersect_range,
+                        reverse_map_1d, point_line_distance)
 
 
 class BinSearchTestCase(unittest.TestCase):
@@ -538,6 +540,42 @@ class IntersectRangeTestCase(unittest.TestCase):
         print mask ^ result
         assert_array_equal(result, mask)
 
+class AsDataArrayTestCase(unittest.TestCase):
+
+    def test_ndarray(self):
+        data = arange(10.0)
+        self.assertIs(as_data_array(data), data)
+
+    def test_array_interface(self):
+        data = arange(10.0)
+
+        class Column(object):
+            def __array__(self, dtype=None):
+                return data
+
+        result = as_data_array(Column())
+        self.assertIs(result, data)
+
+    def test_memoryview(self):
+        data = arange(10.0)[::2]
+        result = as_data_array(memoryview(data))
+        self.assertTrue(shares_memory(result, data))
+        assert_array_equal(result, data)
+
+    def test_python_array(self):
+        data = PyArray('d', [1.0, 2.0, 3.0])
+        result = as_data_array(data)
+        assert_array_equal(result, [1.0, 2.0, 3.0])
+        # The array is copied, as growing it reallocates its buffer.
+        data.extend([4.0] * 100000)
+        data[0] = 5.0
+        assert_array_equal(result, [1.0, 2.0, 3.0])
+        self.assertEqual(len(as_data_array(PyArray('i'))), 0)
+
+    def test_list(self):
+        assert_array_equal(as_data_array([1, 2, 3]), [1, 2, 3])
+
+
 if __name__ == '__main__':
     import nose
     nose.run()
@@ -1,6 +1,8 @@
 import unittest
 
-from numpy import allclose, array, ravel
+from numpy import allclose, arange, array, empty, float32, linspace, nan, \
+    ravel, uint8, uint16
+from numpy.testing import assert_array_equal
 
 from chaco.api import ArrayDataSource, ColorMapper, DataRange1D
 
@@ -73,6 +75,106 @@ class LinearSegmentedColormapTestCase(unittest.TestCase):
 
         return
 
+    def test_map_uint8_integer_data(self):
+        """ Integer images are mapped through the full-domain lookup table.
+        """
+        self.colormap.range.set_bounds(10, 200)
+        data = arange(512, dtype=uint8).reshape(16, 32)
+
+        result = self.colormap.map_uint8(data)
+        expected = self.colormap.map_uint8(data.astype(float))
+
+        self.assertEqual(result.shape, (16, 32, 4))
+        self.assertEqual(result.dtype, uint8)
+        assert_array_equal(result, expected)
+
+        # The lookup table follows changes to the range.
+        self.colormap.range.set_bounds(0, 50)
+        result = self.colormap.map_uint8(data)
+        expected = self.colormap.map_uint8(data.astype(float))
+        assert_array_equal(result, expected)
+
+    def test_map_uint8_uint16_data(self):
+        self.colormap.range.set_bounds(1000, 40000)
+        data = arange(65536, dtype=uint16)[::-1].reshape(256, 256)
+
+        result = self.colormap.map_uint8(data)
+        expected = self.colormap.map_uint8(data.astype(float))
+        assert_array_equal(result, expected)
+
+        # Small arrays do not trigger a full 16-bit table.
+        self.colormap._recalculate()
+        result = self.colormap.map_uint8(data[:2, :2])
+        assert_array_equal(result, expected[:2, :2])
+        self.assertNotIn(data.dtype, self.colormap._integer_luts)
+
+    def test_parallel_map(self):
+        """ Large arrays are mapped in chunks on several threads.
+        """
+        self.colormap.range.set_bounds(-1.0, 1.0)
+        data = linspace(-2.0, 2.0, 1001).reshape(7, 143)
+        data[3, 5] = nan
+        expected = self.colormap.map_screen(data)
+        expected_uint8 = self.colormap.map_uint8(data)
+
+        self.colormap.trait_set(parallel_threshold=100, num_threads=3)
+        assert_array_equal(self.colormap.map_screen(data), expected)
+        assert_array_equal(self.colormap.map_uint8(data), expected_uint8)
+
+        # Non-contiguous input is handled as well.
+        assert_array_equal(self.colormap.map_screen(data[:, ::2]),
+                           expected[:, ::2])
+
+    def test_map_into_out(self):
+        self.colormap.range.set_bounds(0.0, 1.0)
+        data = linspace(0.0, 1.0, 12).reshape(3, 4)
+
+        out = empty((3, 4, 4), dtype=float32)
+        result = self.colormap.map_screen(data, out=out)
+        self.assertIs(result, out)
+        assert_array_equal(out, self.colormap.map_screen(data))
+
+        out = empty((3, 4, 4), dtype=uint8)
+        result = self.colormap.map_uint8(data, out=out)
+        self.assertIs(result, out)
+        assert_array_equal(out, self.colormap.map_uint8(data))
+
+        result = self.colormap.map_uint8((data * 255).astype(uint8), out=out)
+        self.assertIs(result, out)
+
+        with self.assertRaises(ValueError):
+            self.colormap.map_uint8(data, out=empty((4, 3, 4), dtype=uint8))
+
+    def test_shared_luts(self):
+        """ Mappers with the same segment data share their lookup tables.
+        """
+        from chaco.default_colormaps import jet
+
+        cm1 = jet(DataRange1D(low=0.0, high=1.0))
+        cm2 = jet(DataRange1D(low=0.0, high=1.0), steps=256)
+        cm1._recalculate()
+        cm2._recalculate()
+        self.assertIs(cm1._red_lut, cm2._red_lut)
+        self.assertIs(cm1._alpha_lut_uint8, cm2._alpha_lut_uint8)
+        self.assertFalse(cm1._red_lut.flags.writeable)
+
+        # A different number of steps gets its own tables.
+        cm3 = jet(DataRange1D(low=0.0, high=1.0), steps=64)
+        cm3._recalculate()
+        self.assertEqual(len(cm3._red_lut), 64)
+
+        # Reversing one mapper does not affect the others.
+        data = linspace(0.0, 1.0, 10)
+        expected = cm2.map_screen(data)
+        cm1.reverse_colormap()
+        self.assertIsNot(cm1._red_lut, cm2._red_lut)
+        self.assertFalse((cm1.map_screen(data) == expected).all())
+        assert_array_equal(cm2.map_screen(data), expected)
+
+        cm4 = jet(DataRange1D(low=0.0, high=1.0))
+        cm4.reverse_colormap()
+        self.assertIs(cm4._red_lut, cm1._red_lut)
+
     def test_array_factory(self):
         """ Test that the array factory creates valid colormap. """
 
@@ -48,6 +48,20 @@ class DefaultColormapsTestCase(unittest.TestCase):
             self.assertEqual(f_cmapper.range.low, 0.0)
             self.assertEqual(f_cmapper.range.high, 1.0)
 
+    def test_colormap_tables_not_shared(self):
+        # Colormaps built from the lazily loaded tables get their own copy,
+        # so reversing one does not affect later ones.
+        x = np.linspace(0.0, 1.0, 8)
+        datarange = DataRange1D(low_setting=0.0, high_setting=1.0)
+        rgba = default_colormaps.jet(datarange).map_screen(x)
+        default_colormaps.jet(datarange).reverse_colormap()
+        assert_array_equal(default_colormaps.jet(datarange).map_screen(x),
+                           rgba)
+        palette = default_colormaps.viridis(datarange).map_screen(x)
+        default_colormaps.viridis(datarange).reverse_colormap()
+        assert_array_equal(default_colormaps.viridis(datarange).map_screen(x),
+                           palette)
+
     def test_discrete_colormaps_smoke(self):
         # Runs some data through each of the default colormaps and do basic
         # sanity checks.
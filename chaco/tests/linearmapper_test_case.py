@@ -1,6 +1,6 @@
 
 import unittest
-from numpy import array
+from numpy import array, empty, float32
 from numpy.testing import assert_array_almost_equal, assert_equal
 
 
@@ -290,6 +290,25 @@ class LinearMapperTestCase(unittest.TestCase):
         result = mapper.map_screen(ary)
         assert_array_almost_equal(result, array([50, 60, 70, 80, 90, 100]))
 
+    def test_map_into_out(self):
+        ary = array([5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+        ds = ArrayDataSource(ary)
+        r = DataRange1D(ds)
+        mapper = LinearMapper(range=r, low_pos=50, high_pos=100)
+        out = empty(6)
+        result = mapper.map_screen(ary, out=out)
+        self.assertIs(result, out)
+        assert_equal(out, array([50, 60, 70, 80, 90, 100]))
+
+    def test_float32_screen_dtype(self):
+        ary = array([5.0, 6.0, 7.0, 8.0, 9.0, 10.0])
+        ds = ArrayDataSource(ary)
+        r = DataRange1D(ds)
+        mapper = LinearMapper(range=r, low_pos=50, high_pos=100,
+                              screen_dtype='float32')
+        result = mapper.map_screen(ary)
+        self.assertEqual(result.dtype, float32)
+        assert_array_almost_equal(result, array([50, 60, 70, 80, 90, 100]))
 
 
 if __name__ == '__main__':
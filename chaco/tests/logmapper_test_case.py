@@ -1,6 +1,6 @@
 
 import unittest
-from numpy import array, nan
+from numpy import array, empty, float32, nan
 from numpy.testing import assert_array_almost_equal, assert_equal
 
 from chaco.api import ArrayDataSource, DataRange1D, LogMapper
@@ -73,6 +73,42 @@ class LogMapperTestCase(unittest.TestCase):
         assert_array_almost_equal(result, [0, 20, 10, 20, 20, 30])
         return
 
+    def test_map_into_out(self):
+        ary = array([1.0, 10.0, 100.0, 1000.0, 10000.0])
+        ds = ArrayDataSource(ary)
+        r = DataRange1D(ds)
+        mapper = LogMapper(range=r, low_pos=50, high_pos=90,
+                           screen_dtype='float32')
+        out = empty(5)
+        result = mapper.map_screen(ary, out=out)
+        self.assertIs(result, out)
+        assert_array_almost_equal(out, [50, 60, 70, 80, 90])
+        result = mapper.map_screen(ary)
+        self.assertEqual(result.dtype, float32)
+        assert_array_almost_equal(result, [50, 60, 70, 80, 90])
+
+    def test_log_data_cache(self):
+        ary = array([1.0, 10.0, 100.0, 1000.0, 10000.0])
+        ds = ArrayDataSource(ary)
+        r = DataRange1D(ds)
+        mapper = LogMapper(range=r, low_pos=50, high_pos=90)
+        mapper.map_screen(ary)
+        log_data = mapper._log_cache[2]
+
+        # Changing the screen bounds reuses the logarithm of the data.
+        mapper.high_pos = 130
+        result = mapper.map_screen(ary)
+        self.assertIs(mapper._log_cache[2], log_data)
+        assert_array_almost_equal(result, [50, 70, 90, 110, 130])
+
+        # Changing the data in place and notifying invalidates it.
+        ary[4] = 100000.0
+        ds.set_data(ary)
+        result = mapper.map_screen(ary)
+        self.assertIsNot(mapper._log_cache[2], log_data)
+        assert_array_almost_equal(result, [50, 66, 82, 98, 130])
+        return
+
 
 if __name__ == '__main__':
     import nose
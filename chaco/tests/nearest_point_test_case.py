@@ -0,0 +1,130 @@
+"""
+Test cases for the BaseXYPlot's nearest_point() function
+"""
+
+import unittest
+from numpy import argsort, column_stack, hypot, random, sort
+from chaco.api import ArrayDataSource, ArrayPlotData, Plot
+
+
+class NearestPointTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.random = random.RandomState(0)
+
+    def make_renderer(self, x, y, sort_order="none", orientation="h",
+                      type="scatter"):
+        pd = ArrayPlotData(x=ArrayDataSource(x, sort_order=sort_order), y=y)
+        plot = Plot(pd, orientation=orientation)
+        renderer = plot.plot(("x", "y"), type=type)[0]
+        plot.outer_bounds = [400, 300]
+        plot.do_layout()
+        return renderer
+
+    def brute_force(self, renderer, screen_pt, threshold=0.0,
+                    index_only=False):
+        x = renderer.index.get_data()
+        y = renderer.value.get_data()
+        sx, sy = renderer.map_screen(column_stack((x, y))).T
+        if index_only:
+            if renderer.orientation == "h":
+                distances = abs(sx - screen_pt[0])
+            else:
+                distances = abs(sy - screen_pt[1])
+        else:
+            distances = hypot(sx - screen_pt[0], sy - screen_pt[1])
+        ndx = distances.argmin()
+        if threshold > 0.0 and distances[ndx] >= threshold:
+            return None, None
+        return ndx, distances
+
+    def check(self, renderer, threshold=0.0, index_only=False):
+        for i in range(50):
+            screen_pt = self.random.uniform(0, 400, 2)
+            ndx = renderer.nearest_point(screen_pt, threshold, index_only)
+            expected, distances = self.brute_force(renderer, screen_pt,
+                                                   threshold, index_only)
+            if expected is None:
+                self.assertIsNone(ndx)
+            else:
+                # Ties are broken either way.
+                self.assertEqual(distances[ndx], distances[expected])
+
+    def test_unsorted(self):
+        x = self.random.rand(5000)
+        y = self.random.rand(5000)
+        renderer = self.make_renderer(x, y)
+        self.check(renderer)
+        self.check(renderer, threshold=10.0)
+        self.check(renderer, index_only=True)
+
+    def test_sorted(self):
+        x = sort(self.random.rand(5000))
+        y = self.random.rand(5000)
+        renderer = self.make_renderer(x, y, sort_order="ascending",
+                                      type="line")
+        self.check(renderer)
+        self.check(renderer, index_only=True)
+        self.check(renderer, threshold=2.0, index_only=True)
+        self.assertIsNone(renderer._nearest_point_index[2])
+
+    def test_descending(self):
+        x = sort(self.random.rand(1000))[::-1].copy()
+        y = self.random.rand(1000)
+        renderer = self.make_renderer(x, y, sort_order="descending")
+        self.check(renderer)
+        self.check(renderer, index_only=True)
+
+    def test_vertical(self):
+        x = self.random.rand(1000)
+        y = self.random.rand(1000)
+        renderer = self.make_renderer(x, y, orientation="v")
+        self.check(renderer)
+        self.check(renderer, index_only=True)
+
+    def test_nan(self):
+        x = self.random.rand(1000)
+        y = self.random.rand(1000)
+        x[::7] = float("nan")
+        y[::5] = float("nan")
+        renderer = self.make_renderer(x, y)
+        for i in range(50):
+            ndx = renderer.nearest_point(self.random.uniform(0, 400, 2))
+            self.assertTrue(ndx % 7 != 0 and ndx % 5 != 0)
+
+    def test_index_cached(self):
+        x = self.random.rand(1000)
+        renderer = self.make_renderer(x, self.random.rand(1000))
+        renderer.nearest_point((200, 150))
+        index = renderer._nearest_point_index
+        renderer.nearest_point((100, 100))
+        self.assertIs(renderer._nearest_point_index, index)
+
+        # New data invalidates the index.
+        renderer.index.set_data(x[argsort(x)])
+        self.assertIsNone(renderer._nearest_point_index)
+        renderer.nearest_point((100, 100))
+        self.assertIsNot(renderer._nearest_point_index, index)
+
+    def test_map_index_unsorted(self):
+        # map_index() of line plots finds the nearest point along the index
+        # axis, rather than requiring sorted index data.
+        x = self.random.rand(1000)
+        renderer = self.make_renderer(x, self.random.rand(1000), type="line")
+        for i in range(50):
+            screen_pt = self.random.uniform(0, 400, 2)
+            ndx = renderer.map_index(screen_pt, threshold=0.0,
+                                     outside_returns_none=False)
+            expected, distances = self.brute_force(renderer, screen_pt,
+                                                   index_only=True)
+            self.assertEqual(distances[ndx], distances[expected])
+
+    def test_empty(self):
+        renderer = self.make_renderer(self.random.rand(0),
+                                      self.random.rand(0))
+        self.assertIsNone(renderer.nearest_point((100, 100)))
+
+
+if __name__ == '__main__':
+    import nose
+    nose.run()
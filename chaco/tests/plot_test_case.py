@@ -1,6 +1,6 @@
 import unittest
 
-from numpy import arange
+from numpy import arange, shares_memory
 
 # Chaco imports
 from chaco.api import ArrayPlotData, Plot
@@ -18,5 +18,56 @@ class PlotTestCase(unittest.TestCase):
         data.update_data(x=arr, y=arr)
         self.assertRaises(ValueError, plot.plot, ("x", "y"))
 
+    def test_datasource_from_buffer(self):
+        x = arange(10.0)
+        data = ArrayPlotData()
+        # Bypass ArrayPlotData's own conversion of the data.
+        data.arrays["x"] = memoryview(x)
+        data.arrays["y"] = list(x)
+        plot = Plot(data)
+        renderer = plot.plot(("x", "y"))[0]
+        self.assertTrue(shares_memory(renderer.index.get_data(), x))
+        self.assertEqual(renderer.value.get_data().tolist(), list(x))
+
+    def test_shared_datasources(self):
+        data = ArrayPlotData(x=arange(10.0), y=arange(10.0))
+        data.share_datasources = True
+        plots = [Plot(data) for i in range(3)]
+        renderers = [plot.plot(("x", "y"))[0] for plot in plots]
+        index = renderers[0].index
+        for renderer in renderers:
+            self.assertIs(renderer.index, index)
+
+        changes = []
+        index.on_trait_change(lambda: changes.append(True), "data_changed")
+        data.set_data("x", arange(10.0) * 2)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(index.get_bounds(), (0.0, 18.0))
+        for plot in plots:
+            self.assertEqual(plot.index_range.high, 18.0)
+
+        data.del_data("x")
+        data.set_data("x", arange(5.0))
+        self.assertIsNot(Plot(data).plot(("x", "y"))[0].index, index)
+
+    def test_shared_datasources_refreshed_once(self):
+        data = ArrayPlotData(x=arange(10.0), y=arange(10.0), y2=arange(10.0))
+        data.share_datasources = True
+        plot = Plot(data)
+        plot.plot(("x", "y"))
+        plot.plot(("x", "y2"))
+        updates = []
+        plot.value_range.on_trait_change(lambda: updates.append(True),
+                                         "updated")
+        data.update_data(y=arange(10.0) * 2, y2=arange(10.0) * 3)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(plot.value_range.high, 27.0)
+
+    def test_unshared_datasources(self):
+        data = ArrayPlotData(x=arange(10.0), y=arange(10.0))
+        renderer1 = Plot(data).plot(("x", "y"))[0]
+        renderer2 = Plot(data).plot(("x", "y"))[0]
+        self.assertIsNot(renderer1.index, renderer2.index)
+
 if __name__ == "__main__":
     unittest.main()
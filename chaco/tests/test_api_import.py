@@ -0,0 +1,70 @@
+""" Import-time regression tests for chaco.api.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+import chaco
+
+
+# Script run in a fresh interpreter: times "import chaco.api", then the
+# import of the whole API, and reports the Chaco modules loaded by the first.
+IMPORT_SCRIPT = """
+import sys, time
+start = time.time()
+import chaco.api
+lazy_time = time.time() - start
+lazy_modules = [name for name, module in sys.modules.items()
+                if name.startswith('chaco.') and module is not None]
+start = time.time()
+from chaco.api import *
+full_time = time.time() - start
+print(repr((lazy_time, full_time, sorted(lazy_modules))))
+"""
+
+# Importing chaco.api must take less than this fraction of the time needed to
+# import everything it exposes.
+MAX_IMPORT_TIME_RATIO = 0.1
+
+# The Chaco modules that "import chaco.api" is allowed to load.
+ALLOWED_MODULES = ['chaco._version', 'chaco.api']
+
+
+def run_import_script():
+    # Run from the directory containing the chaco package being tested.
+    cwd = os.path.dirname(os.path.dirname(os.path.abspath(chaco.__file__)))
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT],
+                                     cwd=cwd)
+    return eval(output.decode('ascii').strip().splitlines()[-1])
+
+
+class APIImportTestCase(unittest.TestCase):
+
+    def test_import_loads_no_submodules(self):
+        lazy_time, full_time, lazy_modules = run_import_script()
+        self.assertEqual(
+            [name for name in lazy_modules if name not in ALLOWED_MODULES],
+            [])
+
+    def test_import_time(self):
+        lazy_time, full_time, lazy_modules = run_import_script()
+        self.assertLess(lazy_time, MAX_IMPORT_TIME_RATIO * full_time)
+
+    def test_lazy_names(self):
+        import chaco.api
+        from chaco.plot import Plot
+        from chaco.plot_containers import GridPlotContainer
+        from chaco.default_colormaps import jet
+
+        self.assertIs(chaco.api.Plot, Plot)
+        self.assertIs(chaco.api.GridContainer, GridPlotContainer)
+        self.assertIs(chaco.api.jet, jet)
+        self.assertIn('Plot', chaco.api.__all__)
+        self.assertIn('jet', dir(chaco.api))
+        with self.assertRaises(AttributeError):
+            chaco.api.NotAName
+
+
+if __name__ == '__main__':
+    unittest.main()
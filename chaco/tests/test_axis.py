@@ -0,0 +1,59 @@
+import unittest
+
+from chaco import axis
+from chaco.api import DataRange1D, LinearMapper, PlotAxis, \
+    PlotGraphicsContext
+
+
+class PlotAxisTestCase(unittest.TestCase):
+
+    def create_axis(self, **kw):
+        mapper = LinearMapper(range=DataRange1D(low=0.0, high=10.0))
+        plot_axis = PlotAxis(mapper=mapper, orientation="bottom", **kw)
+        plot_axis.outer_bounds = [200, 30]
+        return plot_axis
+
+    def render(self, component):
+        gc = PlotGraphicsContext((200, 30))
+        gc.render_component(component)
+
+    def test_tick_labels_shared_between_axes(self):
+        axis1 = self.create_axis()
+        axis2 = self.create_axis()
+        self.render(axis1)
+        self.render(axis2)
+        self.assertTrue(len(axis1.ticklabel_cache) > 0)
+        self.assertEqual([label.text for label in axis1.ticklabel_cache],
+                         [label.text for label in axis2.ticklabel_cache])
+        for label1, label2 in zip(axis1.ticklabel_cache,
+                                  axis2.ticklabel_cache):
+            self.assertIs(label1, label2)
+
+    def test_tick_label_style_not_shared(self):
+        axis1 = self.create_axis()
+        axis2 = self.create_axis(tick_label_color="red")
+        self.render(axis1)
+        self.render(axis2)
+        for label1, label2 in zip(axis1.ticklabel_cache,
+                                  axis2.ticklabel_cache):
+            self.assertIsNot(label1, label2)
+            self.assertEqual(label1.text, label2.text)
+
+    def test_tick_label_cache_size(self):
+        old_size = axis.TICK_LABEL_CACHE_SIZE
+        axis.TICK_LABEL_CACHE_SIZE = 2
+        try:
+            plot_axis = self.create_axis()
+            self.render(plot_axis)
+            self.assertEqual(len(axis._tick_label_cache), 2)
+            # The most recently used labels are kept.
+            last_label = plot_axis.ticklabel_cache[-1]
+            self.assertIn(last_label,
+                          [label for label, bounds
+                           in axis._tick_label_cache.values()])
+        finally:
+            axis.TICK_LABEL_CACHE_SIZE = old_size
+
+
+if __name__ == '__main__':
+    unittest.main()
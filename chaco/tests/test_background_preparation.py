@@ -0,0 +1,198 @@
+""" Tests for the preparation of the data of renderers on background threads.
+"""
+import gc
+import threading
+import unittest
+import weakref
+
+from numpy import arange, array_equal, concatenate, cos, sin
+from numpy.testing import assert_array_equal
+
+from chaco.api import ArrayPlotData, Plot
+from chaco import background_preparation
+from chaco.background_preparation import discard_preparations, \
+    request_preparation, wait_for_preparations
+
+
+class Owner(object):
+    """ A renderer whose data is prepared.
+    """
+
+
+def flatten(points):
+    """ Returns the points of a line or scatter plot as one array.
+    """
+    if isinstance(points, list):
+        return concatenate(points)
+    return points
+
+
+class RequestPreparationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.owner = Owner()
+        self.release = threading.Event()
+        self.computed = []
+
+    def tearDown(self):
+        self.release.set()
+        wait_for_preparations()
+
+    def compute(self, value, block=False):
+        def compute():
+            if block:
+                self.release.wait()
+            self.computed.append(value)
+            return value
+        return compute
+
+    def test_request(self):
+        self.assertIsNone(request_preparation(self.owner, (1,),
+                                              self.compute("a")))
+        self.assertTrue(wait_for_preparations())
+        self.assertEqual(request_preparation(self.owner, (1,),
+                                             self.compute("b")), ("a", True))
+        self.assertEqual(self.computed, ["a"])
+
+    def test_coalesced_requests(self):
+        release_a = threading.Event()
+        a_done = threading.Event()
+
+        def compute_a():
+            release_a.wait()
+            self.computed.append("a")
+            a_done.set()
+            return "a"
+
+        request_preparation(self.owner, (1,), compute_a)
+        # The requests made while "a" runs are coalesced into the last one.
+        self.assertIsNone(request_preparation(self.owner, (2,),
+                                              self.compute("b")))
+        self.assertIsNone(request_preparation(self.owner, (3,),
+                                              self.compute("c", block=True)))
+        release_a.set()
+        a_done.wait()
+        self.assertFalse(wait_for_preparations(timeout=0.05))
+        # "a" was prepared for an earlier request, while "c" runs.
+        self.assertEqual(request_preparation(self.owner, (3,),
+                                             self.compute("d")), ("a", False))
+        self.release.set()
+        wait_for_preparations()
+        self.assertEqual(request_preparation(self.owner, (3,),
+                                             self.compute("e")), ("c", True))
+        self.assertEqual(self.computed, ["a", "c"])
+
+    def test_array_keys(self):
+        data = arange(10.0)
+        request_preparation(self.owner, (data,), self.compute("a"))
+        wait_for_preparations()
+        # Equal arrays are different inputs.
+        result = request_preparation(self.owner, (data.copy(),),
+                                     self.compute("b"))
+        self.assertEqual(result, ("a", False))
+        wait_for_preparations()
+
+    def test_discard(self):
+        request_preparation(self.owner, (1,), self.compute("a", block=True))
+        discard_preparations(self.owner)
+        self.release.set()
+        wait_for_preparations()
+        self.assertIsNone(request_preparation(self.owner, (1,),
+                                              self.compute("b")))
+        wait_for_preparations()
+        self.assertEqual(request_preparation(self.owner, (1,),
+                                             self.compute("c")), ("b", True))
+
+    def test_owner_not_kept_alive(self):
+        request_preparation(self.owner, (1,), self.compute("a", block=True))
+        # The owner is removed while its preparation runs.
+        owner = weakref.ref(self.owner)
+        del self.owner
+        self.release.set()
+        wait_for_preparations()
+        gc.collect()
+        self.assertIsNone(owner())
+
+    def test_discard_finished(self):
+        request_preparation(self.owner, (1,), self.compute("a"))
+        wait_for_preparations()
+        discard_preparations(self.owner)
+        self.assertNotIn(self.owner, background_preparation._states)
+
+    def test_error(self):
+        def compute():
+            raise ValueError("bad data")
+        request_preparation(self.owner, (1,), compute)
+        wait_for_preparations()
+        with self.assertRaises(ValueError):
+            request_preparation(self.owner, (1,), compute)
+
+
+class BackgroundRendererTestCase(unittest.TestCase):
+
+    def make_plot(self, type):
+        x = arange(1000.0)
+        self.data = ArrayPlotData(x=x, y=sin(x / 100.0))
+        plot = Plot(self.data)
+        renderer = plot.plot(("x", "y"), type=type,
+                             prepare_in_background=True)[0]
+        plot.outer_bounds = [400, 300]
+        plot.do_layout()
+        return plot, renderer
+
+    def check_renderer(self, type):
+        plot, renderer = self.make_plot(type)
+        # Nothing is drawn until the points are ready.
+        self.assertEqual(len(renderer.get_screen_points()), 0)
+        wait_for_preparations()
+        self.assertTrue(len(renderer.get_screen_points()) > 0)
+        self.assertTrue(renderer._cache_valid)
+        points = flatten(renderer._cached_data_pts)
+
+        # The previous points are drawn until the new ones are ready.
+        self.data.set_data("y", cos(arange(1000.0) / 100.0))
+        renderer.get_screen_points()
+        assert_array_equal(flatten(renderer._cached_data_pts), points)
+        wait_for_preparations()
+        renderer.get_screen_points()
+        self.assertFalse(array_equal(flatten(renderer._cached_data_pts),
+                                     points))
+
+    def test_line_plot(self):
+        self.check_renderer("line")
+
+    def test_scatter_plot(self):
+        self.check_renderer("scatter")
+
+    def test_scatter_selection_pending(self):
+        plot, renderer = self.make_plot("scatter")
+        renderer.get_screen_points()
+        wait_for_preparations()
+        renderer.index.metadata["selections"] = arange(10)
+        renderer.get_screen_points()
+        assert_array_equal(renderer._cached_selected_pts[:, 1],
+                           sin(arange(10.0) / 100.0))
+
+        # No selection is drawn while the points of the new data are
+        # prepared, and then the selection of the new data is.
+        self.data.set_data("y", cos(arange(1000.0) / 100.0))
+        renderer.index.metadata["selections"] = arange(5)
+        renderer.get_screen_points()
+        self.assertIsNone(renderer._cached_selected_pts)
+        wait_for_preparations()
+        renderer.get_screen_points()
+        assert_array_equal(renderer._cached_selected_pts[:, 1],
+                           cos(arange(5.0) / 100.0))
+
+    def test_line_plot_downsampling(self):
+        plot, renderer = self.make_plot("line")
+        renderer.use_downsampling = True
+        renderer.get_screen_points()
+        wait_for_preparations()
+        points = renderer.get_screen_points()
+        self.assertIsNotNone(renderer._prepared_downsample)
+        self.assertTrue(0 < len(points[0]) < 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
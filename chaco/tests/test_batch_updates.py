@@ -0,0 +1,183 @@
+""" Tests for the coalescing of draw invalidations, redraw requests and data
+range refreshes.
+"""
+import threading
+import unittest
+
+from numpy import arange
+
+from enable.api import BaseTool, MouseEvent
+from chaco.api import ArrayPlotData, batch_updates, DataRange1D, \
+    GridPlotContainer, Plot
+
+
+class DummyWindow(object):
+    """ Records the invalidations and redraw requests that reach it.
+    """
+
+    def __init__(self):
+        self.damaged_regions = []
+        self.redraw_count = 0
+
+    def invalidate_draw(self, damaged_regions=None, self_relative=False):
+        self.damaged_regions.extend(damaged_regions)
+
+    def redraw(self):
+        self.redraw_count += 1
+
+
+class RedrawingTool(BaseTool):
+
+    clicks = 0
+
+    def normal_left_down(self, event):
+        self.clicks += 1
+        for i in range(3):
+            self.component.invalidate_draw()
+            self.component.request_redraw()
+
+
+class BatchUpdatesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        # A dashboard of plots sharing their index range.
+        self.index_range = DataRange1D()
+        self.container = GridPlotContainer(shape=(4, 4))
+        data = ArrayPlotData(x=arange(10.0), y=arange(10.0))
+        for i in range(16):
+            plot = Plot(data)
+            plot.plot(("x", "y"))
+            plot.index_range = self.index_range
+            self.container.add(plot)
+        self.container.outer_bounds = [1600, 1600]
+        self.container.do_layout()
+        self.window = DummyWindow()
+        self.container._window = self.window
+
+    def test_unbatched(self):
+        self.index_range.set_bounds(2.0, 5.0)
+        for plot in self.container.components:
+            plot.request_redraw()
+        self.assertTrue(self.window.redraw_count >= 16)
+
+    def test_batched(self):
+        with self.container.batch_updates():
+            self.index_range.set_bounds(2.0, 5.0)
+            for plot in self.container.components:
+                plot.request_redraw()
+            # Nothing is propagated within the batch, but the components
+            # are invalidated.
+            self.assertEqual(self.window.redraw_count, 0)
+            self.assertEqual(self.window.damaged_regions, [])
+            self.assertFalse(self.container.components[0].draw_valid)
+
+        self.assertEqual(self.window.redraw_count, 1)
+        # The container invalidated the window once, with all the regions.
+        regions = [tuple(region) for region in self.window.damaged_regions]
+        self.assertEqual(len(regions), len(set(regions)))
+        self.assertTrue(len(regions) > 0)
+
+    def test_nested(self):
+        with batch_updates():
+            with batch_updates():
+                self.container.request_redraw()
+            self.assertEqual(self.window.redraw_count, 0)
+        self.assertEqual(self.window.redraw_count, 1)
+
+    def test_other_thread(self):
+        # A batch opened by another thread does not defer the calls made on
+        # this one.
+        opened = threading.Event()
+        release = threading.Event()
+
+        def batch():
+            with batch_updates():
+                opened.set()
+                release.wait()
+
+        thread = threading.Thread(target=batch)
+        thread.start()
+        try:
+            opened.wait()
+            self.container.request_redraw()
+            self.assertEqual(self.window.redraw_count, 1)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(self.window.redraw_count, 1)
+
+    def test_dispatch(self):
+        for plot in self.container.components:
+            plot.tools.append(RedrawingTool(plot))
+        plot = self.container.components[0]
+        self.window.redraw_count = 0
+        event = MouseEvent(x=plot.x + 50, y=plot.y + 50)
+        self.container.dispatch(event, "left_down")
+        self.assertEqual(plot.tools[0].clicks, 1)
+        self.assertEqual(self.window.redraw_count, 1)
+
+
+class BatchDataUpdatesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        x = arange(10.0)
+        self.data = ArrayPlotData(x=x)
+        self.names = ["y%d" % i for i in range(30)]
+        self.data.update_data((name, x) for name in self.names)
+        self.plot = Plot(self.data)
+        for name in self.names:
+            self.plot.plot(("x", name))
+        self.plot.outer_bounds = [400, 400]
+        self.plot.do_layout()
+        self.window = DummyWindow()
+        self.plot._window = self.window
+
+        self.range_updates = []
+        self.plot.value_range.on_trait_change(
+            lambda new: self.range_updates.append(new), "updated")
+
+    def new_values(self, i):
+        return arange(10.0) * (i + 2)
+
+    def test_update_data(self):
+        self.data.update_data((name, self.new_values(i))
+                              for i, name in enumerate(self.names))
+        self.assertEqual(len(self.range_updates), 1)
+        self.assertEqual(self.plot.value_range.high, 279.0)
+        self.assertEqual(self.window.redraw_count, 1)
+
+    def test_batch_set_data(self):
+        with self.data.batch_updates():
+            for i, name in enumerate(self.names):
+                self.data.set_data(name, self.new_values(i))
+            # Plots see the changes at the end of the batch.
+            self.assertEqual(self.plot.value_range.high, 9.0)
+        self.assertEqual(len(self.range_updates), 1)
+        self.assertEqual(self.plot.value_range.high, 279.0)
+        self.assertEqual(self.window.redraw_count, 1)
+
+    def test_dispatch_reads_refreshed_range(self):
+        # A tool that changes data reads the refreshed bounds of the range
+        # while the event is dispatched, and its redraws are coalesced.
+        highs = []
+
+        def normal_left_down(event):
+            with self.data.batch_updates():
+                for i, name in enumerate(self.names):
+                    self.data.set_data(name, self.new_values(i))
+            highs.append(self.plot.value_range.high)
+            self.data.set_data("y0", arange(10.0) * 100)
+            highs.append(self.plot.value_range.high)
+
+        tool = BaseTool(self.plot)
+        tool.normal_left_down = normal_left_down
+        self.plot.tools.append(tool)
+        self.window.redraw_count = 0
+        event = MouseEvent(x=self.plot.x + 50, y=self.plot.y + 50)
+        self.plot.dispatch(event, "left_down")
+        self.assertEqual(highs, [279.0, 900.0])
+        self.assertEqual(self.window.redraw_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,5 +41,32 @@ class TestCMapImagePlot(unittest.TestCase):
         # Then
         window.redraw.assert_called_once_with()
 
+    def test_mapped_image_buffer_reused(self):
+        xs = numpy.linspace(0, 1, 20)
+        ys = numpy.linspace(0, 1, 10)
+        index = GridDataSource(xdata=xs, ydata=ys)
+        index_mapper = GridMapper(range=DataRange2D(index))
+        color_source = ImageData(data=numpy.random.random((10, 20)),
+                                 value_depth=1)
+        color_mapper = Spectral(DataRange1D(color_source))
+        cmap_plot = CMapImagePlot(
+            index=index,
+            index_mapper=index_mapper,
+            value=color_source,
+            value_mapper=color_mapper,
+            bounds=[100, 100],
+        )
+
+        cmap_plot._compute_cached_image()
+        buffer = cmap_plot._cached_mapped_image
+
+        new_data = numpy.random.random((10, 20))
+        color_source.data = new_data
+        cmap_plot._compute_cached_image()
+
+        self.assertIs(cmap_plot._cached_mapped_image, buffer)
+        numpy.testing.assert_array_equal(
+            buffer, color_mapper.map_uint8(new_data))
+
 if __name__ == "__main__":
     unittest.main()
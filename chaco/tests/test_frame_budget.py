@@ -0,0 +1,106 @@
+""" Tests for the scheduling of the level of detail of renderers to fit a
+frame budget.
+"""
+import unittest
+
+from numpy import arange, array, random, sin
+
+from chaco.api import ArrayPlotData, Plot, PlotGraphicsContext
+from chaco.frame_budget import LOW_DETAIL, MAX_DETAIL_LEVEL
+from chaco.interaction import begin_interaction, end_interaction
+
+
+class FrameBudgetTestCase(unittest.TestCase):
+
+    def setUp(self):
+        x = arange(100000.0)
+        self.data = ArrayPlotData(x=x, y=sin(x / 1000.0),
+                                  sx=x[:100], sy=sin(x[:100]))
+        self.plot = Plot(self.data)
+        self.line = self.plot.plot(("x", "y"))[0]
+        self.scatter = self.plot.plot(("sx", "sy"), type="scatter")[0]
+        self.plot.outer_bounds = [400, 300]
+        self.plot.do_layout()
+
+    def tearDown(self):
+        end_interaction(self)
+
+    def draw(self):
+        gc = PlotGraphicsContext((400, 300))
+        gc.render_component(self.plot)
+
+    def test_scheduler(self):
+        self.assertIsNone(self.plot._frame_scheduler)
+        self.plot.frame_budget = 0.05
+        scheduler = self.plot._frame_scheduler
+        self.assertIs(scheduler.container, self.plot)
+
+        self.line.detail_level = 2
+        self.plot.frame_budget = 0.0
+        self.assertIsNone(self.plot._frame_scheduler)
+        self.assertEqual(self.line.detail_level, 0)
+
+    def test_costs_measured(self):
+        self.plot.frame_budget = 10.0
+        self.draw()
+        costs = self.plot._frame_scheduler._costs
+        self.assertEqual(set(costs), set([self.line, self.scatter]))
+        self.assertTrue(costs[self.line][1] > 0.0)
+
+    def test_levels_lowered_over_budget(self):
+        self.plot.frame_budget = 1e-6
+        self.draw()
+        levels = self.plot._frame_scheduler.levels
+        # The costliest renderer is degraded first, to the lowest detail.
+        self.assertEqual(levels[self.line], MAX_DETAIL_LEVEL)
+
+    def test_levels_raised_within_budget(self):
+        self.plot.frame_budget = 10.0
+        scheduler = self.plot._frame_scheduler
+        scheduler.levels[self.line] = MAX_DETAIL_LEVEL
+        self.draw()
+        self.assertEqual(scheduler.levels[self.line], MAX_DETAIL_LEVEL - 1)
+
+    def test_interaction(self):
+        self.plot.frame_budget = 1e-6
+        self.draw()
+        begin_interaction(self)
+        self.draw()
+        # The line was drawn at the levels that fit the budget.
+        level, seconds = self.plot._frame_scheduler._costs[self.line]
+        self.assertEqual(level, MAX_DETAIL_LEVEL)
+
+    def test_restore_step(self):
+        self.plot.frame_budget = 0.05
+        scheduler = self.plot._frame_scheduler
+        self.line.detail_level = 2
+        scheduler._restore_step()
+        self.assertEqual(self.line.detail_level, 1)
+        self.assertEqual(self.scatter.detail_level, 0)
+        self.assertTrue(scheduler._restoring)
+
+    def test_line_buckets(self):
+        self.line._gather_points()
+        self.line._level = LOW_DETAIL
+        low = self.line._downsample_low_quality()
+        self.line._level = LOW_DETAIL + 1
+        lower = self.line._downsample_low_quality()
+        self.line._level = 0
+        self.assertEqual(len(lower[0]), len(low[0]) // 2)
+
+    def test_scatter_deduplicate(self):
+        points = array([[1.0, 1.0], [5.0, 5.0], [1.2, 0.9], [3.0, 1.0]])
+        kept = self.scatter._deduplicate(points).tolist()
+        # The last point drawn at each pixel is kept, in drawing order.
+        self.assertEqual(kept, [[5.0, 5.0], [1.2, 0.9], [3.0, 1.0]])
+
+    def test_scatter_decimate(self):
+        points = random.RandomState(0).rand(100, 2)
+        self.scatter.interaction_max_points = 40
+        self.assertEqual(len(self.scatter._decimate(points)), 34)
+        self.assertEqual(len(self.scatter._decimate(points, LOW_DETAIL + 1)),
+                         20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+""" Tests for the low quality drawing of renderers during interactions.
+"""
+import unittest
+
+from numpy import arange, ones, sin
+
+from chaco import interaction
+from chaco.api import ArrayPlotData, Plot, PlotGraphicsContext
+from chaco.interaction import begin_interaction, draw_low_quality, \
+    end_interaction, interacting, step_interaction
+
+
+class InteractionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        x = arange(10000.0)
+        self.data = ArrayPlotData(x=x, y=sin(x / 100.0))
+        self.plot = Plot(self.data)
+        self.line = self.plot.plot(("x", "y"))[0]
+        self.scatter = self.plot.plot(("x", "y"), type="scatter")[0]
+        self.plot.outer_bounds = [400, 300]
+        self.plot.do_layout()
+
+        # Record the points drawn by the renderers.
+        self.drawn = {}
+        render = self.line._render
+
+        def recording_render(gc, points, *args, **kw):
+            self.drawn[self.line] = points
+            return render(gc, points, *args, **kw)
+
+        self.line._render = recording_render
+        render_markers = self.scatter.render_markers_func
+
+        def recording_render_markers(gc, points, *args, **kw):
+            self.drawn[self.scatter] = points
+            return render_markers(gc, points, *args, **kw)
+
+        self.scatter.render_markers_func = recording_render_markers
+
+    def tearDown(self):
+        end_interaction(self)
+
+    def render(self):
+        gc = PlotGraphicsContext((400, 300))
+        gc.render_component(self.plot)
+
+    def test_full_quality_by_default(self):
+        begin_interaction(self)
+        self.assertTrue(interacting())
+        self.assertFalse(draw_low_quality(self.line))
+        self.render()
+        self.assertEqual(len(self.drawn[self.scatter]), 10000)
+
+    def test_low_quality(self):
+        self.line.interaction_quality = "low"
+        self.scatter.interaction_quality = "low"
+        self.render()
+        full_line = sum(len(points) for points in self.drawn[self.line])
+
+        begin_interaction(self)
+        self.render()
+        low_line = sum(len(points) for points in self.drawn[self.line])
+        self.assertTrue(low_line < full_line)
+        self.assertTrue(low_line <= 400 // 4)
+        self.assertEqual(len(self.drawn[self.scatter]), 10000)
+
+        end_interaction(self)
+        self.assertFalse(interacting())
+        self.assertFalse(self.line.draw_valid)
+        self.render()
+        self.assertEqual(
+            sum(len(points) for points in self.drawn[self.line]), full_line)
+
+    def test_source_deleted(self):
+        class Tool(object):
+            pass
+
+        self.line.interaction_quality = "low"
+        tool = Tool()
+        begin_interaction(tool)
+        self.render()
+        self.assertTrue(interacting())
+        # A source deleted during its interaction ends it.
+        del tool
+        self.assertFalse(interacting())
+        self.assertFalse(self.line.draw_valid)
+
+    def test_scatter_decimation(self):
+        self.scatter.interaction_quality = "low"
+        self.scatter.interaction_max_points = 1000
+        begin_interaction(self)
+        self.render()
+        self.assertEqual(len(self.drawn[self.scatter]), 1000)
+
+        # Points with their own sizes are all drawn.
+        self.scatter.marker_size = ones(10000) * 3.0
+        self.render()
+        self.assertEqual(len(self.drawn[self.scatter]), 10000)
+
+    def test_step_interaction(self):
+        timers = []
+
+        def call_after(delay, callback):
+            timers.append(callback)
+            return callback
+
+        old_call_after = interaction.call_after
+        interaction.call_after = call_after
+        old_delay = interaction.SETTLE_DELAY
+        interaction.SETTLE_DELAY = 0.0
+        try:
+            step_interaction(self)
+            self.assertTrue(interacting())
+            self.assertEqual(len(timers), 1)
+            step_interaction(self)
+            self.assertEqual(len(timers), 1)
+            timers[0]()
+            self.assertFalse(interacting())
+        finally:
+            interaction.call_after = old_call_after
+            interaction.SETTLE_DELAY = old_delay
+
+    def test_step_interaction_without_timers(self):
+        old_call_after = interaction.call_after
+        interaction.call_after = lambda delay, callback: None
+        try:
+            step_interaction(self)
+            self.assertFalse(interacting())
+        finally:
+            interaction.call_after = old_call_after
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+""" Tests for the layer backbuffers of plot components and containers.
+"""
+import unittest
+
+from numpy import abs, arange, sin
+
+from chaco.api import ArrayPlotData, Plot, PlotGraphicsContext
+from chaco.tools.api import LineInspector
+
+
+class LayerBackbuffersTestCase(unittest.TestCase):
+
+    def setUp(self):
+        x = arange(100.0)
+        self.data = ArrayPlotData(x=x, y=sin(x / 10.0))
+        self.plot = Plot(self.data)
+        self.renderer = self.plot.plot(("x", "y"))[0]
+        self.plot.outer_bounds = [300, 200]
+        self.plot.do_layout()
+
+        # Count the calls to the renderer's _render() method.
+        self.render_count = 0
+        render = self.renderer._render
+
+        def counting_render(*args, **kw):
+            self.render_count += 1
+            return render(*args, **kw)
+
+        self.renderer._render = counting_render
+
+    def render(self):
+        gc = PlotGraphicsContext((300, 200))
+        gc.render_component(self.plot)
+        return gc.bmp_array.astype(int)
+
+    def test_renderer_drawn_once(self):
+        self.renderer.use_layer_backbuffers = True
+        self.render()
+        self.render()
+        self.assertEqual(self.render_count, 1)
+
+        self.data.set_data("y", sin(arange(100.0) / 5.0))
+        self.render()
+        self.assertEqual(self.render_count, 2)
+
+    def test_overlay_redraw(self):
+        self.plot.use_layer_backbuffers = True
+        inspector = LineInspector(component=self.renderer, write_metadata=True)
+        self.renderer.overlays.append(inspector)
+        self.render()
+
+        # Moving the inspector only redraws the overlay layer.
+        self.renderer.index.metadata["selections"] = [50.0]
+        self.render()
+        self.assertEqual(self.render_count, 1)
+
+        self.renderer.index_range.set_bounds(10.0, 60.0)
+        self.render()
+        self.assertEqual(self.render_count, 2)
+
+    def test_same_image(self):
+        expected = self.render()
+        self.plot.use_layer_backbuffers = True
+        self.renderer.use_layer_backbuffers = True
+        self.render()
+        image = self.render()
+        # Only antialiased pixels may differ slightly, because of the
+        # compositing.
+        self.assertLessEqual(abs(image - expected).max(), 32)
+        self.assertLess((image != expected).any(axis=-1).mean(), 0.01)
+
+    def test_bounds_change(self):
+        self.renderer.use_layer_backbuffers = True
+        self.render()
+        self.plot.outer_bounds = [250, 200]
+        self.plot.do_layout()
+        self.render()
+        self.assertEqual(self.render_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
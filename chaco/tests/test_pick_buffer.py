@@ -0,0 +1,134 @@
+""" Tests for the offscreen pick buffer of plot containers.
+"""
+import unittest
+
+from numpy import arange, array, column_stack, hypot, random
+from numpy.testing import assert_array_equal
+
+from chaco.api import ArrayDataSource, ArrayPlotData, GridPlotContainer, \
+    MultiArrayDataSource, MultiLinePlot, PickBuffer, Plot
+
+
+class PickBufferTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.random = random.RandomState(0)
+        self.data = ArrayPlotData(x=ArrayDataSource(arange(10.0),
+                                                    sort_order="ascending"),
+                                  y=arange(10.0), y2=10.0 - arange(10.0),
+                                  sx=self.random.rand(500) * 9,
+                                  sy=self.random.rand(500) * 9)
+        self.plot = Plot(self.data)
+        self.line = self.plot.plot(("x", "y"))[0]
+        self.line2 = self.plot.plot(("x", "y2"))[0]
+        self.scatter = self.plot.plot(("sx", "sy"), type="scatter")[0]
+        self.plot.outer_bounds = [400, 400]
+        self.plot.do_layout()
+
+    def screen_points(self, renderer, x, y):
+        return renderer.map_screen(column_stack((x, y)))
+
+    def test_scatter(self):
+        x, y = self.data["sx"], self.data["sy"]
+        screen = self.screen_points(self.scatter, x, y)
+        for i in range(0, 500, 25):
+            renderer, index = self.plot.pick(screen[i], threshold=1.0)
+            self.assertIs(renderer, self.scatter)
+            # Points drawn in the same pixel hide each other.
+            self.assertTrue(hypot(*(screen[index] - screen[i])) < 1.5)
+
+    def test_lines(self):
+        self.scatter.visible = False
+        x = self.line.index.get_data()
+        screen = self.screen_points(self.line, x, self.data["y"])
+        # Next to the segment from point 2 to point 3, nearer to point 3.
+        point = screen[2] * 0.3 + screen[3] * 0.7 + (0.0, 2.0)
+        self.assertEqual(self.plot.pick(point, threshold=3.0), (self.line, 3))
+
+        screen2 = self.screen_points(self.line2, x, self.data["y2"])
+        point = screen2[7] * 0.8 + screen2[8] * 0.2
+        self.assertEqual(PickBuffer(self.plot).pick(point, threshold=1.0),
+                         (self.line2, 7))
+
+    def test_nothing_picked(self):
+        self.scatter.visible = False
+        self.assertIsNone(self.plot.pick((399, 1), threshold=3.0))
+
+    def test_nested_containers(self):
+        container = GridPlotContainer(shape=(2, 2))
+        plots = []
+        for i in range(4):
+            plot = Plot(self.data)
+            plot.plot(("x", "y"))
+            container.add(plot)
+            plots.append(plot)
+        container.outer_bounds = [800, 800]
+        container.do_layout()
+        container.position = [50, 30]
+
+        for plot in plots:
+            renderer = plot.components[0]
+            screen = self.screen_points(renderer, array([4.0]),
+                                        array([4.0]))[0]
+            # The screen points of the renderer are relative to the plot.
+            point = screen + plot.position + container.position
+            self.assertEqual(container.pick(point, threshold=1.0),
+                             (renderer, 4))
+
+    def test_multi_line_plot(self):
+        # Multi-line plots, whose value data is 2-D, are not rendered.
+        x = arange(10.0)
+        multi_line = MultiLinePlot(
+            index=ArrayDataSource(x), yindex=ArrayDataSource(arange(3.0)),
+            value=MultiArrayDataSource(self.random.rand(3, 10)),
+            index_mapper=self.line.index_mapper,
+            value_mapper=self.line.value_mapper, global_min=0.0,
+            global_max=1.0)
+        self.plot.add(multi_line)
+        self.scatter.visible = False
+        self.assertFalse(PickBuffer.renders(multi_line))
+        buffer = PickBuffer(self.plot)
+        self.assertEqual(buffer.renderers, [self.line, self.line2])
+
+        screen = self.screen_points(self.line, x, self.data["y"])
+        self.assertEqual(self.plot.pick(screen[2], threshold=1.0),
+                         (self.line, 2))
+
+    def test_invalidation(self):
+        self.plot.pick((100, 100))
+        buffer = self.plot._pick_buffer
+        self.assertIsNotNone(buffer)
+        self.plot.pick((200, 200))
+        self.assertIs(self.plot._pick_buffer, buffer)
+
+        # Changing the ranges of the plot invalidates the buffer.
+        self.plot.index_range.set_bounds(2.0, 3.0)
+        self.assertIsNone(self.plot._pick_buffer)
+        self.plot.pick((200, 200))
+        self.assertIsNot(self.plot._pick_buffer, buffer)
+
+    def test_dense_lines_reduced(self):
+        self.data.set_data("dense_x", ArrayDataSource(
+            arange(20000.0), sort_order="ascending"))
+        self.data.set_data("dense_y", self.random.rand(20000))
+        plot = Plot(self.data)
+        plot.plot(("dense_x", "dense_y"))
+        plot.outer_bounds = [400, 300]
+        plot.do_layout()
+        reduced = PickBuffer(plot)
+        buffer = PickBuffer(plot)
+        buffer._reduce_polyline = lambda points, axis: arange(len(points))
+        buffer.ids[...] = 0
+        buffer._render_components(plot, 0.0, 0.0)
+        # The reduced line covers the same pixels.
+        self.assertTrue(reduced.ids.any())
+        assert_array_equal(reduced.ids > 0, buffer.ids > 0)
+
+    def test_long_segments_are_clipped(self):
+        self.plot.index_range.set_bounds(4.0, 4.001)
+        buffer = PickBuffer(self.plot)
+        self.assertTrue(buffer.ids.any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+""" Tests for the reuse of gathered and screen points by XY plots.
+"""
+import unittest
+
+from numpy import arange, array
+from numpy.testing import assert_array_almost_equal
+
+from chaco.api import create_line_plot, create_scatter_plot, LogMapper
+
+
+class ScreenPointReuseTestCase(unittest.TestCase):
+
+    def create_plot(self, factory, **kw):
+        x = arange(10.0)
+        plot = factory(data=[x, x * x], **kw)
+        plot.outer_bounds = [200, 100]
+        return plot
+
+    def expected_points(self, plot):
+        x = plot.index.get_data()
+        y = plot.value.get_data()
+        return plot.map_screen(array([x, y]).T)
+
+    def test_pan_zoom_reuses_scatter_points(self):
+        plot = self.create_plot(create_scatter_plot)
+        plot.get_screen_points()
+        data_pts = plot._cached_data_pts
+        screen_pts = plot._screen_pts_cache[2]
+
+        # Panning and zooming out keep all the data visible.
+        plot.index_range.set_bounds(-5.0, 12.0)
+        plot.value_range.set_bounds(-10.0, 100.0)
+        new_screen_pts = plot.get_screen_points()
+        self.assertIs(plot._cached_data_pts, data_pts)
+        self.assertIs(plot._screen_pts_cache[2], screen_pts)
+        assert_array_almost_equal(new_screen_pts, self.expected_points(plot))
+
+        # A change of screen bounds is also an affine transform.
+        plot.outer_bounds = [300, 50]
+        assert_array_almost_equal(plot.get_screen_points(),
+                                  self.expected_points(plot))
+
+    def test_zoom_in_gathers_points(self):
+        plot = self.create_plot(create_scatter_plot)
+        plot.get_screen_points()
+        data_pts = plot._cached_data_pts
+
+        plot.index_range.set_bounds(2.0, 5.0)
+        screen_pts = plot.get_screen_points()
+        self.assertIsNot(plot._cached_data_pts, data_pts)
+        self.assertEqual(len(screen_pts), 4)
+
+    def test_line_plot_pan(self):
+        plot = self.create_plot(create_line_plot, orientation="v")
+        plot.get_screen_points()
+        screen_pts = plot._screen_pts_cache[2]
+
+        plot.index_range.set_bounds(-1.0, 10.0)
+        new_screen_pts = plot.get_screen_points()
+        self.assertIs(plot._screen_pts_cache[2][0], screen_pts[0])
+        assert_array_almost_equal(new_screen_pts[0],
+                                  self.expected_points(plot))
+
+    def test_returned_points_kept(self):
+        for factory in (create_line_plot, create_scatter_plot):
+            plot = self.create_plot(factory)
+            screen_pts = plot.get_screen_points()
+            kept = array(screen_pts, copy=True)
+
+            # The reused screen points are transformed in place, but the
+            # points returned before are not.
+            plot.index_range.set_bounds(-5.0, 12.0)
+            plot.get_screen_points()
+            assert_array_almost_equal(array(screen_pts), kept)
+
+    def test_log_mapper_maps_points_again(self):
+        plot = self.create_plot(create_line_plot,
+                                value_mapper_class=LogMapper)
+        plot.get_screen_points()
+        screen_pts = plot._screen_pts_cache[2]
+
+        plot.value_range.set_bounds(1.0, 1000.0)
+        new_screen_pts = plot.get_screen_points()
+        self.assertIsNot(plot._screen_pts_cache[2][0], screen_pts[0])
+        assert_array_almost_equal(new_screen_pts[0],
+                                  plot.map_screen(plot._cached_data_pts[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+""" Tests for the Selection class.
+"""
+import unittest
+
+from numpy import arange, asarray, count_nonzero, flatnonzero, ones, where, \
+    zeros
+from numpy.random import RandomState
+from numpy.testing import assert_array_equal
+
+from chaco.api import ArrayDataSource, DataRange1D, LinearMapper, \
+    ScatterPlot
+from chaco.selection import as_selection, Selection
+
+
+class SelectionTestCase(unittest.TestCase):
+
+    def check_range(self, data, low, high, sort_order):
+        selection = Selection.from_range(data, low, high, sort_order)
+        expected = (data >= low) & (data <= high)
+        assert_array_equal(selection.to_mask(), expected)
+        self.assertEqual(selection.count(), expected.sum())
+
+    def test_from_range_ascending(self):
+        data = arange(10.0)
+        for low, high in [(2.0, 5.0), (2.5, 5.5), (-3.0, 20.0), (20.0, 30.0),
+                          (-3.0, -1.0), (4.0, 4.0), (4.2, 4.4)]:
+            self.check_range(data, low, high, "ascending")
+
+    def test_from_range_descending(self):
+        data = arange(10.0)[::-1]
+        for low, high in [(2.0, 5.0), (2.5, 5.5), (-3.0, 20.0), (20.0, 30.0),
+                          (4.0, 4.0), (4.2, 4.4)]:
+            self.check_range(data, low, high, "descending")
+
+    def test_from_range_unsorted(self):
+        with self.assertRaises(ValueError):
+            Selection.from_range(arange(10.0), 2.0, 5.0, "none")
+
+    def test_mask_protocol(self):
+        data = arange(10.0) * 10
+        selection = Selection(10, [(2, 4), (7, 9)])
+        assert_array_equal(data[selection], [20.0, 30.0, 70.0, 80.0])
+        assert_array_equal(asarray(selection, dtype=int),
+                           [0, 0, 1, 1, 0, 0, 0, 1, 1, 0])
+        mask = ones(10, dtype=bool)
+        mask &= selection
+        assert_array_equal(mask, selection.to_mask())
+        self.assertEqual(len(selection), 10)
+        self.assertEqual(sum(selection), 4)
+
+    def test_mask_methods(self):
+        # Consumers of the selection metadata can use selections as masks.
+        data = arange(10.0) * 10
+        mask = zeros(10, dtype=bool)
+        mask[[2, 3, 7, 8]] = True
+        for selection in [Selection(10, [(2, 4), (7, 9)]),
+                          Selection(10, indices=[2, 3, 7, 8]),
+                          Selection(10, mask=mask)]:
+            self.assertEqual(selection.shape, mask.shape)
+            self.assertEqual(selection.dtype, mask.dtype)
+            self.assertEqual(selection.ndim, 1)
+            self.assertEqual(selection.size, 10)
+            assert_array_equal(selection.nonzero()[0], mask.nonzero()[0])
+            assert_array_equal(where(selection)[0], [2, 3, 7, 8])
+            self.assertTrue(selection.any())
+            self.assertFalse(selection.all())
+            self.assertEqual(selection.sum(), 4)
+            self.assertEqual(count_nonzero(selection), 4)
+            self.assertTrue(selection[2])
+            self.assertFalse(selection[-1])
+            with self.assertRaises(IndexError):
+                selection[10]
+            assert_array_equal(selection[1:4], [False, True, True])
+            assert_array_equal(data[selection], data[mask])
+            assert_array_equal(selection.astype(int), mask.astype(int))
+            copy = selection.copy()
+            copy[0] = True
+            self.assertFalse(selection[0])
+            self.assertEqual(selection.tolist(), mask.tolist())
+        self.assertFalse(Selection(10).any())
+        self.assertTrue(Selection(10, [(0, 10)]).all())
+
+    def test_invert(self):
+        for intervals in [[], [(0, 10)], [(0, 3)], [(7, 10)],
+                          [(2, 4), (7, 9)]]:
+            selection = Selection(10, intervals)
+            assert_array_equal((~selection).to_mask(), ~selection.to_mask())
+
+    def test_kinds(self):
+        mask = zeros(10, dtype=bool)
+        mask[[2, 3, 7, 8]] = True
+        for selection in [Selection(10, [(2, 4), (7, 9)]),
+                          Selection(10, indices=[8, 2, 7, 3, 3]),
+                          Selection(10, mask=mask)]:
+            assert_array_equal(selection.to_mask(), mask)
+            assert_array_equal(selection.to_indices(), [2, 3, 7, 8])
+            self.assertEqual(selection.to_intervals().tolist(),
+                             [[2, 4], [7, 9]])
+            self.assertEqual(selection.count(), 4)
+            assert_array_equal(selection.contains([0, 2, 4, 8, 9]),
+                               [False, True, False, True, False])
+            self.assertEqual(selection, Selection(10, [(2, 4), (7, 9)]))
+            self.assertEqual(selection, mask)
+            self.assertNotEqual(selection, Selection(10, [(2, 4)]))
+            self.assertNotEqual(selection, Selection(11, [(2, 4), (7, 9)]))
+
+    def test_operators(self):
+        random = RandomState(0)
+        for i in range(20):
+            masks = [random.rand(50) < 0.4 for j in range(3)]
+            selections = [Selection(50, mask=masks[0]),
+                          Selection(50, indices=flatnonzero(masks[1])),
+                          Selection(50, Selection(50, mask=masks[2]).intervals)]
+            for mask1, selection1 in zip(masks, selections):
+                assert_array_equal((~selection1).to_mask(), ~mask1)
+                for mask2, selection2 in zip(masks, selections):
+                    assert_array_equal((selection1 & selection2).to_mask(),
+                                       mask1 & mask2)
+                    assert_array_equal((selection1 | selection2).to_mask(),
+                                       mask1 | mask2)
+                    assert_array_equal((selection1 ^ selection2).to_mask(),
+                                       mask1 ^ mask2)
+
+    def test_compact_operators(self):
+        # Combining compact selections keeps them compact.
+        selection = Selection(10**8, [(10, 20), (50, 60)])
+        other = Selection(10**8, indices=[5, 15, 55, 10**7])
+        self.assertEqual((selection & other).kind, "indices")
+        self.assertEqual((selection & other).to_indices().tolist(), [15, 55])
+        union = selection | Selection(10**8, [(15, 30)])
+        self.assertEqual(union.kind, "intervals")
+        self.assertEqual(union.intervals.tolist(), [[10, 30], [50, 60]])
+        self.assertEqual((~union).count(), 10**8 - 30)
+        with self.assertRaises(ValueError):
+            selection & Selection(10)
+
+    def test_as_selection(self):
+        selection = Selection(10, [(2, 4)])
+        self.assertIs(as_selection(selection, 10), selection)
+        self.assertEqual(as_selection(arange(10) < 3), Selection(10, [(0, 3)]))
+        self.assertEqual(as_selection([4, 1], 10),
+                         Selection(10, indices=[1, 4]))
+        with self.assertRaises(ValueError):
+            as_selection([4, 1])
+        with self.assertRaises(ValueError):
+            as_selection(selection, 5)
+
+    def test_scatterplot_selection_masks(self):
+        index = ArrayDataSource(arange(10.0))
+        value = ArrayDataSource(arange(10.0))
+        plot = ScatterPlot(
+            index=index, value=value,
+            index_mapper=LinearMapper(range=DataRange1D(low=1.0, high=8.0)),
+            value_mapper=LinearMapper(range=DataRange1D(index)))
+        index.metadata["selection_masks"] = [
+            Selection(10, [(0, 6)]), arange(10) % 2 == 0]
+        plot._gather_points()
+        assert_array_equal(plot._cached_selected_pts[:, 0], [2.0, 4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
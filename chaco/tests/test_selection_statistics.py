@@ -0,0 +1,70 @@
+""" Tests for the SelectionStatistics class.
+"""
+import unittest
+
+from numpy import arange, corrcoef, polyfit
+from numpy.random import RandomState
+from numpy.testing import assert_allclose
+
+from chaco.api import Selection, SelectionStatistics
+
+
+class SelectionStatisticsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        random = RandomState(0)
+        self.x = random.rand(1000)
+        self.y = 3.0 * self.x + random.rand(1000)
+        self.statistics = SelectionStatistics(self.x, self.y)
+
+    def check(self, selection):
+        self.statistics.update(selection)
+        mask = selection.to_mask()
+        x, y = self.x[mask], self.y[mask]
+        statistics = self.statistics
+        self.assertEqual(statistics.n, len(x))
+        assert_allclose(statistics.mean_x, x.mean())
+        assert_allclose(statistics.mean_y, y.mean())
+        assert_allclose(statistics.var_x, x.var())
+        assert_allclose(statistics.var_y, y.var())
+        assert_allclose(statistics.correlation, corrcoef(x, y)[0, 1])
+        assert_allclose(statistics.fit(), polyfit(x, y, 1))
+
+    def test_growing_and_shrinking(self):
+        for stop in [10, 50, 51, 400, 1000, 300, 20]:
+            self.check(Selection(1000, [(5, stop)]))
+
+    def test_selection_kinds(self):
+        self.check(Selection(1000, indices=arange(0, 1000, 3)))
+        self.check(Selection(1000, mask=self.x > 0.5))
+        self.check(Selection(1000, [(100, 900)]))
+
+    def test_large_offset(self):
+        # Timestamps, whose squares exceed the precision of doubles.
+        self.x = 1.5e9 + arange(1000) * 0.1
+        self.statistics = SelectionStatistics(self.x, self.y)
+        for stop in [100, 400, 200]:
+            self.check(Selection(1000, [(10, stop)]))
+        assert_allclose(self.statistics.var_x, (190 ** 2 - 1) / 1200.0)
+
+    def test_empty(self):
+        self.statistics.update(Selection(1000, [(0, 100)]))
+        self.statistics.update(Selection(1000))
+        self.assertEqual(self.statistics.n, 0)
+        self.assertEqual(self.statistics.sum_xy, 0.0)
+        self.assertIsNone(self.statistics.mean_x)
+        self.assertIsNone(self.statistics.fit())
+
+    def test_single_point(self):
+        self.statistics.update(Selection(1000, indices=[3]))
+        self.assertEqual(self.statistics.mean_x, self.x[3])
+        self.assertIsNone(self.statistics.correlation)
+        self.assertIsNone(self.statistics.fit())
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            SelectionStatistics(arange(3.0), arange(4.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
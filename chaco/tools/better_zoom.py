@@ -10,6 +10,7 @@
 # Author: Enthought, Inc.
 
 from chaco.grid_mapper import GridMapper
+from chaco.interaction import step_interaction
 from enable.api import BaseTool, KeySpec
 from traits.api import Enum, Float, Instance, Bool, List, Tuple
 
@@ -269,6 +270,7 @@ class BetterZoom(BaseTool, ToolHistoryMixin):
             return
 
         if event.mouse_wheel != 0:
+            step_interaction(self)
             if event.mouse_wheel > 0:
                 self.zoom_in()
             else:
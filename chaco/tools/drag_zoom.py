@@ -6,10 +6,12 @@ from enable.tools.drag_tool import DragTool
 from traits.api import Bool, Enum, Float, Tuple
 
 # Chaco imports
+from chaco.interaction import begin_interaction, end_interaction
 from better_zoom import BetterZoom
+from move_throttle_mixin import MoveThrottleMixin
 
 
-class DragZoom(DragTool, BetterZoom):
+class DragZoom(MoveThrottleMixin, DragTool, BetterZoom):
     """ A zoom tool that zooms continuously with a mouse drag movement, instead
     of using a zoom box or range.
 
@@ -103,13 +105,21 @@ class DragZoom(DragTool, BetterZoom):
         self._original_data = (c.x_mapper.map_data(event.x), c.y_mapper.map_data(event.y))
         self._prev_x = event.x
         self._prev_y = event.y
+        begin_interaction(self)
         if capture_mouse:
             event.window.set_pointer(self.drag_pointer)
             event.window.set_mouse_owner(self, event.net_transform())
         event.handled = True
         return
 
+    def drag_cancel(self, event):
+        end_interaction(self)
+        event.window.set_pointer("arrow")
+        event.handled = True
+        return
+
     def drag_end(self, event):
+        end_interaction(self)
         event.window.set_pointer("arrow")
         if event.window.mouse_owner == self:
             event.window.set_mouse_owner(None)
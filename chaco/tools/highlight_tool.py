@@ -8,7 +8,7 @@ from traits.api import Enum, Float, Str
 from enable.api import BaseTool
 
 # Chaco imports
-from chaco.api import BasePlotContainer
+from chaco.api import BasePlotContainer, PickBuffer
 
 
 class HighlightTool(BaseTool):
@@ -55,8 +55,17 @@ class HighlightTool(BaseTool):
 
     def _highlight(self, event):
         if isinstance(self.component, BasePlotContainer):
+            hit = self.component.pick((event.x, event.y), self.threshold)
             event.offset_xy(self.component.x, self.component.y)
-            closest_plot = self._find_curve(self.component.components, event)
+            if hit is not None:
+                closest_plot = hit[0]
+            else:
+                # The pick buffer only has the lines and points of some
+                # renderers.
+                closest_plot = self._find_curve(
+                    [p for p in self.component.components
+                     if not PickBuffer.renders(p) or
+                     p.hittest_type == "poly"], event)
             if closest_plot:
                 index = closest_plot.index
                 index.metadata[self.metadata_name] = ones(len(index.get_data()), dtype=bool)
@@ -2,7 +2,7 @@
 """
 # Major library imports
 import numpy
-from numpy import array, empty, sometrue, transpose, vstack, zeros
+from numpy import argsort, array, empty, searchsorted, transpose, vstack
 
 # Enthought library imports
 from traits.api import Any, Array, Enum, Event, Bool, Instance, \
@@ -12,6 +12,7 @@ from kiva.agg import points_in_polygon
 # Chaco imports
 from chaco.api import AbstractController, AbstractDataSource, \
         BaseXYPlot, Base2DPlot
+from chaco.selection import Selection
 
 
 class LassoSelection(AbstractController):
@@ -55,7 +56,7 @@ class LassoSelection(AbstractController):
     selection_datasource = Instance(AbstractDataSource)
 
     # The name of the metadata on the datasource that we will write
-    # the selection mask to
+    # the Selection of the selected points to.  It can be used as a mask.
     metadata_name = Str("selection")
 
     # Mapping from screen space to data space. By default, it is just
@@ -89,6 +90,17 @@ class LassoSelection(AbstractController):
     _active_selection = Array
     _previous_selections = List(Array)
 
+    # A tuple (point index, previous selection polygons, union of their
+    # Selections) caching the Selection of the previous selections.
+    _previous_selection_cache = Any
+
+    # A tuple (data arrays, (points, x sort order, sorted x values)) caching
+    # the index used to find the points inside the bounding box of a polygon.
+    _point_index = Any
+
+    # The data sources that the point index is built from.
+    _watched_sources = List
+
     #----------------------------------------------------------------------
     # Properties
     #----------------------------------------------------------------------
@@ -139,7 +151,8 @@ class LassoSelection(AbstractController):
         self._active_selection = empty((0,2), dtype=numpy.bool)
 
         if self.selection_datasource is not None:
-            self.selection_datasource.metadata[self.metadata_name] = zeros(len(self.selection_datasource.get_data()), dtype=numpy.bool)
+            self.selection_datasource.metadata[self.metadata_name] = \
+                Selection(len(self.selection_datasource.get_data()))
         self.selection_mode = "include"
         self.event_state = 'selecting'
         self.selecting_mouse_move(event)
@@ -248,41 +261,94 @@ class LassoSelection(AbstractController):
 
 
     def _update_selection(self):
-        """ Sets the selection datasource's metadata to a mask of all
+        """ Sets the selection datasource's metadata to a Selection of all
         the points selected
         """
         if self.selection_datasource is None:
             return
 
-        selected_mask = zeros(self.selection_datasource._data.shape,
-                              dtype=numpy.bool)
-        data = self._get_data()
-
-        # Compose the selection mask from the cached selections first, then
+        # Compose the selection from the cached selections first, then
         # the active selection, taking into account the selection mode only
         # for the active selection
 
-        for selection in self._previous_selections:
-            selected_mask |= points_in_polygon(
-                data, selection, False).astype(bool, copy=False)
-
-        active_selection = points_in_polygon(
-            data, self._active_selection, False).astype(bool, copy=False)
+        selection = self._get_previous_selection()
+        active_selection = self._select_polygon(self._active_selection)
 
         if self.selection_mode == 'exclude':
             # XXX I think this should be "set difference"? - CJW
-            selected_mask |= active_selection
-            selected_mask = ~selected_mask
+            selection = ~(selection | active_selection)
 
         elif self.selection_mode == 'invert':
-            selected_mask ^= active_selection
+            selection ^= active_selection
         else:
-            selected_mask |= active_selection
+            selection |= active_selection
 
-        if sometrue(selected_mask != self.selection_datasource.metadata[self.metadata_name]):
-            self.selection_datasource.metadata[self.metadata_name] = selected_mask
+        if selection != self.selection_datasource.metadata[self.metadata_name]:
+            self.selection_datasource.metadata[self.metadata_name] = selection
             self.selection_changed = True
 
+    def _get_previous_selection(self):
+        """ Returns the union of the Selections of the previous selection
+        polygons.
+
+        The union is cached, and only the polygons added since it was computed
+        are tested when it is next needed.
+        """
+        index = self._get_point_index()
+        if self._previous_selection_cache is not None:
+            cache_index, polygons, selection = self._previous_selection_cache
+            if cache_index is not index or \
+                    len(self._previous_selections) < len(polygons) or \
+                    any(polygon is not previous for polygon, previous
+                        in zip(polygons, self._previous_selections)):
+                self._previous_selection_cache = None
+        if self._previous_selection_cache is None:
+            polygons = []
+            selection = Selection(len(index[0]))
+        for polygon in self._previous_selections[len(polygons):]:
+            selection |= self._select_polygon(polygon)
+            polygons.append(polygon)
+        self._previous_selection_cache = (index, polygons, selection)
+        return selection
+
+    def _select_polygon(self, polygon):
+        """ Returns the Selection of the data points inside *polygon*.
+
+        Only the points inside the bounding box of the polygon, which are
+        found with the point index, are tested against the polygon itself.
+        """
+        data, order, sorted_x = self._get_point_index()
+        if len(polygon) == 0:
+            return Selection(len(data))
+        (xmin, ymin), (xmax, ymax) = polygon.min(axis=0), polygon.max(axis=0)
+        candidates = order[searchsorted(sorted_x, xmin, side="left"):
+                           searchsorted(sorted_x, xmax, side="right")]
+        y = data[candidates, 1]
+        candidates = candidates[(y >= ymin) & (y <= ymax)]
+        inside = points_in_polygon(data[candidates], polygon,
+                                   False).astype(bool, copy=False)
+        return Selection(len(data), indices=candidates[inside])
+
+    def _get_point_index(self):
+        """ Returns the data points, with the order that sorts them by x and
+        their sorted x values.
+
+        This index is cached for as long as the plot's data arrays are not
+        replaced or changed.
+        """
+        key = (self.plot.index.get_data(), self.plot.value.get_data())
+        if self._point_index is not None:
+            cached_key, index = self._point_index
+            if all(cached is current for cached, current
+                   in zip(cached_key, key)):
+                return index
+        self._watch_data_sources([self.plot.index, self.plot.value])
+        data = self._get_data()
+        order = argsort(data[:, 0], kind="mergesort")
+        index = (data, order, data[order, 0])
+        self._point_index = (key, index)
+        return index
+
     def _map_screen(self, points):
         """ Maps a point in data space to a point in screen space on the plot.
 
@@ -311,6 +377,24 @@ class LassoSelection(AbstractController):
         return transpose(array((self.plot.index.get_data(), self.plot.value.get_data())))
 
 
+    def _watch_data_sources(self, sources):
+        """ Listens to the changes of the data of *sources*, the data sources
+        that the point index is built from, instead of the previous ones.
+        """
+        for source in self._watched_sources:
+            source.on_trait_change(self._data_changed, "data_changed",
+                                   remove=True)
+        self._watched_sources = sources
+        for source in sources:
+            source.on_trait_change(self._data_changed, "data_changed")
+
+    def _data_changed(self):
+        """ Discards the point index and the Selection of the previous
+        selections, when the data changes in place.
+        """
+        self._point_index = None
+        self._previous_selection_cache = None
+
     #------------------------------------------------------------------------
     # Property getter/setters
     #------------------------------------------------------------------------
@@ -8,9 +8,10 @@ from traits.api import Any, Bool, Enum, Float, Str, Trait
 
 # Chaco imports
 from chaco.api import BaseXYPlot, Base2DPlot
+from move_throttle_mixin import MoveThrottleMixin
 
 
-class LineInspector(BaseTool):
+class LineInspector(MoveThrottleMixin, BaseTool):
     """ A simple tool to draw a line parallel to the index or the value axis of
     an X-Y plot.
 
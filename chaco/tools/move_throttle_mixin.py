@@ -0,0 +1,123 @@
+""" Defines the MoveThrottleMixin class.
+"""
+from time import time
+
+from traits.api import Any, Bool, Float, HasTraits, Undefined
+
+from chaco import interaction
+
+
+class MoveThrottleMixin(HasTraits):
+    """ A mix-in class for tools that throttles the mouse move events they
+    handle to the rate at which the plot can be redrawn.
+
+    When **throttle_moves** is True, mouse moves that arrive less than a frame
+    after the last handled one are not handled right away: the tool handles
+    only the latest of them, once the frame is over.  The frame lasts
+    1 / **max_frame_rate** seconds, or as long as the last draw of the top
+    component if **adapt_to_draw_time** is True and drawing takes longer, so
+    that moving the mouse over slow plots does not pile up stale updates.
+    Any other event first handles the pending move, so that the tool sees the
+    events in order.  The tool later handles a copy of a deferred move, at the
+    position it had in the tool's coordinates.  A deferred move is marked as
+    handled only if the tool has captured the mouse, e.g. while dragging, so
+    that the other tools still receive the moves that the tool defers.
+
+    This requires a GUI toolkit with timers; without one, all the moves are
+    handled right away.  The mix-in must come before the tool class in the
+    bases of a tool.
+    """
+
+    # Throttle the mouse moves?
+    throttle_moves = Bool(False)
+
+    # The maximum number of mouse moves handled per second.
+    max_frame_rate = Float(60.0)
+
+    # Handle the mouse moves at most as often as the top component can be
+    # drawn?
+    adapt_to_draw_time = Bool(True)
+
+    # A copy of the latest mouse move event that has not been handled yet.
+    _pending_move = Any
+
+    # The time at which the last mouse move was handled.
+    _last_move_time = Float(0.0)
+
+    # The timer that handles the pending move, if one is running.
+    _move_timer = Any
+
+    def dispatch(self, event, suffix):
+        """ Dispatches an event, deferring the mouse moves that come too soon
+        after the last one.
+
+        Overrides the dispatch() method of the tool.
+        """
+        if not self.throttle_moves:
+            super(MoveThrottleMixin, self).dispatch(event, suffix)
+            return
+
+        if suffix != "mouse_move":
+            self._flush_pending_move()
+            super(MoveThrottleMixin, self).dispatch(event, suffix)
+            return
+
+        wait = self._last_move_time + self._move_interval() - time()
+        if wait > 0:
+            if self._move_timer is None:
+                self._move_timer = interaction.call_after(
+                    wait, self._move_timer_fired)
+            if self._move_timer is not None:
+                self._pending_move = self._copy_event(event)
+                if getattr(event.window, "mouse_owner", None) is self:
+                    event.handled = True
+                return
+        self._pending_move = None
+        self._last_move_time = time()
+        super(MoveThrottleMixin, self).dispatch(event, "mouse_move")
+
+    #------------------------------------------------------------------------
+    # Private methods
+    #------------------------------------------------------------------------
+
+    def _move_interval(self):
+        """ Returns the minimum number of seconds between two handled moves.
+        """
+        interval = 1.0 / self.max_frame_rate if self.max_frame_rate > 0 \
+            else 0.0
+        if self.adapt_to_draw_time:
+            component = self.component
+            while getattr(component, "container", None) is not None:
+                component = component.container
+            interval = max(interval,
+                           getattr(component, "last_draw_time", 0.0))
+        return interval
+
+    def _copy_event(self, event):
+        """ Returns a copy of *event*, whose position and transform are those
+        it has now, once the containers that dispatched it have undone the
+        transforms they applied to it.
+        """
+        names = [name for name in event.copyable_trait_names()
+                 if name not in ("dispatch_history", "handled", "_pos_stack",
+                                 "_transform_stack")]
+        values = dict((name, value)
+                      for name, value in event.trait_get(names).items()
+                      if value is not Undefined)
+        copy = event.__class__(**values)
+        if len(event._transform_stack) > 0:
+            copy._transform_stack = [event.net_transform()]
+        return copy
+
+    def _flush_pending_move(self):
+        """ Handles the pending mouse move, if there is one.
+        """
+        event = self._pending_move
+        if event is not None:
+            self._pending_move = None
+            self._last_move_time = time()
+            super(MoveThrottleMixin, self).dispatch(event, "mouse_move")
+
+    def _move_timer_fired(self):
+        self._move_timer = None
+        self._flush_pending_move()
@@ -7,8 +7,12 @@ from numpy import inf
 from enable.api import BaseTool, Pointer, KeySpec
 from traits.api import Bool, Enum, Float, Tuple, Instance
 
+# Chaco imports
+from chaco.interaction import begin_interaction, end_interaction
+from move_throttle_mixin import MoveThrottleMixin
 
-class PanTool(BaseTool):
+
+class PanTool(MoveThrottleMixin, BaseTool):
     """ A tool that enables the user to pan a plot by clicking a mouse
     button and dragging.
     """
@@ -254,6 +258,7 @@ class PanTool(BaseTool):
                 self._auto_constrain = True
                 self.constrain_direction = None
         self.event_state = "panning"
+        begin_interaction(self)
         if capture_mouse:
             event.window.set_pointer(self.drag_pointer)
             event.window.set_mouse_owner(self, event.net_transform())
@@ -265,6 +270,7 @@ class PanTool(BaseTool):
             self.constrain = False
             self.constrain_direction = None
         self.event_state = "normal"
+        end_interaction(self)
         event.window.set_pointer("arrow")
         if event.window.mouse_owner == self:
             event.window.set_mouse_owner(None)
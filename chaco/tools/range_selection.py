@@ -10,9 +10,11 @@ from enable.api import KeySpec
 
 # Chaco imports
 from chaco.api import AbstractController
+from chaco.selection import Selection
+from move_throttle_mixin import MoveThrottleMixin
 
 
-class RangeSelection(AbstractController):
+class RangeSelection(MoveThrottleMixin, AbstractController):
     """ Selects a range along the index or value axis.
 
     The user right-click-drags to select a region, which stays selected until
@@ -42,7 +44,9 @@ class RangeSelection(AbstractController):
     selection_mode_metadata_name = Str("selection_mode")
 
     # The name of the metadata on the datasource that we will set to a numpy
-    # boolean array for masking the datasource's data
+    # boolean array for masking the datasource's data.  For sorted data
+    # sources, a chaco.selection.Selection is used instead, which can be used
+    # as a mask but is found by binary search.
     mask_metadata_name = Str("selection_masks")
 
     # The possible event states of this selection tool (overrides
@@ -136,7 +140,7 @@ class RangeSelection(AbstractController):
     _selection = Trait(None, None, Tuple, List, Array)
 
     # The selection in mask form.
-    _selection_mask = Array
+    _selection_mask = Any
 
     # The end of the selection that is being actively modified by the mouse.
     _drag_edge = Enum("high", "low")
@@ -610,7 +614,14 @@ class RangeSelection(AbstractController):
             if val is not None:
                 low, high = val
                 data_pts = datasource.get_data()
-                new_mask = (data_pts >= low) & (data_pts <= high)
+                sort_order = getattr(datasource, "sort_order", "none")
+                if sort_order in ("ascending", "descending"):
+                    # The selected points are contiguous, so find them by
+                    # binary search; the mask is only built if needed.
+                    new_mask = Selection.from_range(data_pts, low, high,
+                                                    sort_order)
+                else:
+                    new_mask = (data_pts >= low) & (data_pts <= high)
                 selection_masks.append(new_mask)
                 self._selection_mask = new_mask
             datasource.metadata_changed = {self.mask_metadata_name: val}
@@ -3,7 +3,6 @@
 from __future__ import with_statement
 
 # Major library imports
-from numpy import compress, polyfit
 from math import fabs
 
 # Enthought library imports
@@ -11,7 +10,8 @@ from enable.api import ColorTrait, LineStyle
 from traits.api import Any, Float, Instance
 
 # Chaco imports
-from chaco.api import LassoOverlay, Label
+from chaco.api import LassoOverlay, Label, SelectionStatistics
+from chaco.selection import as_selection
 from chaco.tools.api import LassoSelection
 
 
@@ -27,20 +27,27 @@ class RegressionLasso(LassoSelection):
     # The center point of the selected points, in data space.
     centroid = Any
 
+    # The running statistics of the selected points, which are updated
+    # incrementally as the selection changes.
+    statistics = Instance(SelectionStatistics)
+
     def _selection_changed_fired(self, event):
-        indices = self.selection_datasource.metadata["selection"]
-        if any(indices):
-            x = compress(indices, self.component.index.get_data())
-            y = compress(indices, self.component.value.get_data())
-            if len(x) < 2 or len(y) < 2:
-                self.fit_params = None
-                self.centroid = None
-            else:
-                self.fit_params = tuple(polyfit(x,y,1))
-                self.centroid = (sum(x)/len(x)), (sum(y)/len(y))
-        else:
-            self.fit_params = None
+        metadata = self.selection_datasource.metadata
+        index = self.component.index.get_data()
+        value = self.component.value.get_data()
+        selection = as_selection(metadata[self.metadata_name], len(index))
+        statistics = self.statistics
+        if statistics is None or statistics.x is not index or \
+                statistics.y is not value:
+            statistics = SelectionStatistics(index, value)
+        statistics.update(selection)
+        self.statistics = statistics
+
+        self.fit_params = statistics.fit()
+        if self.fit_params is None:
             self.centroid = None
+        else:
+            self.centroid = (statistics.mean_x, statistics.mean_y)
         return
 
 
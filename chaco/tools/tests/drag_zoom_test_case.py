@@ -0,0 +1,47 @@
+import unittest
+
+import numpy
+
+from chaco.api import create_line_plot
+from chaco.interaction import end_interaction, interacting
+from chaco.tools.api import DragZoom
+from enable.testing import EnableTestAssistant
+
+
+class DragZoomTestCase(EnableTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        values = numpy.arange(10.0)
+        self.plot = create_line_plot((values, values))
+        self.plot.bounds = [100, 100]
+        self.plot.do_layout()
+        self.tool = DragZoom(self.plot, drag_button="left")
+        self.plot.tools.append(self.tool)
+
+    def tearDown(self):
+        end_interaction(self.tool)
+
+    def start_drag(self):
+        window = self.create_mock_window()
+        self.mouse_down(self.tool, 50, 50, window=window)
+        for x in (60, 70):
+            # Moves with the left button down, which mouse_move() can't send.
+            event = self.create_mouse_event(x=x, y=x, window=window,
+                                            left_down=True)
+            self.tool.dispatch(event, "mouse_move")
+        self.assertTrue(interacting())
+        return window
+
+    def test_drag_end(self):
+        window = self.start_drag()
+        self.mouse_up(self.tool, 70, 70, window=window)
+        self.assertFalse(interacting())
+
+    def test_drag_cancelled_on_leave(self):
+        window = self.start_drag()
+        self.mouse_leave(self.tool, 120, 70, window=window)
+        self.assertFalse(interacting())
+
+
+if __name__ == '__main__':
+    unittest.main()
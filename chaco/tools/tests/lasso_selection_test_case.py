@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+from kiva.agg import points_in_polygon
+
+from chaco.array_plot_data import ArrayPlotData
+from chaco.plot import Plot
+from chaco.selection import Selection
+from chaco.tools.api import LassoSelection, RegressionLasso
+
+
+# Some versions of kiva only provide a deprecated points_in_polygon() in
+# kiva.agg, which does not return its result.
+HAS_POINTS_IN_POLYGON = points_in_polygon(
+    np.zeros((1, 2)), np.array([[-1.0, -1.0], [1.0, -1.0], [0.0, 1.0]]),
+    False) is not None
+
+
+@unittest.skipUnless(HAS_POINTS_IN_POLYGON, "kiva.agg.points_in_polygon "
+                     "does not return its result")
+class LassoSelectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        random = np.random.RandomState(0)
+        self.points = random.rand(1000, 2)
+        plot_data = ArrayPlotData(x=self.points[:, 0], y=self.points[:, 1])
+        plot = Plot(plot_data)
+        self.renderer = plot.plot(('x', 'y'), type='scatter')[0]
+        self.tool = LassoSelection(self.renderer,
+                                   selection_datasource=self.renderer.index)
+        self.renderer.index.metadata['selection'] = Selection(1000)
+
+        self.tested_polygons = []
+        select_polygon = self.tool._select_polygon
+
+        def counting_select_polygon(polygon):
+            self.tested_polygons.append(polygon)
+            return select_polygon(polygon)
+
+        self.tool._select_polygon = counting_select_polygon
+
+    def expected_mask(self, polygon):
+        return points_in_polygon(self.points, polygon, False).astype(bool)
+
+    def test_selection(self):
+        polygon1 = np.array([[0.1, 0.1], [0.4, 0.1], [0.2, 0.5]])
+        polygon2 = np.array([[0.5, 0.5], [0.9, 0.6], [0.6, 0.9]])
+        self.tool._previous_selections = [polygon1]
+        self.tool._active_selection = polygon2
+        self.tool._update_selection()
+
+        selection = self.renderer.index.metadata['selection']
+        expected = self.expected_mask(polygon1) | self.expected_mask(polygon2)
+        self.assertIsInstance(selection, Selection)
+        np.testing.assert_array_equal(selection.to_mask(), expected)
+
+        self.tool.selection_mode = 'exclude'
+        self.tool._update_selection()
+        selection = self.renderer.index.metadata['selection']
+        np.testing.assert_array_equal(selection.to_mask(), ~expected)
+
+    def test_previous_selections_cached(self):
+        polygon1 = np.array([[0.1, 0.1], [0.4, 0.1], [0.2, 0.5]])
+        self.tool._previous_selections = [polygon1]
+        self.tool._active_selection = np.array([[0.5, 0.5], [0.9, 0.6],
+                                                [0.6, 0.9]])
+        self.tool._update_selection()
+        self.assertEqual(len(self.tested_polygons), 2)
+
+        # Only the active polygon is tested as it grows.
+        self.tool._active_selection = np.vstack(
+            (self.tool._active_selection, [[0.5, 0.8]]))
+        self.tool._update_selection()
+        self.assertEqual(len(self.tested_polygons), 3)
+
+        # A new dataset invalidates the cache.
+        self.renderer.index.set_data(self.points[::-1, 0].copy())
+        self.renderer.value.set_data(self.points[::-1, 1].copy())
+        self.points = self.points[::-1]
+        self.tool._update_selection()
+        self.assertEqual(len(self.tested_polygons), 5)
+        expected = (self.expected_mask(polygon1) |
+                    self.expected_mask(self.tool._active_selection))
+        np.testing.assert_array_equal(
+            self.renderer.index.metadata['selection'].to_mask(), expected)
+
+    def test_data_changed_in_place(self):
+        polygon1 = np.array([[0.1, 0.1], [0.4, 0.1], [0.2, 0.5]])
+        self.tool._previous_selections = [polygon1]
+        self.tool._active_selection = np.array([[0.5, 0.5], [0.9, 0.6],
+                                                [0.6, 0.9]])
+        self.tool._update_selection()
+
+        # Both the point index and the previous selections are recomputed.
+        x = self.renderer.index.get_data()
+        x[:] = 1.0 - x
+        self.points[:, 0] = x
+        self.renderer.index.data_changed = True
+        self.tool._update_selection()
+        self.assertEqual(len(self.tested_polygons), 4)
+        expected = (self.expected_mask(polygon1) |
+                    self.expected_mask(self.tool._active_selection))
+        np.testing.assert_array_equal(
+            self.renderer.index.metadata['selection'].to_mask(), expected)
+
+
+class RegressionLassoTestCase(unittest.TestCase):
+
+    def test_fit_params(self):
+        x = np.arange(100.0)
+        plot_data = ArrayPlotData(x=x, y=2.0 * x + 1.0)
+        plot = Plot(plot_data)
+        renderer = plot.plot(('x', 'y'), type='scatter')[0]
+        tool = RegressionLasso(renderer, selection_datasource=renderer.index)
+
+        metadata = renderer.index.metadata
+        for stop in [1, 30, 60, 10]:
+            metadata['selection'] = Selection(100, [(0, stop)])
+            tool.selection_changed = True
+            if stop == 1:
+                self.assertIsNone(tool.fit_params)
+                self.assertIsNone(tool.centroid)
+            else:
+                np.testing.assert_allclose(tool.fit_params, [2.0, 1.0])
+                np.testing.assert_allclose(tool.centroid,
+                                           [(stop - 1) / 2.0, stop])
+        self.assertEqual(tool.statistics.n, 10)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.run()
@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from chaco import interaction
+from chaco.api import ArrayPlotData, OverlayPlotContainer, Plot
+from chaco.tools.line_inspector import LineInspector
+from enable.api import BaseTool
+from enable.testing import EnableTestAssistant
+
+
+class MoveThrottleMixinTestCase(EnableTestAssistant, unittest.TestCase):
+
+    def setUp(self):
+        plot_data = ArrayPlotData(x=np.arange(10.0), y=np.arange(10.0))
+        self.plot = Plot(plot_data, padding=20, position=[50, 30],
+                         bounds=[200, 200], resizable="")
+        self.line = self.plot.plot(('x', 'y'))[0]
+        self.container = OverlayPlotContainer(bounds=[400, 400])
+        self.container.add(self.plot)
+        self.container.do_layout(force=True)
+        # A plot that takes a second to draw.
+        self.container.last_draw_time = 1.0
+
+        self.timers = []
+        self.old_call_after = interaction.call_after
+        interaction.call_after = \
+            lambda delay, callback: self.timers.append(callback) or callback
+
+    def tearDown(self):
+        interaction.call_after = self.old_call_after
+
+    def test_offset_container(self):
+        inspector = LineInspector(self.line, throttle_moves=True)
+        self.line.tools.append(inspector)
+        # A tool of the container, which sees the events that its components
+        # do not handle.
+        container_tool = BaseTool(self.container)
+        moves = []
+        container_tool.normal_mouse_move = lambda event: moves.append(event)
+        self.container.tools.append(container_tool)
+
+        self.mouse_move(self.container, 100.0, 100.0)
+        expected = inspector._last_position
+        self.mouse_move(self.container, 150.0, 120.0)
+        self.mouse_move(self.container, 100.0, 100.0)
+        self.assertEqual(inspector._last_position, expected)
+        self.assertEqual(len(self.timers), 1)
+        # The deferred moves are not swallowed.
+        self.assertEqual(len(moves), 3)
+
+        # The deferred move is handled at the position it had in the plot.
+        inspector._last_position = None
+        self.timers.pop()()
+        self.assertEqual(inspector._last_position, expected)
+        self.assertEqual(expected, (100.0 - 50.0, 100.0 - 30.0))
+
+    def test_other_tools_receive_moves(self):
+        inspector = LineInspector(self.line, throttle_moves=True)
+        other_tool = BaseTool(self.line)
+        moves = []
+        other_tool.normal_mouse_move = lambda event: moves.append(event)
+        # Inspectors are usually overlays, which receive the events before
+        # the tools of the component.
+        self.line.overlays.append(inspector)
+        self.line.tools.append(other_tool)
+
+        for x in (100.0, 110.0, 120.0):
+            self.mouse_move(self.container, x, 100.0)
+        self.assertEqual(len(self.timers), 1)
+        self.assertEqual(len(moves), 3)
+
+    def test_captured_moves_handled(self):
+        inspector = LineInspector(self.line, throttle_moves=True)
+        self.line.tools.append(inspector)
+        window = self.create_mock_window()
+        window.mouse_owner = inspector
+
+        self.mouse_move(inspector, 100.0, 100.0, window=window)
+        event = self.mouse_move(inspector, 110.0, 100.0, window=window)
+        # The tool that captured the mouse swallows the moves it defers.
+        self.assertIsNotNone(inspector._pending_move)
+        self.assertTrue(event.handled)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.run()
@@ -2,7 +2,9 @@ import unittest
 
 import numpy as np
 
+from chaco import interaction
 from chaco.array_plot_data import ArrayPlotData
+from chaco.interaction import interacting
 from chaco.plot import Plot
 from chaco.tools.pan_tool import PanTool
 from enable.testing import EnableTestAssistant
@@ -34,6 +36,56 @@ class PanToolTestCase(EnableTestAssistant, unittest.TestCase):
         self.assertEqual((x_range.low, x_range.high), x_bounds)
         self.assertEqual((y_range.low, y_range.high), y_bounds)
 
+    def test_interaction_signal(self):
+        plot_data = ArrayPlotData(x=np.arange(4.0), y=np.arange(4.0))
+        plot = Plot(plot_data)
+        plot.plot(('x', 'y'))
+        tool = PanTool(plot)
+        plot.tools.append(tool)
+
+        self.mouse_down(tool, 0.0, 0.0)
+        self.assertTrue(interacting())
+        self.mouse_move(interactor=tool, x=1.0, y=1.0)
+        self.assertTrue(interacting())
+        self.mouse_up(interactor=tool, x=1.0, y=1.0)
+        self.assertFalse(interacting())
+
+    def test_throttle_moves(self):
+        plot_data = ArrayPlotData(x=np.arange(10.0), y=np.arange(10.0))
+        plot = Plot(plot_data)
+        plot.plot(('x', 'y'))
+        plot.outer_bounds = [100, 100]
+        plot.do_layout()
+        # A plot that takes a second to draw.
+        plot.last_draw_time = 1.0
+        tool = PanTool(plot, throttle_moves=True)
+        plot.tools.append(tool)
+        x_range = plot.x_mapper.range
+
+        timers = []
+        old_call_after = interaction.call_after
+        interaction.call_after = \
+            lambda delay, callback: timers.append(callback) or callback
+        try:
+            self.mouse_down(tool, 10.0, 10.0)
+            self.mouse_move(interactor=tool, x=11.0, y=10.0)
+            low = x_range.low
+            # The following moves are coalesced into the last one.
+            for x in range(12, 20):
+                self.mouse_move(interactor=tool, x=float(x), y=10.0)
+            self.assertEqual(x_range.low, low)
+            self.assertEqual(len(timers), 1)
+            timers.pop()()
+            self.assertTrue(x_range.low < low)
+
+            # A pending move is handled before the mouse up.
+            low = x_range.low
+            self.mouse_move(interactor=tool, x=30.0, y=10.0)
+            self.assertEqual(x_range.low, low)
+            self.mouse_up(interactor=tool, x=30.0, y=10.0)
+            self.assertTrue(x_range.low < low)
+        finally:
+            interaction.call_after = old_call_after
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ import numpy as np
 
 from chaco.array_plot_data import ArrayPlotData
 from chaco.plot import Plot
+from chaco.selection import Selection
 from chaco.tools.range_selection import RangeSelection
 from enable.testing import EnableTestAssistant
 
@@ -51,6 +52,31 @@ class RangeSelectionTestCase(EnableTestAssistant, unittest.TestCase):
                         self.assertTrue(selection[0] <= selection[1])
                         self.mouse_up(tool, x=x, y=y)
 
+    def test_selection_masks(self):
+        plot_data = ArrayPlotData(x=np.arange(10.0), y=np.arange(10.0))
+        plot = Plot(plot_data)
+        renderer = plot.plot(('x', 'y'))[0]
+        tool = RangeSelection(renderer)
+
+        tool.selection = (2.0, 5.0)
+        masks = renderer.index.metadata['selection_masks']
+        self.assertEqual(len(masks), 1)
+        self.assertIsInstance(masks[0], np.ndarray)
+        np.testing.assert_array_equal(np.nonzero(masks[0])[0], [2, 3, 4, 5])
+
+        # Sorted data is selected by binary search.
+        renderer.index.sort_order = 'ascending'
+        tool.selection = (2.5, 7.0)
+        masks = renderer.index.metadata['selection_masks']
+        self.assertEqual(len(masks), 1)
+        self.assertIsInstance(masks[0], Selection)
+        self.assertEqual(masks[0].intervals.tolist(), [[3, 8]])
+        np.testing.assert_array_equal(np.nonzero(masks[0])[0],
+                                      [3, 4, 5, 6, 7])
+
+        tool.deselect()
+        self.assertEqual(renderer.index.metadata['selection_masks'], [])
+
 
 if __name__ == '__main__':
     import nose
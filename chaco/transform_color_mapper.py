@@ -112,14 +112,14 @@ class TransformColorMapper(ColorMapper):
     # ColorMapper interface (these override methods from ColorMapper)
     #-------------------------------------------------------------------
 
-    def map_screen(self, data_array):
+    def map_screen(self, data_array, out=None):
         """ Maps an array of data values to an array of colors.
         """
 
         norm_data = self._compute_normalized_data(data_array)
         # The data are normalized, so we can pass low = 0, high = 1
         rgba = map_colors(norm_data, self.steps, 0, 1, self._red_lut,
-                self._green_lut, self._blue_lut, self._alpha_lut)
+                self._green_lut, self._blue_lut, self._alpha_lut, out=out)
         return rgba
 
 
@@ -130,13 +130,13 @@ class TransformColorMapper(ColorMapper):
         indices = (norm_data * (self.steps-1)).astype(int)
         return indices
 
-    def map_uint8(self, data_array):
+    def map_uint8(self, data_array, out=None):
         """ Maps an array of data values to an array of colors.
         """
         norm_data = self._compute_normalized_data(data_array)
         rgba = map_colors_uint8(norm_data, self.steps, 0.0, 1.0,
                 self._red_lut_uint8, self._green_lut_uint8,
-                self._blue_lut_uint8, self._alpha_lut_uint8)
+                self._blue_lut_uint8, self._alpha_lut_uint8, out=out)
 
         return rgba
 
@@ -190,6 +190,7 @@ if __name__ == "__main__":
         package_data={
             'chaco': ['tools/toolbars/images/*.png',
                       'layers/data/*.svg',
+                      'data/*.npz',
                       'tests/data/PngSuite/*.png']
         },
         description = 'interactive 2-dimensional plotting',